@@ -1,21 +1,53 @@
+import asyncio
 import os
+import threading
 
-import google.generativeai.client as genai
 from dotenv import load_dotenv
 from google.genai import Client
-from google.genai.types import Content, GenerateContentConfig, Part
-from google.generativeai.generative_models import GenerativeModel
+from google.genai.types import (
+    Content,
+    GenerateContentConfig,
+    GenerateContentResponseUsageMetadata,
+    Part,
+)
 
-from ai.llm_response import LlmResponse
+from ai.llm_cache import LlmCache
+from ai.llm_response import LlmResponse, LlmResponseStream
 from ai.prompt import Prompt
+from ai.rate_limiter import LlmRateLimiter
+from ai.token_estimator import TokenEstimator
 from constants import *
 from settings import DEBUG_MODE, GEMINI_MODEL, MAX_OUTPUT_TOKENS
 from utils.logger import logger
 
 
 class Llm:
+    """
+    Gemini client shared by the whole process, so its connections are reused
+    and the environment is only loaded once
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._instance_lock:
+            if not cls._instance:
+                cls._instance = super(Llm, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
     def __init__(self):
         """Initialize the Llm instance."""
+        if self._initialized:
+            return
+
+        with __class__._instance_lock:
+            # Another thread may have initialized it while this one waited
+            if not self._initialized:
+                self._initialize()
+
+    def _initialize(self) -> None:
         load_dotenv()
         self._api_key = os.getenv("API_KEY")
         if DEBUG_MODE:
@@ -36,15 +68,18 @@ class Llm:
         )
 
         self.model = GEMINI_MODEL
+        self._initialized = True
 
     def prompt(
         self,
         prompt: Prompt,
+        use_cache: bool = True,
     ) -> LlmResponse:
         """Generate a response from the LLM model using the provided prompt text.
 
         Args:
-            prompt_text: The text prompt to send to the model
+            prompt: The prompt to send to the model
+            use_cache: Whether a cached response of the same prompt can be returned
 
         Returns:
             The generated response text from the model
@@ -52,6 +87,14 @@ class Llm:
         Raises:
             Exception: If an empty response is received from the model
         """
+        cache_key = self._cache_key(prompt)
+        cached_text = LlmCache.get(cache_key) if use_cache else None
+        if cached_text is not None:
+            cached_response = __class__._parse_cached(cache_key, cached_text)
+            if cached_response is not None:
+                logger.info("Using the cached response of the prompt")
+                return cached_response
+
         contents = [
             Content(
                 role="user",
@@ -60,26 +103,164 @@ class Llm:
                 ],
             ),
         ]
-        genai.configure(api_key=self._api_key)
-        model = GenerativeModel(
-            f"models/{GEMINI_MODEL}",
+        tokens = TokenEstimator.estimate(prompt.text)
+        logger.info(f"Estimated prompt tokens: {tokens}")
+
+        def generate() -> tuple[
+            LlmResponseStream, GenerateContentResponseUsageMetadata | None
+        ]:
+            response = self.client.models.generate_content_stream(
+                model=str(self.model),  # Specifies which Gemini model to use
+                contents=contents[0],  # Provides the prompt content to generate from
+                config=self.generate_content_config,
+            )
+
+            stream = LlmResponseStream()
+            usage_metadata = None
+            for chunk in response:
+                # The totals come with the last chunk
+                usage_metadata = chunk.usage_metadata or usage_metadata
+                if chunk.text and stream.feed(chunk.text):
+                    # The code block is all the callers read, stop generating.
+                    # The stream is typed as an Iterator, but is a generator
+                    close = getattr(response, "close", None)
+                    if close is not None:
+                        close()
+                    break
+            return stream, usage_metadata
+
+        stream, usage_metadata = LlmRateLimiter.call(generate, tokens)
+        response_text = stream.text
+        # The last chunk of a closed stream and its totals were never read
+        __class__._record_usage(
+            prompt,
+            tokens,
+            usage_metadata,
+            estimated_response=response_text if stream.is_done else None,
         )
-        logger.info("Total tokens: %d", model.count_tokens(prompt.text).total_tokens)
 
-        response = self.client.models.generate_content_stream(
-            model=str(self.model),  # Specifies which Gemini model to use
-            contents=contents[0],  # Provides the prompt content to generate from
-            config=self.generate_content_config,
+        if len(response_text) == 0:
+            raise Exception("Empty response received from the model")
+
+        llm_response = LlmResponse(response_text, stream.block)
+        LlmCache.set(cache_key, response_text)
+        return llm_response
+
+    async def aprompt(
+        self,
+        prompt: Prompt,
+        use_cache: bool = True,
+    ) -> LlmResponse:
+        """Generate a response with the async Gemini client, used by the asyncio
+        scrape engine so many prompts can wait on the network concurrently.
+
+        Args:
+            prompt: The prompt to send to the model
+            use_cache: Whether a cached response of the same prompt can be returned
+
+        Returns:
+            The generated response from the model
+
+        Raises:
+            Exception: If an empty response is received from the model
+        """
+        cache_key = self._cache_key(prompt)
+        cached_text = (
+            await asyncio.to_thread(LlmCache.get, cache_key) if use_cache else None
         )
+        if cached_text is not None:
+            cached_response = __class__._parse_cached(cache_key, cached_text)
+            if cached_response is not None:
+                return cached_response
 
-        response_text: str = ""
-        for chunk in response:
-            response_text += chunk.text if chunk.text else ""
+        tokens = TokenEstimator.estimate(prompt.text)
+        response = await LlmRateLimiter.acall(
+            lambda: self.client.aio.models.generate_content(
+                model=str(self.model),
+                contents=Content(
+                    role="user",
+                    parts=[
+                        Part.from_text(text=prompt.text),
+                    ],
+                ),
+                config=self.generate_content_config,
+            ),
+            tokens,
+        )
+        __class__._record_usage(prompt, tokens, response.usage_metadata)
 
+        response_text: str = response.text or ""
         if len(response_text) == 0:
             raise Exception("Empty response received from the model")
 
-        return LlmResponse(response_text)
+        llm_response = LlmResponse(response_text)
+        await asyncio.to_thread(LlmCache.set, cache_key, response_text)
+        return llm_response
+
+    def evict(self, prompt: Prompt) -> None:
+        """Drop the cached response of a prompt once its caller found it invalid,
+        so retrying the prompt asks the model again.
+
+        Args:
+            prompt: The prompt the response was generated for
+        """
+        LlmCache.delete(self._cache_key(prompt))
+
+    @staticmethod
+    def _parse_cached(cache_key: str, text: str) -> LlmResponse | None:
+        try:
+            return LlmResponse(text)
+        except Exception as e:
+            logger.warning(f"Dropping a cached response that can't be parsed: {str(e)}")
+            LlmCache.delete(cache_key)
+            return None
+
+    @staticmethod
+    def _record_usage(
+        prompt: Prompt,
+        estimated_tokens: int,
+        usage_metadata: GenerateContentResponseUsageMetadata | None,
+        estimated_response: str | None = None,
+    ) -> None:
+        """Calibrate the token estimate and charge the rate limiter with the
+        tokens a generation used.
+
+        Args:
+            prompt: The prompt sent
+            estimated_tokens: Estimate of the prompt tokens the call was let through with
+            usage_metadata: Last usage metadata read from the response
+            estimated_response: Text received from a stream closed before its
+                totals came, the response tokens are estimated from it
+        """
+        prompt_tokens = usage_metadata.prompt_token_count if usage_metadata else None
+        if estimated_response is not None:
+            # Chunks may carry the response tokens so far, never less than received
+            response_tokens = max(
+                TokenEstimator.estimate(estimated_response),
+                (usage_metadata.candidates_token_count if usage_metadata else None) or 0,
+            )
+            used_tokens = (prompt_tokens or estimated_tokens) + response_tokens
+        elif usage_metadata is not None:
+            response_tokens = usage_metadata.candidates_token_count
+            used_tokens = usage_metadata.total_token_count
+        else:
+            return
+
+        TokenEstimator.record(prompt.text, prompt_tokens)
+        LlmRateLimiter.record_usage(estimated_tokens, used_tokens)
+        logger.info(
+            f"Tokens used: {prompt_tokens or estimated_tokens} prompt, "
+            f"{response_tokens} response"
+            + (" (estimated, the stream was closed early)" if estimated_response else "")
+        )
+
+    def _cache_key(self, prompt: Prompt) -> str:
+        return LlmCache.key(
+            prompt.template_path,
+            prompt.text,
+            str(self.model),
+            self.generate_content_config.model_dump(mode="json", exclude_none=True),
+        )
 
 
 class RetryLimitExceeded(Exception):
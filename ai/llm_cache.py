@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from settings import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_S,
+)
+from utils.logger import logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    createdAt REAL NOT NULL,
+    lastUsedAt REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (lastUsedAt);
+"""
+
+
+class LlmCache:
+    """
+    Process-wide SQLite store of the LLM responses, keyed by everything that
+    determines the response: the model, the generation config, the template
+    and the final prompt text. Entries expire after LLM_CACHE_TTL_S and the
+    least recently used ones are evicted above LLM_CACHE_MAX_ENTRIES.
+    """
+
+    _connection: sqlite3.Connection | None = None
+    _hits = 0
+    _misses = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def key(template_path: str, prompt_text: str, model: str, config: dict) -> str:
+        """Hash the inputs of a generation.
+
+        Args:
+            template_path: Path of the prompt template
+            prompt_text: Template filled with the cleaned content
+            model: Model name
+            config: Generation config, as a JSON serializable dict
+
+        Returns:
+            str: SHA-256 hex digest of the inputs
+        """
+        payload = json.dumps(
+            [template_path, prompt_text, model, config],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def get(key: str) -> str | None:
+        """Get a cached response, None if missing, expired or caching is off."""
+        if not LLM_CACHE_ENABLED:
+            return None
+
+        now = time.time()
+        with __class__._lock:
+            connection = __class__._connect()
+            row = connection.execute(
+                "SELECT text, createdAt FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > LLM_CACHE_TTL_S:
+                __class__._misses += 1
+                return None
+
+            connection.execute(
+                "UPDATE responses SET lastUsedAt = ? WHERE key = ?", (now, key)
+            )
+            connection.commit()
+            __class__._hits += 1
+            return row[0]
+
+    @staticmethod
+    def set(key: str, text: str) -> None:
+        if not LLM_CACHE_ENABLED:
+            return
+
+        now = time.time()
+        with __class__._lock:
+            connection = __class__._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, text, now, now),
+            )
+            connection.execute(
+                "DELETE FROM responses WHERE createdAt < ?", (now - LLM_CACHE_TTL_S,)
+            )
+            connection.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM responses ORDER BY lastUsedAt DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (LLM_CACHE_MAX_ENTRIES,),
+            )
+            connection.commit()
+
+    @staticmethod
+    def delete(key: str) -> None:
+        """Drop a response its caller found invalid, so the next call regenerates it."""
+        if not LLM_CACHE_ENABLED:
+            return
+
+        with __class__._lock:
+            connection = __class__._connect()
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            connection.commit()
+
+    @staticmethod
+    def report() -> None:
+        """Log the hits and misses since the last report, and start counting again."""
+        with __class__._lock:
+            hits, misses = __class__._hits, __class__._misses
+            __class__._hits = __class__._misses = 0
+        if hits or misses:
+            logger.info(
+                f"LLM cache: {hits} hits, {misses} misses "
+                f"({hits / (hits + misses):.0%} of the calls avoided)"
+            )
+
+    @staticmethod
+    def _connect() -> sqlite3.Connection:
+        # Called with the lock held, the connection is shared by every thread
+        if __class__._connection is None:
+            os.makedirs(os.path.dirname(LLM_CACHE_PATH) or ".", exist_ok=True)
+            __class__._connection = sqlite3.connect(
+                LLM_CACHE_PATH, check_same_thread=False
+            )
+            __class__._connection.executescript(_SCHEMA)
+        return __class__._connection
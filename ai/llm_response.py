@@ -1,49 +1,137 @@
+import ast
+import json
 import re
 
 from utils.logger import logger
 
+# Opening of a code block the responses are parsed from
+_OPENING_FENCE = re.compile(r"```(html|python|json)\n")
+_CLOSING_FENCE = "```"
+
+# Longest text an opening fence can span, kept from a chunk to the next
+_OPENING_FENCE_MAX_LENGTH = len("```python\n")
+
+# Block returned when a response has several, the first of each language counts
+LANGUAGE_PREFERENCE = ("html", "python", "json")
+
+
+class LlmResponseStream:
+    """Find the code blocks of a response as its chunks arrive, so the rest of
+    the stream doesn't need to be read once an html block, which no later
+    block can outrank, is complete.
+
+    Chunks are kept in a list and joined once, only the end of the previous
+    chunks is searched again in case a fence spans two chunks.
+    """
+
+    def __init__(self) -> None:
+        self.chunks: list[str] = []
+        self.blocks: dict[str, str] = {}  # First complete block of each language
+        self.is_done = False
+        self._language: str | None = None  # Of the block being read
+        self._block_parts: list[str] = []
+        self._tail = ""  # End of the previous chunks, not searched yet
+
+    def feed(self, chunk: str) -> bool:
+        """Add the next chunk of the response.
+
+        Args:
+            chunk: Text of the chunk
+
+        Returns:
+            bool: True once a block of the preferred language is complete
+        """
+        self.chunks.append(chunk)
+        if self.is_done:
+            return True
+
+        text = self._tail + chunk
+        self._tail = ""
+        while True:
+            if self._language is None:
+                match = _OPENING_FENCE.search(text)
+                if match is None:
+                    self._tail = text[-(_OPENING_FENCE_MAX_LENGTH - 1) :]
+                    return False
+                self._language = match.group(1)
+                text = text[match.end() :]
+
+            end = text.find(_CLOSING_FENCE)
+            if end == -1:
+                # A closing fence may start at the end of the chunk
+                keep = len(_CLOSING_FENCE) - 1
+                self._block_parts.append(text[:-keep])
+                self._tail = text[-keep:]
+                return False
+
+            self._block_parts.append(text[:end])
+            self.blocks.setdefault(self._language, "".join(self._block_parts))
+            language, self._language = self._language, None
+            self._block_parts = []
+            text = text[end + len(_CLOSING_FENCE) :]
+
+            if language == LANGUAGE_PREFERENCE[0]:
+                self.is_done = True
+                return True
+
+    @property
+    def text(self) -> str:
+        return "".join(self.chunks)
+
+    @property
+    def block(self) -> tuple[str, str] | None:
+        """The language and content of the preferred complete block, if any."""
+        for language in LANGUAGE_PREFERENCE:
+            if language in self.blocks:
+                return language, self.blocks[language]
+        return None
+
+    @staticmethod
+    def find_block(text: str) -> tuple[str, str] | None:
+        """Find the preferred complete code block of a whole response.
+
+        Returns:
+            tuple[str, str] | None: The language and content of the block
+        """
+        stream = LlmResponseStream()
+        stream.feed(text)
+        return stream.block
+
 
 class LlmResponse:
-    def __init__(self, text: str) -> None:
+    def __init__(self, text: str, block: tuple[str, str] | None = None) -> None:
         """Initialize an LlmResponse instance with text and optional code.
 
         Args:
             text: The text response from the LLM
-            code: Optional dictionary containing any code blocks from the response
+            block: Language and content of its preferred code block when already
+                found while streaming, searched in the text otherwise
         """
         self.text = text
+        self.block = block if block is not None else LlmResponseStream.find_block(text)
         self.code = self.get_code()
 
     def get_code(self) -> object:
-        """Extract Python code blocks from the LLM response text.
+        """Parse the first HTML code block of the response, or else its first
+        Python or JSON one.
 
         Returns:
-            dict: A dictionary containing extracted code blocks with their language as keys
+            object: The HTML of an html block, the value of a Python literal or
+                JSON block, {} if the response has no code block
         """
-        # Pattern to match Python code blocks
-        # Check for both Python and JSON code blocks
-        # Check for HTML content first
-        html_pattern = r"```html\n(.*?)```"
-        html_match = re.search(html_pattern, self.text, re.DOTALL)
-        
-        if html_match is not None:
-            return html_match.group(1)
-        # If no HTML, check for other code blocks
-        patterns = [r"```python\n(.*?)```", r"```json\n(.*?)```"]
-        matches = []
-        for pattern in patterns:
-            matches.extend(re.findall(pattern, self.text, re.DOTALL))
-        logger.info(f"Code: {matches}")
-
-        if not matches or len(matches) == 0:
+        if self.block is None:
+            logger.info("No code block in the LLM response")
             return {}
 
-        code_str = matches[0]
+        language, code_str = self.block
+        if language == "html":
+            return code_str
+        logger.info(f"Code: {code_str}")
+
         try:
-            code = eval(code_str)
-        except Exception as _:  # JSON code
-            import json
             code = json.loads(code_str)
+        except ValueError:  # Python literal, e.g. with True or None
+            code = ast.literal_eval(code_str)
 
         if code:
             return code
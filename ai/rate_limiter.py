@@ -0,0 +1,268 @@
+import asyncio
+import random
+import re
+import threading
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from settings import (
+    LLM_BURST_FRACTION,
+    LLM_MAX_BACKOFF_S,
+    LLM_MAX_RETRIES,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE,
+    MAX_DELAY_S,
+    MAX_WORKERS,
+    MIN_DELAY_S,
+)
+from utils.logger import logger
+
+T = TypeVar("T")
+
+# Delay suggested by a Gemini quota error, e.g. 'retryDelay': '27s'
+_RETRY_DELAY_PATTERN = re.compile(r"retryDelay['\"]?\s*:\s*['\"]?(\d+(?:\.\d+)?)s")
+
+# Longest sleep while waiting for a concurrency slot, freed slots wake up the
+# threads but not the coroutines
+_SLOT_POLL_S = 0.05
+
+
+class TokenBucket:
+    """
+    Bucket refilled at a constant rate up to a burst capacity, a fraction of
+    the quota. The capacity is left out of the refill rate, so no window of
+    the quota ever holds more than the quota, even right after it reset.
+    """
+
+    def __init__(
+        self,
+        quota: float,
+        window_s: float = 60,
+        burst_fraction: float = LLM_BURST_FRACTION,
+    ) -> None:
+        """
+        :param quota: Units allowed per window
+        :param window_s: Window of the quota, in seconds
+        :param burst_fraction: Part of the quota that can be spent at once
+        """
+        self.capacity = quota * burst_fraction
+        self.level = self.capacity
+        self.rate_per_s = (quota - self.capacity) / window_s
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(
+            self.capacity, self.level + (now - self.updated_at) * self.rate_per_s
+        )
+        self.updated_at = now
+
+    def wait_s(self, amount: float) -> float:
+        """Seconds until the bucket holds an amount, capped at its capacity."""
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate_per_s)
+
+
+class RateLimitError(Exception):
+    """The model kept answering with quota errors after LLM_MAX_RETRIES retries."""
+
+
+class LlmRateLimiter:
+    """
+    Process-wide limiter of the Gemini calls of every thread and coroutine:
+    token buckets keep the requests and tokens per minute under the quota,
+    and the number of calls in flight follows AIMD, growing by one per
+    window of successful calls and halving on each quota error, between 1
+    and MAX_WORKERS. Quota errors are retried after the delay they suggest.
+    """
+
+    _requests = TokenBucket(LLM_REQUESTS_PER_MINUTE)
+    _tokens = TokenBucket(LLM_TOKENS_PER_MINUTE)
+    _concurrency_limit: float = MAX_WORKERS
+    _in_flight = 0
+    _blocked_until = 0.0  # Set by the retry delay of a quota error
+    _condition = threading.Condition()
+
+    # Metrics since the last report
+    _calls = 0
+    _rate_limited = 0
+    _wait_total_s = 0.0
+    _wait_max_s = 0.0
+
+    @staticmethod
+    def call(generate: Callable[[], T], tokens: int) -> T:
+        """Run a model call within the limits, retrying it on quota errors.
+
+        Args:
+            generate: Sends the request and reads the whole response
+            tokens: Estimated tokens of the request
+
+        Returns:
+            T: What generate returned
+        """
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            __class__._acquire(tokens)
+            try:
+                result = generate()
+            except Exception as e:
+                if not __class__.is_rate_limit_error(e):
+                    __class__._release(success=False)
+                    raise
+                __class__._on_rate_limited(e, attempt)
+                continue
+            __class__._release(success=True)
+            return result
+
+        raise RateLimitError(f"Still rate limited after {LLM_MAX_RETRIES} retries")
+
+    @staticmethod
+    async def acall(generate: Callable[[], Awaitable[T]], tokens: int) -> T:
+        """Async counterpart of call, for the asyncio scrape engine."""
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            await __class__._aacquire(tokens)
+            try:
+                result = await generate()
+            except Exception as e:
+                if not __class__.is_rate_limit_error(e):
+                    __class__._release(success=False)
+                    raise
+                __class__._on_rate_limited(e, attempt)
+                continue
+            __class__._release(success=True)
+            return result
+
+        raise RateLimitError(f"Still rate limited after {LLM_MAX_RETRIES} retries")
+
+    @staticmethod
+    def record_usage(estimated_tokens: int, used_tokens: int | None) -> None:
+        """Charge the tokens bucket with the difference between the estimate
+        the call was let through with and the tokens it really used."""
+        if used_tokens is None:
+            return
+        with __class__._condition:
+            __class__._tokens.level -= used_tokens - estimated_tokens
+
+    @staticmethod
+    def is_rate_limit_error(error: Exception) -> bool:
+        return getattr(error, "code", None) == 429 or "RESOURCE_EXHAUSTED" in str(error)
+
+    @staticmethod
+    def retry_after_s(error: Exception) -> float | None:
+        """Get the delay suggested by a quota error.
+
+        Args:
+            error: The quota error
+
+        Returns:
+            float | None: Seconds from the Retry-After header or the RetryInfo
+                details, None if the error suggests none
+        """
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+        match = _RETRY_DELAY_PATTERN.search(str(getattr(error, "details", error)))
+        return float(match.group(1)) if match else None
+
+    @staticmethod
+    def report() -> None:
+        """Log the calls and waits since the last report, and start counting again."""
+        with __class__._condition:
+            calls, rate_limited = __class__._calls, __class__._rate_limited
+            wait_total_s, wait_max_s = __class__._wait_total_s, __class__._wait_max_s
+            concurrency_limit = __class__._concurrency_limit
+            __class__._calls = __class__._rate_limited = 0
+            __class__._wait_total_s = __class__._wait_max_s = 0.0
+        if not calls:
+            return
+
+        logger.info(
+            f"LLM calls: {calls}, {rate_limited} rate limited, queue wait "
+            f"{wait_total_s / calls:.2f}s average and {wait_max_s:.2f}s max, "
+            f"concurrency limit {concurrency_limit:.1f}"
+        )
+
+    @staticmethod
+    def _try_acquire(tokens: int, waiting_since: float) -> float:
+        """Take a slot and the quota of a call if available.
+
+        Returns:
+            float: 0 if the call can start, otherwise seconds to wait before
+                trying again
+        """
+        now = time.monotonic()
+        if now < __class__._blocked_until:
+            return __class__._blocked_until - now
+        if __class__._in_flight >= int(__class__._concurrency_limit):
+            return _SLOT_POLL_S
+
+        __class__._requests.refill(now)
+        __class__._tokens.refill(now)
+        wait_s = max(__class__._requests.wait_s(1), __class__._tokens.wait_s(tokens))
+        if wait_s > 0:
+            return wait_s
+
+        __class__._requests.level -= 1
+        __class__._tokens.level -= tokens
+        __class__._in_flight += 1
+
+        waited_s = now - waiting_since
+        __class__._calls += 1
+        __class__._wait_total_s += waited_s
+        __class__._wait_max_s = max(__class__._wait_max_s, waited_s)
+        return 0
+
+    @staticmethod
+    def _acquire(tokens: int) -> None:
+        waiting_since = time.monotonic()
+        with __class__._condition:
+            while wait_s := __class__._try_acquire(tokens, waiting_since):
+                __class__._condition.wait(timeout=wait_s)
+
+    @staticmethod
+    async def _aacquire(tokens: int) -> None:
+        waiting_since = time.monotonic()
+        while True:
+            with __class__._condition:
+                wait_s = __class__._try_acquire(tokens, waiting_since)
+            if not wait_s:
+                return
+            await asyncio.sleep(min(wait_s, _SLOT_POLL_S * 10))
+
+    @staticmethod
+    def _release(success: bool) -> None:
+        with __class__._condition:
+            __class__._in_flight -= 1
+            if success:
+                # Additive increase, about one more slot per window of calls
+                __class__._concurrency_limit = min(
+                    MAX_WORKERS,
+                    __class__._concurrency_limit + 1 / __class__._concurrency_limit,
+                )
+            __class__._condition.notify_all()
+
+    @staticmethod
+    def _on_rate_limited(error: Exception, attempt: int) -> None:
+        delay_s = __class__.retry_after_s(error)
+        if delay_s is None:
+            delay_s = random.uniform(MIN_DELAY_S, MAX_DELAY_S) * 2**attempt
+        delay_s = min(delay_s, LLM_MAX_BACKOFF_S)
+
+        with __class__._condition:
+            __class__._in_flight -= 1
+            __class__._rate_limited += 1
+            # Multiplicative decrease, and no call at all until the delay passed
+            __class__._concurrency_limit = max(1, __class__._concurrency_limit / 2)
+            __class__._blocked_until = max(
+                __class__._blocked_until, time.monotonic() + delay_s
+            )
+            __class__._condition.notify_all()
+
+        logger.warning(
+            f"LLM rate limited (attempt {attempt + 1}), retrying in {delay_s:.1f}s "
+            f"with {int(__class__._concurrency_limit)} calls in flight at most"
+        )
@@ -0,0 +1,35 @@
+import threading
+
+from settings import TOKEN_ESTIMATE_CHARS_PER_TOKEN
+
+
+class TokenEstimator:
+    """
+    Offline estimate of the number of tokens of a prompt, calibrated with the
+    token counts reported by the model after each generation
+    """
+
+    _chars_per_token = TOKEN_ESTIMATE_CHARS_PER_TOKEN
+    _lock = threading.Lock()
+
+    # Weight of the last generation in the calibrated ratio
+    SMOOTHING = 0.1
+
+    @staticmethod
+    def estimate(text: str) -> int:
+        return max(1, round(len(text) / __class__._chars_per_token))
+
+    @staticmethod
+    def record(text: str, prompt_tokens: int | None) -> None:
+        """Calibrate the estimate with the real token count of a prompt.
+
+        Args:
+            text: The prompt text
+            prompt_tokens: Prompt token count of the response usage metadata
+        """
+        if not text or not prompt_tokens:
+            return
+        with __class__._lock:
+            __class__._chars_per_token += __class__.SMOOTHING * (
+                len(text) / prompt_tokens - __class__._chars_per_token
+            )
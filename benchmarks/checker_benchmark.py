@@ -0,0 +1,53 @@
+"""
+Micro-benchmark of Checker.is_date on title, URL and body sized inputs.
+
+Run from the project root:
+    python -m benchmarks.checker_benchmark
+"""
+
+import timeit
+
+from bs4 import BeautifulSoup
+
+from utils.checker import Checker
+from utils.date_parser import DateParser
+
+ITERATIONS = 200
+
+
+def load_inputs() -> dict[str, str]:
+    with open("test_html.txt", encoding="utf-8") as file:
+        page_text = BeautifulSoup(file.read(), "html.parser").get_text(" ", strip=True)
+
+    return {
+        "date": "Published on June 26, 2025",
+        "title": "Nigeria launches its first national AI strategy in 2025",
+        "url": "https://techcabal.com/2025/06/26/nigeria-launches-national-ai-strategy/",
+        "body (5 KB)": (page_text * 10)[:5_000],
+        "body (50 KB)": (page_text * 10)[:50_000],
+    }
+
+
+def full_parse(value: str) -> bool:
+    """is_date without the fast rejection path"""
+    return DateParser.parse(Checker.clean_date(value)) is not None
+
+
+def main() -> None:
+    inputs = load_inputs()
+    DateParser.get_formats("")  # Build the format index outside of the timings
+    print(f"{'input':<14} {'length':>8} {'is_date':>12} {'full parse':>12}")
+    for name, value in inputs.items():
+        full_parse(value)  # Let strptime compile the regexes it needs
+        DateParser._parse_cached.cache_clear()
+        fast = timeit.timeit(lambda: Checker.is_date(value), number=ITERATIONS)
+        DateParser._parse_cached.cache_clear()
+        full = timeit.timeit(lambda: full_parse(value), number=ITERATIONS)
+        print(
+            f"{name:<14} {len(value):>8} "
+            f"{fast / ITERATIONS * 1e6:>10.1f}us {full / ITERATIONS * 1e6:>10.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compare the anchored date label stripper with the previous clean_date, which
+ran str.replace for every label anywhere in the string.
+
+The corpus has one post_date text per line, as returned by the post_date
+selector. Run from the project root:
+    python -m benchmarks.clean_date_corpus [corpus.txt]
+"""
+
+import sys
+import timeit
+
+from utils.checker import DATE_PREFIXES, Checker
+from utils.date_parser import DateParser
+
+DEFAULT_CORPUS = "benchmarks/post_dates.txt"
+ITERATIONS = 1_000
+
+
+def legacy_clean_date(date: str) -> str:
+    for prefix in DATE_PREFIXES:
+        date = date.replace(prefix, "").strip()
+    return date
+
+
+def main(corpus_path: str) -> None:
+    with open(corpus_path, encoding="utf-8") as file:
+        corpus = [line.strip() for line in file if line.strip()]
+
+    parsed = {"legacy": 0, "anchored": 0}
+    for date in corpus:
+        legacy = DateParser.parse(legacy_clean_date(date))
+        anchored = DateParser.parse(Checker.clean_date(date))
+        parsed["legacy"] += legacy is not None
+        parsed["anchored"] += anchored is not None
+        if legacy != anchored:
+            print(f"{date!r}: {legacy} -> {anchored}")
+
+    legacy_time = timeit.timeit(
+        lambda: [legacy_clean_date(date) for date in corpus], number=ITERATIONS
+    )
+    anchored_time = timeit.timeit(
+        lambda: [Checker.clean_date(date) for date in corpus], number=ITERATIONS
+    )
+
+    per_call = ITERATIONS * len(corpus)
+    print(f"\n{len(corpus)} dates")
+    print(
+        f"legacy:   {parsed['legacy']:>4} parsed, "
+        f"{legacy_time / per_call * 1e6:.1f}us per clean"
+    )
+    print(
+        f"anchored: {parsed['anchored']:>4} parsed, "
+        f"{anchored_time / per_call * 1e6:.1f}us per clean"
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CORPUS)
@@ -0,0 +1,69 @@
+"""
+Compare CustomSoup.extract with one select_text/select_url call per field on
+test_html.txt, for the queries made on each article page: the fetch checks
+the body and post date, then the article handler reads every field.
+
+Run from the project root:
+    python -m benchmarks.extract_benchmark
+"""
+
+import timeit
+
+from dtypes.selector import Selector
+from utils.custom_soup import CustomSoup
+
+ITERATIONS = 20
+BASE_URL = "https://www.worldbank.org/fr/news/all"
+
+# Elements spread over the page, the last one doesn't exist
+SELECTOR: Selector = {
+    "title": "a",
+    "link": "a",
+    "load_more_button": None,
+    "next_button": None,
+    "author": {
+        "name": "ul.country-list",
+        "link": "a.event-disable-click",
+        "image_url": "img.author-avatar",
+    },
+    "body": "div.nav-tools",
+    "event_date": None,
+    "post_date": "facets.ng-tns-c0-0",
+    "image_url": "a.focusable",
+}
+
+
+def select_each(soup: CustomSoup) -> dict[str, str | None]:
+    author = SELECTOR["author"]
+    soup.select_text(SELECTOR["body"]) and soup.select_text(SELECTOR["post_date"])
+    return {
+        "body": soup.select_text(SELECTOR["body"]),
+        "post_date": soup.select_text(SELECTOR["post_date"]),
+        "event_date": soup.select_text(SELECTOR["event_date"]),
+        "image_url": soup.select_url(BASE_URL, SELECTOR["image_url"]),
+        "author_name": soup.select_text(author["name"]),
+        "author_link": soup.select_url(BASE_URL, author["link"]),
+        "author_image_url": soup.select_url(BASE_URL, author["image_url"]),
+    }
+
+
+def extract(soup: CustomSoup) -> dict[str, str | None]:
+    soup._elements.clear()  # Each iteration is a new page
+    soup.extract(SELECTOR, BASE_URL)
+    return dict(soup.extract(SELECTOR, BASE_URL))
+
+
+def main() -> None:
+    with open("test_html.txt", encoding="utf-8") as file:
+        soup = CustomSoup(file.read())
+
+    assert select_each(soup) == extract(soup), "extract doesn't match select_*"
+
+    each = timeit.timeit(lambda: select_each(soup), number=ITERATIONS) / ITERATIONS
+    once = timeit.timeit(lambda: extract(soup), number=ITERATIONS) / ITERATIONS
+    print(f"select_* per field: {each * 1000:.1f}ms")
+    print(f"extract:            {once * 1000:.1f}ms ({each / once:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Drive Llm.prompt from many threads against a local fake of the Gemini API that
+enforces its own requests per minute quota, to check that LlmRateLimiter keeps
+the calls under the quota and recovers from quota errors.
+
+The quota is scaled to a few seconds: the limiter is configured once with the
+real quota of the fake, which must not get any quota error, then with twice
+that quota so quota errors happen and the AIMD concurrency and the retry delays
+are exercised.
+
+Run from the project root:
+    python -m benchmarks.llm_rate_limit [--threads 20] [--calls 60] [--rpm 600]
+"""
+
+import argparse
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from google.genai import errors
+
+import ai.llm_cache
+from ai.llm import Llm
+from ai.prompt import Prompt, PromptType
+from ai.rate_limiter import LlmRateLimiter, TokenBucket
+from constants import SUMMARY_PROMPT_PATH
+
+
+class FakeGeminiModels:
+    """
+    Stand-in for client.models answering after a fixed latency, with a quota
+    error carrying a retry delay once more than rpm / 60 calls started in the
+    last second
+    """
+
+    def __init__(self, rpm: int, latency_s: float = 0.2) -> None:
+        self.per_second = max(1, rpm // 60)
+        self.latency_s = latency_s
+        self.started: deque[float] = deque()
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.rejected = 0
+
+    def generate_content_stream(self, model, contents, config):
+        with self.lock:
+            now = time.monotonic()
+            while self.started and now - self.started[0] > 1:
+                self.started.popleft()
+            if len(self.started) >= self.per_second:
+                self.rejected += 1
+                raise errors.ClientError(
+                    429,
+                    {
+                        "error": {
+                            "code": 429,
+                            "status": "RESOURCE_EXHAUSTED",
+                            "message": "Quota exceeded",
+                            "details": [
+                                {
+                                    "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                                    "retryDelay": "1s",
+                                }
+                            ],
+                        }
+                    },
+                )
+            self.started.append(now)
+            self.calls += 1
+
+        time.sleep(self.latency_s)
+        usage = SimpleNamespace(
+            prompt_token_count=500, candidates_token_count=50, total_token_count=550
+        )
+        yield SimpleNamespace(text="```html\n<p>Summary", usage_metadata=None)
+        yield SimpleNamespace(text="</p>\n```", usage_metadata=usage)
+
+
+def run(llm: Llm, fake: FakeGeminiModels, threads: int, calls: int, rpm: int) -> int:
+    """Send the calls with the limiter at a quota.
+
+    Returns:
+        int: Quota errors answered by the fake
+    """
+    # The fake counts its quota per second, so does the bucket
+    LlmRateLimiter._requests = TokenBucket(rpm // 60, window_s=1)
+    LlmRateLimiter._blocked_until = 0.0
+    fake.calls = fake.rejected = 0
+
+    prompts = [
+        Prompt(
+            content=f"Article {i}",
+            template_path=SUMMARY_PROMPT_PATH,
+            type=PromptType.TEXT,
+        )
+        for i in range(calls)
+    ]
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(llm.prompt, prompts))
+    elapsed_s = time.monotonic() - start
+
+    print(
+        f"limiter at {rpm} rpm: {fake.calls} calls in {elapsed_s:.1f}s "
+        f"({fake.calls / elapsed_s * 60:.0f} rpm), {fake.rejected} quota errors"
+    )
+    LlmRateLimiter.report()
+    return fake.rejected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=60)
+    parser.add_argument("--rpm", type=int, default=600, help="Quota of the fake")
+    args = parser.parse_args()
+
+    os.environ.setdefault("API_KEY", "fake")
+    ai.llm_cache.LLM_CACHE_ENABLED = False
+
+    fake = FakeGeminiModels(args.rpm)
+    llm = Llm()
+    llm.client = SimpleNamespace(models=fake)
+
+    rejected = run(llm, fake, args.threads, args.calls, args.rpm)
+    assert rejected == 0, f"{rejected} quota errors with the limiter at the quota"
+    time.sleep(1)  # Let the quota window of the fake empty
+
+    run(llm, fake, args.threads, args.calls, args.rpm * 2)
+
+
+if __name__ == "__main__":
+    main()
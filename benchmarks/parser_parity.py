@@ -0,0 +1,103 @@
+"""
+Check that the stored selectors select the same elements with every HTML
+parser backend, and time the parsing.
+
+Selectors are generated from the classes and IDs of the pages; the selectors
+of the sources can be added as a JSON list, e.g. the output of
+    SELECT json_agg(selectors) FROM sources;
+
+Run from the project root:
+    python -m benchmarks.parser_parity [--selectors selectors.json] [page.html ...]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+
+from bs4 import BeautifulSoup, Tag
+
+from dtypes.selector import Selector
+from utils.html_parser import HtmlParser
+
+BACKENDS = ["html.parser", "lxml"]
+FIELDS = ["title", "link", "load_more_button", "next_button", "body", "post_date"]
+
+
+def generate_selectors(soup: BeautifulSoup) -> set[str]:
+    selectors: set[str] = set()
+    for element in soup.find_all(True):
+        compound = element.name + "".join(
+            f".{class_name}" for class_name in element.get("class") or ()
+        )
+        selectors.add(compound)
+        if isinstance(element.parent, Tag) and element.parent.name != "[document]":
+            selectors.add(f"{element.parent.name} > {compound}")
+        element_id = element.get("id")
+        if element_id and not str(element_id)[0].isdigit():
+            selectors.add(f"#{element_id} {element.name}")
+    return selectors
+
+
+def stored_selectors(path: str) -> set[str]:
+    with open(path, encoding="utf-8") as file:
+        sources: list[Selector] = json.load(file)
+
+    selectors: set[str] = set()
+    for selector in sources:
+        selectors.update(selector[field] for field in FIELDS if selector.get(field))
+        author = selector.get("author") or {}
+        selectors.update(value for value in author.values() if value)
+    return selectors
+
+
+def describe(soup: BeautifulSoup, css: str) -> list[tuple[str, str, str | None]]:
+    return [
+        (
+            element.name,
+            " ".join(element.get_text().split()),
+            element.get("href") or element.get("src"),
+        )
+        for element in soup.select(css)
+    ]
+
+
+def check_page(path: str, extra_selectors: set[str]) -> int:
+    with open(path, encoding="utf-8") as file:
+        html = file.read()
+
+    soups = {backend: HtmlParser.parse(html, backend) for backend in BACKENDS}
+    reference, *others = BACKENDS
+    selectors = generate_selectors(soups[reference]) | extra_selectors
+
+    mismatches = 0
+    for css in sorted(selectors):
+        try:
+            expected = describe(soups[reference], css)
+        except Exception:
+            continue  # Not a valid selector for soupsieve either
+        for backend in others:
+            if describe(soups[backend], css) != expected:
+                mismatches += 1
+                print(f"{path}: {css!r} differs with {backend}")
+
+    print(f"\n{path}: {len(selectors)} selectors, {mismatches} mismatches")
+    for backend in BACKENDS:
+        seconds = timeit.timeit(lambda: HtmlParser.parse(html, backend), number=5) / 5
+        print(f"  {backend:<12} {seconds * 1000:.0f}ms per parse")
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pages", nargs="*", default=["test_html.txt"])
+    parser.add_argument("--selectors", help="JSON list of source selectors")
+    args = parser.parse_args()
+
+    extra_selectors = stored_selectors(args.selectors) if args.selectors else set()
+    mismatches = sum(check_page(page, extra_selectors) for page in args.pages)
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import os
+
+import asyncpg
+
+from settings import ASYNC_DB_POOL_SIZE
+from utils.logger import logger
+
+
+class AsyncDatabaseConfig:
+    """
+    asyncpg connection pool used by the asyncio scrape engine.
+
+    The pool is bound to the event loop it was created in, so unlike
+    DatabaseConfig it is opened and closed for every run.
+    """
+
+    def __init__(self) -> None:
+        host: str | None = os.getenv("DB_HOST")
+        database: str | None = os.getenv("DB_NAME")
+        user: str | None = os.getenv("DB_USER")
+        password: str | None = os.getenv("DB_PASSWORD")
+        port_str: str | None = os.getenv("DB_PORT")
+        sslmode: str | None = os.getenv("DB_SSLMODE")
+
+        if None in (host, database, user, password, port_str, sslmode):
+            raise ValueError(
+                "One or more required database environment variables are not set"
+            )
+
+        self.connection_params = {
+            "host": host,
+            "database": database,
+            "user": user,
+            "password": password,
+            "port": int(port_str),  # type: ignore
+            "ssl": sslmode,
+        }
+        self.pool: asyncpg.Pool | None = None
+
+    async def __aenter__(self) -> "AsyncDatabaseConfig":
+        try:
+            self.pool = await asyncpg.create_pool(
+                min_size=1,
+                max_size=ASYNC_DB_POOL_SIZE,
+                **self.connection_params,
+            )
+        except Exception as e:
+            logger.error(f"Async database connection pool error: {e}")
+            raise
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    def get_pool(self) -> asyncpg.Pool:
+        if self.pool is None:
+            raise AttributeError("Connection pool not initialized")
+        return self.pool
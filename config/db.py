@@ -1,4 +1,5 @@
 import os
+import threading
 from contextlib import contextmanager
 
 from constants import (
@@ -8,10 +9,10 @@ from constants import (
     SOURCE_TABLE_SCHEMA,
     STATISTICS_TABLE_SCHEMA,
 )
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import ThreadedConnectionPool
 from utils.logger import logger
 
-from settings import WORKERS_COUNT
+from settings import DB_POOL_SIZE
 
 
 class DatabaseConfig:
@@ -62,11 +63,13 @@ class DatabaseConfig:
         try:
             min_connections = min_connections or int(os.getenv("DB_POOL_MIN", 1))
             max_connections = max_connections or int(
-                os.getenv("DB_POOL_MAX", WORKERS_COUNT)
+                os.getenv("DB_POOL_MAX", DB_POOL_SIZE)
             )
-            self.connection_pool = SimpleConnectionPool(
+            self.connection_pool = ThreadedConnectionPool(
                 min_connections, max_connections, **self.connection_params
             )
+            # The pool raises once exhausted, wait for a free connection instead
+            self._available = threading.BoundedSemaphore(max_connections)
         except Exception as e:
             logger.error(f"Database connection pool error: {e}")
             raise
@@ -80,13 +83,14 @@ class DatabaseConfig:
         if not hasattr(self, "connection_pool"):
             raise AttributeError("Connection pool not initialized")
 
-        conn = self.connection_pool.getconn()
-        logger.debug(f"Acquired connection: {conn}")
-        try:
-            yield conn
-        finally:
-            logger.debug(f"Releasing connection: {conn}")
-            self.connection_pool.putconn(conn)
+        with self._available:
+            conn = self.connection_pool.getconn()
+            logger.debug(f"Acquired connection: {conn}")
+            try:
+                yield conn
+            finally:
+                logger.debug(f"Releasing connection: {conn}")
+                self.connection_pool.putconn(conn)
 
     def create_tables(self):
         """
@@ -1,12 +1,14 @@
 NEWS_PROMPTS_PATH = "./prompts/news_prompt.md"
 NEWS_DETAIL_PROMPTS_PATH = "./prompts/news_detail_prompt.md"
 SUMMARY_PROMPT_PATH = "./prompts/summary_prompt.md"
+SUMMARY_BATCH_PROMPT_PATH = "./prompts/summary_batch_prompt.md"
 
 
 AI_TRIGGER_WORDS_PATH = "./data/ai/trigger_words.txt"
 AI_TRIGGER_PHRASES_PATH = "./data/ai/trigger_phrases.txt"
 AFRICA_TRIGGER_WORDS_PATH = "./data/africa/trigger_words.txt"
 AFRICA_TRIGGER_PHRASES_PATH = "./data/africa/trigger_phrases.txt"
+TRIGGER_FILES_PATTERN = "./data/*/trigger_*.txt"
 
 CATEGORY_TABLE_SCHEMA = """
 CREATE TABLE IF NOT EXISTS categories (
@@ -30,6 +32,9 @@ DO $$ BEGIN
     IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'scrape_status') THEN
         CREATE TYPE scrape_status AS ENUM ('available', 'fetching', 'unavailable');
     END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'fetch_mode') THEN
+        CREATE TYPE fetch_mode AS ENUM ('http', 'browser');
+    END IF;
 END $$;
 
 CREATE TABLE IF NOT EXISTS sources (
@@ -39,9 +44,16 @@ CREATE TABLE IF NOT EXISTS sources (
     triggerAfrica BOOLEAN NOT NULL,
     triggerAi BOOLEAN NOT NULL,
     status scrape_status NOT NULL DEFAULT 'available',
+    fetchMode fetch_mode DEFAULT NULL,
+    waitTimeoutS REAL DEFAULT NULL,
+    watermark JSONB DEFAULT NULL,
     createdAt TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updatedAt TIMESTAMP WITH TIME ZONE DEFAULT NULL
 );
+
+ALTER TABLE sources ADD COLUMN IF NOT EXISTS fetchMode fetch_mode DEFAULT NULL;
+ALTER TABLE sources ADD COLUMN IF NOT EXISTS waitTimeoutS REAL DEFAULT NULL;
+ALTER TABLE sources ADD COLUMN IF NOT EXISTS watermark JSONB DEFAULT NULL;
 """
 AUTHORS_TABLE_SCHEMA = """
 CREATE TABLE IF NOT EXISTS authors (
@@ -53,6 +65,12 @@ CREATE TABLE IF NOT EXISTS authors (
 """
 
 NEWS_TABLE_SCHEMA = """
+DO $$ BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'summary_status') THEN
+        CREATE TYPE summary_status AS ENUM ('pending', 'done', 'failed');
+    END IF;
+END $$;
+
 CREATE TABLE IF NOT EXISTS news (
     id SERIAL PRIMARY KEY,
     sourceId BIGINT NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
@@ -64,8 +82,17 @@ CREATE TABLE IF NOT EXISTS news (
     postDate TIMESTAMP WITH TIME ZONE,
     imageUrl TEXT,
     viewsCount INTEGER DEFAULT 0,
+    simhash BIGINT DEFAULT NULL,
+    canonicalId BIGINT DEFAULT NULL REFERENCES news(id) ON DELETE SET NULL,
+    summaryStatus summary_status NOT NULL DEFAULT 'done',
     createdAt TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
+
+ALTER TABLE news ADD COLUMN IF NOT EXISTS simhash BIGINT DEFAULT NULL;
+ALTER TABLE news ADD COLUMN IF NOT EXISTS canonicalId BIGINT DEFAULT NULL
+    REFERENCES news(id) ON DELETE SET NULL;
+ALTER TABLE news ADD COLUMN IF NOT EXISTS summaryStatus summary_status NOT NULL
+    DEFAULT 'done';
 """
 
 TRIGGER_WORDS_CATEGORIES: dict[str, list[str]] = {
@@ -270,3 +297,40 @@ TRIGGER_WORDS_CATEGORIES: dict[str, list[str]] = {
         "argument",
     ],
 }
+
+# URL patterns (Network.setBlockedURLs wildcards) blocked by each resource
+# blocking profile of the browser
+_MEDIA_EXTENSIONS = [
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp",
+    "mp4", "webm", "ogg", "mp3", "m4a", "woff", "woff2", "ttf", "otf", "eot",
+]
+_MEDIA_URL_PATTERNS = [
+    pattern
+    for extension in _MEDIA_EXTENSIONS
+    for pattern in (f"*.{extension}", f"*.{extension}?*")
+]
+_TRACKER_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googlesyndication.com*",
+    "*googleadservices.com*",
+    "*doubleclick.net*",
+    "*amazon-adsystem.com*",
+    "*adnxs.com*",
+    "*criteo.com*",
+    "*taboola.com*",
+    "*outbrain.com*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*scorecardresearch.com*",
+    "*quantserve.com*",
+    "*chartbeat.com*",
+    "*segment.io*",
+    "*mixpanel.com*",
+]
+RESOURCE_BLOCKING_PROFILES: dict[str, list[str]] = {
+    "none": [],
+    "media": _MEDIA_URL_PATTERNS,  # Images, video, audio and web fonts
+    "standard": _MEDIA_URL_PATTERNS + _TRACKER_URL_PATTERNS,  # Media, ads and analytics
+}
@@ -0,0 +1,8 @@
+from typing import TypedDict
+
+
+class ListingItem(TypedDict):
+    """An article of a listing page, href is as written in the page"""
+
+    title: str
+    href: str
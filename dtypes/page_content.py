@@ -0,0 +1,13 @@
+from typing import TypedDict
+
+
+class PageContent(TypedDict):
+    """Fields of an article page, as extracted with the source selectors"""
+
+    body: str | None
+    post_date: str | None
+    event_date: str | None
+    image_url: str | None
+    author_name: str | None
+    author_link: str | None
+    author_image_url: str | None
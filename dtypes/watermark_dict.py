@@ -0,0 +1,8 @@
+from typing import TypedDict
+
+
+class WatermarkDict(TypedDict):
+    """Newest articles of a source at its last scrape"""
+
+    urls: list[str]  # Listing hrefs, newest first
+    newestDate: str | None  # ISO post date of the newest article
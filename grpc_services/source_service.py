@@ -2,23 +2,23 @@ import datetime
 import queue
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytz
 from ai.llm import Llm
-from bs4 import BeautifulSoup, ParserRejectedMarkup
-from constants import (
-    AFRICA_TRIGGER_PHRASES_PATH,
-    AFRICA_TRIGGER_WORDS_PATH,
-    AI_TRIGGER_PHRASES_PATH,
-    AI_TRIGGER_WORDS_PATH,
-)
+from ai.llm_cache import LlmCache
+from ai.rate_limiter import LlmRateLimiter
+from bs4 import ParserRejectedMarkup
 from dtypes.author_dict import AuthorDict
+from dtypes.listing_item import ListingItem
+from dtypes.page_content import PageContent
 from dtypes.selector import Selector
 from grpc import ServicerContext
 from iterators.infinite_scrolling_iterator import InfiniteScrollIterator
 from iterators.pagination_iterator import PaginationIterator
 from models.author import Author
 from models.enums.scrape_status import ScrapeStatus
+from models.enums.summary_status import SummaryStatus
 from models.news import NewsAdd
 from models.source import Source, SourceUpdate
 from protos.source_pb2 import (
@@ -29,90 +29,113 @@ from protos.source_pb2 import (
 )
 from protos.source_pb2_grpc import SourceServiceServicer
 from repositories.author_repository import AuthorRepository
+from repositories.news_repository import NewsRepository
 from repositories.source_repository import SourceRepository
+from services.async_scrape_service import AsyncScrapeService
 from services.news_service import NewsService
 from services.statistics_service import StatisticsService
-from settings import DEBUG_MODE, LAST_FETCH_DATE, WORKERS_COUNT
+from services.summary_service import SummaryService
+from settings import (
+    DEBUG_MODE,
+    DETAIL_FETCH_WORKERS,
+    LAST_FETCH_DATE,
+    SCRAPE_ENGINE,
+    WORKERS_COUNT,
+)
 from utils.checker import Checker
 from utils.custom_driver import CustomDriver
 from utils.custom_soup import CustomSoup
+from utils.driver_pool import DriverPool
+from utils.duplicate_index import DuplicateIndex
+from utils.fetch_engine import FetchEngine
 from utils.helper import Helpers
+from utils.listing_extractor import ListingExtractor
 from utils.logger import logger
+from utils.page_waiter import PageWaiter
+from utils.resource_blocker import ResourceStats
 from utils.scrape_utils import ScrapeUtils
-from utils.trigger_utils import TriggerFile, TriggerUtils
+from utils.seen_url_index import SeenUrlIndex
+from utils.source_watermark import SourceWatermark
+from utils.trigger_registry import TriggerRegistry, TriggerSet
 
 utc = pytz.UTC
 llm = Llm()
 
 
-trigger_words_ai = []
-trigger_phrases_ai = []
-trigger_words_africa = []
-trigger_phrases_africa = []
+trigger_registry = TriggerRegistry()
 try:
-    ai_trigger_words = TriggerFile(AI_TRIGGER_WORDS_PATH)
-    ai_trigger_phrases = TriggerFile(AI_TRIGGER_PHRASES_PATH)
-    africa_trigger_words = TriggerFile(AFRICA_TRIGGER_WORDS_PATH)
-    africa_trigger_phrases = TriggerFile(AFRICA_TRIGGER_PHRASES_PATH)
-
-    trigger_words_ai = ai_trigger_words.get()
-    logger.info(f"Loaded {len(trigger_words_ai)} AI trigger words")
-
-    trigger_phrases_ai = ai_trigger_phrases.get()
-    logger.info(f"Loaded {len(trigger_phrases_ai)} AI trigger phrases")
-
-    trigger_words_africa = africa_trigger_words.get()
-    logger.info(f"Loaded {len(trigger_words_africa)} Africa trigger words")
-
-    trigger_phrases_africa = africa_trigger_phrases.get()
-    logger.info(f"Loaded {len(trigger_phrases_africa)} Africa trigger phrases")
-
+    trigger_registry.reload()
 except Exception as e:
     logger.error(f"Error loading trigger files: {str(e)}")
 
     # This is good in info so we can know that we need to fix something
     if DEBUG_MODE:
         raise e
+trigger_registry.start()
 
 
 def is_valid_article(
     title: str,
     trigger_africa: bool,
     trigger_ai: bool,
+    triggers: TriggerSet | None = None,
 ) -> bool:
+    triggers = triggers or trigger_registry.current()
     should_add_africa = False
 
     if trigger_africa:
         logger.info(f"Checking for Africa triggers in: {title}")
 
-        should_add_africa = TriggerUtils.contains_triggers(
-            title,
-            trigger_words_africa,
-            trigger_phrases_africa,
-        )
+        africa_triggers = triggers.get("africa").find(title)
+        should_add_africa = bool(africa_triggers)
 
-        if "africa" in title.lower():
-            logger.info(f"Found Africa keyword in: {title}")
+        if should_add_africa:
+            logger.info(f"Found Africa triggers {africa_triggers} in: {title}")
 
     should_add_ai = False
 
     if trigger_ai:
         logger.info(f"Checking for AI triggers in: {title}")
 
-        should_add_ai = TriggerUtils.contains_triggers(
-            title,
-            trigger_words_ai,
-            trigger_phrases_ai,
-        )
+        ai_triggers = triggers.get("ai").find(title)
+        should_add_ai = bool(ai_triggers)
 
         if should_add_ai:
-            logger.info(f"Found AI trigger in: {title}")
+            logger.info(f"Found AI triggers {ai_triggers} in: {title}")
 
     should_add = should_add_ai == trigger_ai and should_add_africa == trigger_africa
 
     return should_add
 
 
+def are_valid_articles(
+    titles: list[str],
+    trigger_africa: bool,
+    trigger_ai: bool,
+) -> list[bool]:
+    """Batch version of is_valid_article for all the titles of a listing page.
+
+    Args:
+        titles: The article titles
+        trigger_africa: Whether the titles must contain an Africa trigger
+        trigger_ai: Whether the titles must contain an AI trigger
+
+    Returns:
+        list[bool]: For each title, whether the article should be scraped
+    """
+    # A single snapshot for the whole page, even if the files reload meanwhile
+    triggers = trigger_registry.current()
+    return [
+        is_valid_article(
+            title,
+            trigger_africa=trigger_africa,
+            trigger_ai=trigger_ai,
+            triggers=triggers,
+        )
+        for title in titles
+    ]
+
+
 class SourceService(SourceServiceServicer):
     _is_scraping = False
 
@@ -126,7 +149,13 @@ class SourceService(SourceServiceServicer):
             return ScrapeResponse()  # Ignore new request
         self.__class__._is_scraping = True
         try:
-            self._scrape()
+            if SCRAPE_ENGINE == "asyncio":
+                AsyncScrapeService(
+                    article_filter=is_valid_article,
+                    refresh_source=self._refresh_source,
+                ).scrape()
+            else:
+                self._scrape()
         finally:
             self.__class__._is_scraping = False
         return ScrapeResponse()
@@ -134,9 +163,15 @@ class SourceService(SourceServiceServicer):
     def _scrape(self):
         source_repository = SourceRepository()
         statistics_service = StatisticsService()
+        driver_pool = DriverPool()
+        driver_pool.open()
 
         statistics_service.get_stats()
         sources = source_repository.get_sources()
+        SeenUrlIndex.warm(NewsRepository().get_urls)
+        DuplicateIndex.warm(NewsRepository().get_fingerprints)
+        summary_service = SummaryService()
+        summary_service.resume()
 
         sources_queue = queue.Queue()
 
@@ -152,16 +187,15 @@ class SourceService(SourceServiceServicer):
                 author_repository = AuthorRepository()
                 source_repository = SourceRepository()
                 news_service = NewsService()
-                driver = CustomDriver()
-
-                self._handle_source(
-                    author_repository,
-                    source_repository,
-                    news_service,
-                    driver,
-                    source,
-                )
-                driver.quit()
+
+                with driver_pool.lease() as driver:
+                    self._handle_source(
+                        author_repository,
+                        source_repository,
+                        news_service,
+                        driver,
+                        source,
+                    )
 
                 sources_queue.task_done()
 
@@ -174,6 +208,17 @@ class SourceService(SourceServiceServicer):
         for t in threads:
             t.join()
 
+        # Summaries of the last articles are still being generated
+        summary_service.close()
+
+        # Browsers are only reused within a run, don't keep them idle between runs
+        driver_pool.close()
+        ResourceStats.report()
+        SeenUrlIndex.report()
+        DuplicateIndex.report()
+        LlmCache.report()
+        LlmRateLimiter.report()
+
     def _handle_source(
         self,
         author_repository: AuthorRepository,
@@ -185,6 +230,7 @@ class SourceService(SourceServiceServicer):
         url = source.url
         trigger_ai = source.triggerAi
         trigger_africa = source.triggerAfrica
+        driver.use_source(url)
         driver.get(url)
 
         source_repository.set_status(source.id, ScrapeStatus.FETCHING)
@@ -277,190 +323,238 @@ class SourceService(SourceServiceServicer):
         limit: int | None,
         timeout_s: float,
     ) -> None:
+        listing_extractor = ListingExtractor(selector["title"], selector["link"])
+        page_waiter = PageWaiter(driver.driver, selector["link"], source.waitTimeoutS)
+        watermark = SourceWatermark(source.watermark)
         iterator = (
             InfiniteScrollIterator(
                 custom_driver=driver,
                 css_selector=str(load_more_selector),
                 timeout_s=timeout_s,
+                listing_extractor=listing_extractor,
                 limit=limit,
+                page_waiter=page_waiter,
+                watermark=watermark,
             )
             if next_button_selector is None
             else PaginationIterator(
                 driver=driver,
                 css_selector=str(next_button_selector),
                 timeout_s=timeout_s,
+                listing_extractor=listing_extractor,
                 limit=limit,
+                page_waiter=page_waiter,
+                watermark=watermark,
             )
         )
 
-        for loaded_content in iterator:
-            current_url = driver.driver.execute_script("return window.location.href;")
-            print(f"Current url: {current_url}")
-            try:
-                self._handle_articles(
-                    author_repository,
-                    news_repository,
-                    driver,
-                    source,
-                    url,
-                    trigger_ai,
-                    trigger_africa,
-                    selector,
-                    author_selector,
-                    loaded_content,
-                )
-            except StopIteration:
-                break
-            driver.get(current_url)
+        try:
+            for listing_items in iterator:
+                try:
+                    self._handle_articles(
+                        author_repository,
+                        news_repository,
+                        source,
+                        url,
+                        trigger_ai,
+                        trigger_africa,
+                        selector,
+                        author_selector,
+                        listing_items,
+                        watermark,
+                    )
+                except StopIteration:
+                    break
+        finally:
+            iterator.close()
 
         source_repository.update_at(
             source.id,
             datetime.datetime.now(),
         )
+        source_repository.set_watermark(source.id, watermark.to_dict())
+
+        wait_timeout_s = page_waiter.learned_timeout_s()
+        if wait_timeout_s is not None:
+            source_repository.set_wait_timeout(source.id, wait_timeout_s)
 
     def _handle_articles(
         self,
         author_repository: AuthorRepository,
         news_service: NewsService,
-        driver: CustomDriver,
         source: Source,
         url: str,
         trigger_ai: bool,
         trigger_africa: bool,
         selector: Selector,
         author_selector: AuthorDict | None,
-        loaded_content: str,
+        listing_items: list[ListingItem],
+        watermark: SourceWatermark,
     ):
-        logger.info("Parsing HTML with BeautifulSoup")
-        soup = BeautifulSoup(loaded_content, "html.parser")
-
-        logger.info(f"Selecting elements with selector: {selector['title']}")
-        elements = soup.select(selector["title"])
-
-        logger.info(f"Found {len(elements)} title elements")
-
-        logger.info(f"Selecting links with selector: {selector['link']}")
-        links = soup.select(selector["link"])
-
-        logger.info(f"Found {len(links)} link elements")
-
-        logger.info(f"Processing {len(elements)} elements")
+        fetch_engine = FetchEngine()
 
-        for i, element in enumerate(elements):
-            logger.info(f"Processing element {i + 1}/{len(elements)}")
+        logger.info(f"Processing {len(listing_items)} new listing items")
 
-            title = element.get_text().strip()
-
-            should_add = is_valid_article(
-                title,
-                trigger_africa=trigger_africa,
-                trigger_ai=trigger_ai,
-            )
+        titles = [item["title"] for item in listing_items]
+        valid_articles = are_valid_articles(
+            titles,
+            trigger_africa=trigger_africa,
+            trigger_ai=trigger_ai,
+        )
 
-            logger.info(f"Title: {title}")
+        articles: list[tuple[str, str]] = []
+        reached_known = False
+        for i, (item, should_add) in enumerate(zip(listing_items, valid_articles)):
+            logger.info(f"Processing element {i + 1}/{len(listing_items)}")
+            logger.info(f"Title: {item['title']}")
             logger.info(f"Should add this result: {should_add}")
 
             if should_add:
-                news_url = links[i].get("href")
-
-                if news_url:
-                    news_url = CustomSoup.resolve_relative_url(url, news_url)
-
-                    # Skip entries with no link (can't fetch additional data)
-                if news_url is None:
-                    logger.info("Skipping - link is None")
+                news_url = CustomSoup.resolve_relative_url(url, item["href"])
+                if SeenUrlIndex.contains(news_url):
+                    logger.info(f"Already stored, skipping: {news_url}")
+                    SeenUrlIndex.record_skipped()
+                    if watermark.is_empty:
+                        # Without a watermark the first stored article ends the
+                        # listing, as the last fetch date used to
+                        reached_known = True
+                        break
                     continue
+                articles.append((item["title"], news_url))
+
+        logger.info(f"Fetching {len(articles)} article pages")
 
-                logger.info(f"Fetching author information from: {news_url}")
+        # The listing driver stays on its page, article pages are fetched
+        # concurrently and handled in listing order as they complete
+        with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+            futures = [
+                executor.submit(fetch_engine.get_soup, source, news_url, selector)
+                for _, news_url in articles
+            ]
+            try:
+                for (title, news_url), future in zip(articles, futures):
+                    logger.info(f"Fetching author information from: {news_url}")
+                    self._handle_article(
+                        author_repository,
+                        news_service,
+                        source,
+                        url,
+                        trigger_ai,
+                        trigger_africa,
+                        selector,
+                        author_selector,
+                        title,
+                        news_url,
+                        future.result(),
+                        watermark,
+                    )
+            finally:
+                for future in futures:
+                    future.cancel()
 
-                news_url = CustomSoup.resolve_relative_url(url, news_url)
+        if reached_known:
+            logger.info("Reached the articles already stored")
+            raise StopIteration
 
-                driver.get(news_url)
-                news_page = driver.get_html()
-                soup = CustomSoup(news_page)
+    def _handle_article(
+        self,
+        author_repository: AuthorRepository,
+        news_service: NewsService,
+        source: Source,
+        url: str,
+        trigger_ai: bool,
+        trigger_africa: bool,
+        selector: Selector,
+        author_selector: AuthorDict | None,
+        title: str,
+        news_url: str,
+        soup: CustomSoup,
+        watermark: SourceWatermark,
+    ) -> None:
+        content = soup.extract(selector, url)
+        author_id = self._get_create_author(
+            author_repository,
+            url,
+            trigger_ai,
+            trigger_africa,
+            author_selector,
+            content,
+        )
 
-                author_id = self._get_create_author(
-                    author_repository,
-                    url,
-                    trigger_ai,
-                    trigger_africa,
-                    author_selector,
-                    soup,
-                )
+        body = content["body"]
+        post_date = content["post_date"]
+        image_url = content["image_url"]
 
-                body = soup.select_text(selector["body"])
-                post_date = soup.select_text(selector["post_date"])
-                image_url = soup.select_url(
-                    css_selector=selector["image_url"],
-                    base_url=url,
+        if not (body and post_date):
+            self.addUpdateSource(
+                request=SourceRequest(
+                    url=source.url,
+                    containsAfricaContent=(not source.triggerAfrica),
+                    containsAiContent=(not source.triggerAi),
                 )
+            )
+            raise Exception(
+                "The Body selector and the post selector are outdated valid"
+            )
 
-                if not (body and post_date):
-                    self.addUpdateSource(
-                        request=SourceRequest(
-                            url=source.url,
-                            containsAfricaContent=(not source.triggerAfrica),
-                            containsAiContent=(not source.triggerAi),
-                        )
-                    )
-                    raise Exception(
-                        "The Body selector and the post selector are outdated valid"
-                    )
+        date = Checker.get_date(post_date, source_key=source.id)
 
-                date = Checker.get_date(post_date)
+        if date is None:
+            raise ValueError(f"Could not parse date: {post_date}")
+        if source.updatedAt and datetime.datetime.fromisoformat(
+            source.updatedAt
+        ).replace(tzinfo=pytz.UTC) > date.replace(tzinfo=pytz.UTC):
+            logger.info(
+                f"Skipping article from {date} as it's older than source's last update {source.updatedAt}"
+            )
+            raise StopIteration
 
-                if date is None:
-                    raise ValueError(f"Could not parse date: {post_date}")
-                if source.updatedAt and datetime.datetime.fromisoformat(
-                    source.updatedAt
-                ).replace(tzinfo=pytz.UTC) > date.replace(tzinfo=pytz.UTC):
-                    logger.info(
-                        f"Skipping article from {date} as it's older than source's last update {source.updatedAt}"
-                    )
-                    raise StopIteration
+        if LAST_FETCH_DATE > date.date():
+            logger.info(
+                f"Skipping article from {date.date()} as it's older than LAST_FETCH_DATE {LAST_FETCH_DATE}"
+            )
+            raise StopIteration
+        watermark.record_date(date)
+        author_id = author_id if author_id else None
 
-                if LAST_FETCH_DATE > date.date():
-                    logger.info(
-                        f"Skipping article from {date.date()} as it's older than LAST_FETCH_DATE {LAST_FETCH_DATE}"
-                    )
-                    raise StopIteration
-                author_id = author_id if author_id else None
+        try:
+            logger.info(
+                f"Creating NewsAdd object with: authorId={author_id}, title={title}, url={url}, sourceId={source.id}"
+            )
+            logger.info(
+                f"Body length: {len(body)}, Post date: {post_date}, Image URL: {image_url}"
+            )
+            news = NewsAdd(
+                authorId=author_id,
+                title=title,
+                url=news_url,
+                sourceId=source.id,
+                body=body,
+                postDate=post_date,
+                imageUrl=image_url,
+                categoryId=None,  # will add it later
+            )
+            logger.info("Successfully created NewsAdd object")
+        except Exception:
+            self.addUpdateSource(
+                request=SourceRequest(
+                    url=source.url,
+                    containsAfricaContent=(not source.triggerAfrica),
+                    containsAiContent=(not source.triggerAi),
+                )
+            )
+            raise Exception("The detail selector are invalid")
 
-                try:
-                    logger.info(
-                        f"Creating NewsAdd object with: authorId={author_id}, title={title}, url={url}, sourceId={source.id}"
-                    )
-                    logger.info(
-                        f"Body length: {len(body)}, Post date: {post_date}, Image URL: {image_url}"
-                    )
-                    news = NewsAdd(
-                        authorId=author_id,
-                        title=title,
-                        url=news_url,
-                        sourceId=source.id,
-                        body=body,
-                        postDate=post_date,
-                        imageUrl=image_url,
-                        categoryId=None,  # will add it later
-                    )
-                    logger.info("Successfully created NewsAdd object")
-                except Exception:
-                    self.addUpdateSource(
-                        request=SourceRequest(
-                            url=source.url,
-                            containsAfricaContent=(not source.triggerAfrica),
-                            containsAiContent=(not source.triggerAi),
-                        )
-                    )
-                    raise Exception("The detail selector are invalid")
+        try:
+            news_id = news_service.add_news(news)
+        except Exception as e:
+            print(e)
+            return
 
-                try:
-                    news_service.add_news(news)
-                except Exception as e:
-                    print(e)
-                    continue
+        if news.summaryStatus == SummaryStatus.PENDING:
+            SummaryService().submit(news_id, news.body, news.imageUrl)
 
-                logger.info(f"Adding result: {title}")
+        logger.info(f"Adding result: {title}")
 
     def _get_create_author(
         self,
@@ -469,21 +563,14 @@ class SourceService(SourceServiceServicer):
         trigger_ai: bool,
         trigger_africa: bool,
         author_selector: AuthorDict | None,
-        soup: CustomSoup,
+        content: PageContent,
     ) -> int:
         author: Author | None = None
         if author_selector is not None:
             logger.info(f"Looking for author with selector: {author_selector}")
-            author_name = soup.select_text(author_selector["name"])
-            author_url = soup.select_url(
-                base_url=url,
-                css_selector=author_selector["link"],
-            )
-
-            image_url = soup.select_url(
-                base_url=url,
-                css_selector=author_selector["image_url"],
-            )
+            author_name = content["author_name"]
+            author_url = content["author_link"]
+            image_url = content["author_image_url"]
 
             try:
                 if Checker.is_date(author_name) or (
@@ -522,6 +609,15 @@ class SourceService(SourceServiceServicer):
 
         return author_id
 
+    def _refresh_source(self, source: Source) -> None:
+        self.addUpdateSource(
+            request=SourceRequest(
+                url=source.url,
+                containsAfricaContent=(not source.triggerAfrica),
+                containsAiContent=(not source.triggerAi),
+            )
+        )
+
     def addSource(
         self,
         request: SourceRequest,
@@ -1,12 +1,14 @@
-from time import sleep
-
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from dtypes.listing_item import ListingItem
 from protocols.custom_driver_protocol import CustomDriverProtocol
+from utils.listing_extractor import ListingExtractor
 from utils.logger import logger
+from utils.page_waiter import PageWaiter
+from utils.source_watermark import SourceWatermark
 
 
 class InfiniteScrollIterator:
@@ -16,7 +18,10 @@ class InfiniteScrollIterator:
         custom_driver: CustomDriverProtocol,
         css_selector: str | None,
         timeout_s: float,
+        listing_extractor: ListingExtractor,
         limit: int | None = 20,
+        page_waiter: PageWaiter | None = None,
+        watermark: SourceWatermark | None = None,
     ):
 
         self.wait = WebDriverWait(custom_driver.driver, timeout=timeout_s)
@@ -24,10 +29,33 @@ class InfiniteScrollIterator:
         self.css_selector = css_selector if css_selector and self._selector_exists(css_selector) else None
         self.max_loads = limit
         self.current_load = 0
-        self.html: str = ""
+        self.listing_extractor = listing_extractor
+        self.watermark = watermark
+        self.page_waiter = page_waiter or PageWaiter(
+            custom_driver.driver, listing_extractor.link_selector
+        )
 
     def __iter__(self):
         return self
+
+    def close(self) -> None:
+        """
+        Nothing is loaded ahead while scrolling, for symmetry with PaginationIterator
+        """
+
+    def _unknown_items(self, items: list[ListingItem]) -> list[ListingItem]:
+        """Drop the articles read by the last scrape.
+
+        :param items: Articles added by the last load
+        :return: The articles left, raises StopIteration if all of them were read
+        """
+        if self.watermark is None:
+            return items
+        unknown = self.watermark.unknown_items(items)
+        if unknown is None:
+            logger.info("Reached the articles read by the last scrape")
+            raise StopIteration
+        return unknown
     
     def _selector_exists(self, css_selector: str) -> bool:
         """Check if a CSS selector exists on the page
@@ -41,32 +69,27 @@ class InfiniteScrollIterator:
         except NoSuchElementException:
             return False
 
-    def __next__(self) -> str:
+    def __next__(self) -> list[ListingItem]:
+        """Load more articles.
+
+        Returns:
+            list[ListingItem]: The articles added by this load, the ones loaded
+                before are left out even if the page moved them around
+        """
         if self.max_loads and self.current_load >= self.max_loads:
             raise StopIteration
 
         if self.current_load == 0:
             self.current_load += 1
-            self.html = self.custom_driver.get_html()
-            return self.html
+            return self._unknown_items(
+                self.listing_extractor.new_items_from(self.custom_driver)
+            )
 
         try:
-            last_height = self.custom_driver.driver.execute_script(
-                "return document.body.scrollHeight"
-            )
+            driver = self.custom_driver.driver
+            before = self.page_waiter.get_state()
             # Scroll down to bottom
-            self.custom_driver.driver.execute_script(
-                "window.scrollTo(0, document.body.scrollHeight);"
-            )
-            sleep(1)
-            # Calculate new scroll height and compare with last scroll height
-            new_height = self.custom_driver.driver.execute_script(
-                "return document.body.scrollHeight"
-            )
-
-            # If height didn't change and no load more button, we're at the end
-            if new_height == last_height and self.css_selector is None:
-                raise StopIteration
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
 
             # If there's a load more button, try to click it
             if self.css_selector:
@@ -75,29 +98,29 @@ class InfiniteScrollIterator:
                         EC.element_to_be_clickable((By.CSS_SELECTOR, self.css_selector))
                     )
                     # Scroll to the button and click it
-                    self.custom_driver.driver.execute_script(
+                    driver.execute_script(
                         "arguments[0].scrollIntoView(true);", load_more_button
                     )
-                    sleep(0.5)
+                    before = self.page_waiter.get_state()
                     load_more_button.click()
-                    # Wait for new content to load
-                    sleep(2)
-                    # Get the updated page content
-                    self.current_load += 1
-                    new_html: str = self.custom_driver.get_html()[len(self.html) :]
-                    self.html += new_html
-                    return new_html
                 except (TimeoutException, NoSuchElementException):
                     logger.debug("No more 'Load More' button found")
                     raise StopIteration
-            else:
-                # If we're just scrolling without a button and content loaded
-                if new_height > last_height:
-                    self.current_load += 1
-                    return self.custom_driver.get_html()
-                else:
-                    raise StopIteration
 
+            # Wait for new content to load, if nothing came we're at the end
+            if not self.page_waiter.wait_for_change(before):
+                logger.debug("No new content loaded")
+                raise StopIteration
+
+            # Get the articles added to the page
+            self.custom_driver.collect_resource_stats()
+            self.current_load += 1
+            return self._unknown_items(
+                self.listing_extractor.new_items_from(self.custom_driver)
+            )
+
+        except StopIteration:
+            raise
         except Exception as e:
             logger.error(f"Error during infinite scrolling: {str(e)}")
             raise StopIteration
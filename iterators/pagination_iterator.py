@@ -1,5 +1,21 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from dtypes.listing_item import ListingItem
 from protocols.custom_driver_protocol import CustomDriverProtocol
+from settings import PAGINATION_PREFETCH_PAGES
+from utils.host_limiter import HostLimiter
+from utils.http_client import HttpClient
+from utils.listing_extractor import ListingExtractor
 from utils.logger import logger
+from utils.page_url_pattern import PageUrlPattern
+from utils.page_waiter import PageWaiter
+from utils.source_watermark import SourceWatermark
+
+# Shared by every listing, each iterator cancels its prefetches once it stops
+_prefetch_executor = ThreadPoolExecutor(max_workers=PAGINATION_PREFETCH_PAGES)
 
 
 class PaginationIterator:
@@ -8,29 +24,134 @@ class PaginationIterator:
         driver: CustomDriverProtocol,
         css_selector: str,
         timeout_s: float,
+        listing_extractor: ListingExtractor,
         limit: int | None = 20,
+        page_waiter: PageWaiter | None = None,
+        watermark: SourceWatermark | None = None,
     ) -> None:
         self.currentPage = 1
         self.limit = limit
         self.driver = driver
         self.timeout_s = timeout_s
         self.css_selector = css_selector
+        self.listing_extractor = listing_extractor
+        self.watermark = watermark
+        self.page_waiter = page_waiter or PageWaiter(
+            driver.driver, listing_extractor.link_selector
+        )
+
+        # Set when the next button links to page URLs, pages are then loaded
+        # directly, over HTTP while the listing is in the HTML
+        self.page_url_pattern: PageUrlPattern | None = None
+        self.use_http = True
+        self._prefetched: dict[int, Future[str | None]] = {}
+
+    def __next__(self) -> list[ListingItem]:
+        try:
+            return self._next()
+        except BaseException:
+            self.close()
+            raise
+
+    def __iter__(self):
+        return self
+
+    def close(self) -> None:
+        """
+        Cancel the pages prefetched for loads that won't happen
+        """
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
 
-    def __next__(self) -> str:
+    def _next(self) -> list[ListingItem]:
         if self.limit and self.currentPage > self.limit:
             raise StopIteration
 
+        if self.currentPage == 2:
+            self.page_url_pattern = self._detect_page_url_pattern()
+
+        if self.page_url_pattern is not None:
+            items = self._load_page_url(self.currentPage)
+            self.currentPage += 1
+            if not items:
+                # Past the last page, or redirected to a page already seen
+                raise StopIteration
+            return self._unknown_items(items)
+
         if self.currentPage > 1:
             try:
                 logger.debug(f"Navigating to page {self.currentPage}")
-                self.driver.nextPage(self.css_selector, self.timeout_s)
+                self.driver.nextPage(
+                    self.css_selector, self.timeout_s, self.page_waiter
+                )
             except StopIteration:
                 raise StopIteration
+            self.driver.collect_resource_stats()
 
-        html = self.driver.get_html()
         self.currentPage += 1
 
-        return html
+        # Articles pinned on every page are only returned once
+        return self._unknown_items(self.listing_extractor.new_items_from(self.driver))
 
-    def __iter__(self):
-        return self
+    def _unknown_items(self, items: list[ListingItem]) -> list[ListingItem]:
+        if self.watermark is None:
+            return items
+        unknown = self.watermark.unknown_items(items)
+        if unknown is None:
+            logger.info(f"Page {self.currentPage - 1} was read by the last scrape")
+            raise StopIteration
+        return unknown
+
+    def _detect_page_url_pattern(self) -> PageUrlPattern | None:
+        try:
+            next_button = self.driver.driver.find_element(
+                By.CSS_SELECTOR, self.css_selector
+            )
+            pattern = PageUrlPattern.detect(
+                self.driver.driver.current_url,
+                next_button.get_attribute("href"),
+                next_page=2,
+            )
+        except WebDriverException:
+            return None
+
+        if pattern is not None:
+            logger.info(f"Loading the next pages by URL: {pattern.url_for(2)}")
+        return pattern
+
+    def _load_page_url(self, page: int) -> list[ListingItem]:
+        assert self.page_url_pattern is not None
+        url = self.page_url_pattern.url_for(page)
+
+        if self.use_http:
+            self._prefetch(page)
+            html = self._prefetched.pop(page).result()
+            items = self.listing_extractor.extract(html) if html else []
+            if items:
+                return self.listing_extractor.remember(items)
+
+            # The articles are rendered by scripts, or HTTP is refused
+            logger.info(f"No articles in the HTML of {url}, using the browser")
+            self.use_http = False
+            self.close()
+
+        self.driver.get(url)
+        return self.listing_extractor.new_items_from(self.driver)
+
+    def _prefetch(self, page: int) -> None:
+        last_page = page + PAGINATION_PREFETCH_PAGES - 1
+        if self.limit:
+            last_page = min(last_page, self.limit)
+
+        assert self.page_url_pattern is not None
+        for next_page in range(page, last_page + 1):
+            if next_page not in self._prefetched:
+                self._prefetched[next_page] = _prefetch_executor.submit(
+                    __class__._get_html, self.page_url_pattern.url_for(next_page)
+                )
+
+    @staticmethod
+    def _get_html(url: str) -> str | None:
+        with HostLimiter.acquire(url):
+            return HttpClient.get_html(url)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class FetchMode(Enum):
+    HTTP = "http"
+    BROWSER = "browser"
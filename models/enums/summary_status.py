@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class SummaryStatus(Enum):
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
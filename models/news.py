@@ -1,3 +1,4 @@
+from models.enums.summary_status import SummaryStatus
 from utils.checker import Checker
 
 
@@ -12,6 +13,9 @@ class NewsAdd:
         postDate: str | None,
         categoryId: int | None,
         imageUrl: str | None,
+        simhash: int | None = None,
+        canonicalId: int | None = None,
+        summaryStatus: SummaryStatus = SummaryStatus.DONE,
     ) -> None:
         if Checker.is_date(title):
             raise ValueError("Title cannot be a date")
@@ -34,3 +38,6 @@ class NewsAdd:
         self.postDate = postDate
         self.categoryId = categoryId
         self.imageUrl = imageUrl
+        self.simhash = simhash  # Fingerprint of the scraped body
+        self.canonicalId = canonicalId  # Article this one duplicates
+        self.summaryStatus = summaryStatus  # PENDING while body is the scraped text
@@ -1,3 +1,7 @@
+from dtypes.watermark_dict import WatermarkDict
+from models.enums.fetch_mode import FetchMode
+
+
 class Source:
 
     def __init__(
@@ -9,6 +13,9 @@ class Source:
         triggerAi: bool,
         createdAt: str,
         updateAt: str | None,
+        fetchMode: FetchMode | None = None,
+        waitTimeoutS: float | None = None,
+        watermark: WatermarkDict | None = None,
     ):
         self.id = id
         self.url = url
@@ -17,6 +24,9 @@ class Source:
         self.triggerAi = triggerAi
         self.createdAt = createdAt
         self.updatedAt = updateAt
+        self.fetchMode = fetchMode
+        self.waitTimeoutS = waitTimeoutS
+        self.watermark = watermark
 
 class SourceUpdate:
     def __init__(
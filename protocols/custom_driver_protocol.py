@@ -1,5 +1,7 @@
 from selenium.webdriver.edge.webdriver import WebDriver
 
+from utils.page_waiter import PageWaiter
+
 
 from typing import Protocol
 
@@ -7,9 +9,14 @@ from typing import Protocol
 class CustomDriverProtocol(Protocol):
     driver: WebDriver
 
+    def get(self, url: str) -> None: ...
+    def use_source(self, source_url: str | None) -> None: ...
+    def collect_resource_stats(self) -> None: ...
     def get_html(self) -> str: ...
+    def wait_until_loaded(self) -> bool: ...
     def nextPage(
         self,
         css_selector: str,
         timeout_s: float,
+        page_waiter: PageWaiter | None = None,
     ) -> None: ...
@@ -0,0 +1,47 @@
+from config.async_db import AsyncDatabaseConfig
+from models.author import Author
+
+
+class AsyncAuthorRepository:
+    """
+    asyncpg counterpart of AuthorRepository used by the asyncio scrape engine
+    """
+
+    def __init__(
+        self,
+        db_config: AsyncDatabaseConfig,
+    ) -> None:
+        """
+        Initialize AsyncAuthorRepository
+
+        :param db_config: Opened AsyncDatabaseConfig instance
+        """
+        self.db_config = db_config
+
+    async def get_or_create_author(self, author: Author) -> int:
+        """
+        Get or create an author in the database
+
+        :param author: Author to look up
+        :return: ID of the existing or newly created author
+        """
+        if author.name is None:
+            author.name = "Unknown"
+
+        pool = self.db_config.get_pool()
+        author_id = await pool.fetchval(
+            "SELECT id FROM authors WHERE name = $1", author.name
+        )
+        if author_id is not None:
+            return author_id
+
+        return await pool.fetchval(
+            """
+            INSERT INTO authors (name, url)
+            VALUES ($1, $2)
+            ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
+            RETURNING id
+            """,
+            author.name,
+            author.url,
+        )
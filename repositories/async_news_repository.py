@@ -0,0 +1,100 @@
+import pytz
+
+from config.async_db import AsyncDatabaseConfig
+from models.news import NewsAdd
+from utils.checker import Checker
+from utils.logger import logger
+from utils.simhash import SimHash
+
+
+class AsyncNewsRepository:
+    """
+    asyncpg counterpart of NewsRepository used by the asyncio scrape engine
+    """
+
+    def __init__(
+        self,
+        db_config: AsyncDatabaseConfig,
+    ) -> None:
+        """
+        Initialize AsyncNewsRepository
+
+        :param db_config: Opened AsyncDatabaseConfig instance
+        """
+        self.db_config = db_config
+
+    async def get_summary(self, id: int) -> tuple[str, int | None] | None:
+        """
+        Retrieve the summarized body and category of a news article
+
+        :param id: News ID
+        :return: (body, category ID), None if the article was deleted or isn't
+            summarized yet
+        """
+        row = await self.db_config.get_pool().fetchrow(
+            "SELECT body, categoryId FROM news WHERE id = $1 AND summaryStatus = 'done'",
+            id,
+        )
+        return (row["body"], row["categoryid"]) if row else None
+
+    async def add_news(
+        self,
+        data: NewsAdd,
+    ) -> int:
+        """
+        Add a new news article to the database
+
+        :param data: NewsAdd containing news data
+        :return: ID of the inserted or updated article
+        """
+        query = """
+            INSERT INTO news (
+                sourceId,
+                categoryId,
+                title,
+                url,
+                authorId,
+                body,
+                postDate,
+                imageUrl,
+                simhash,
+                canonicalId,
+                summaryStatus,
+                createdAt
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, CURRENT_TIMESTAMP
+            ) ON CONFLICT (url) DO UPDATE SET
+                body = EXCLUDED.body,
+                simhash = EXCLUDED.simhash,
+                summaryStatus = EXCLUDED.summaryStatus,
+                canonicalId = EXCLUDED.canonicalId,
+                categoryId = EXCLUDED.categoryId
+            RETURNING id
+        """
+
+        date = Checker.get_date(data.postDate or "", source_key=data.sourceId)
+        if date is None:
+            logger.info(f"Could not parse date: {data.postDate}")
+        elif date.tzinfo is None:
+            date = date.replace(tzinfo=pytz.UTC)
+
+        try:
+            news_id: int = await self.db_config.get_pool().fetchval(
+                query,
+                data.sourceId,
+                data.categoryId,
+                data.title,
+                data.url,
+                data.authorId,
+                data.body,
+                date,
+                data.imageUrl,
+                SimHash.to_signed(data.simhash) if data.simhash is not None else None,
+                data.canonicalId,
+                data.summaryStatus.value,
+            )
+            logger.info(f"Successfully inserted news article: {data.url}")
+            return news_id
+        except Exception as e:
+            logger.error(f"Failed to insert news article: {str(e)}")
+            raise
@@ -1,8 +1,13 @@
+import threading
+
 from config.db import DatabaseConfig
 from models.category import Category
 
 
 class CategoryRepository:
+    # Category IDs never change once created, so they're cached for the whole process
+    _category_ids: dict[str, int] | None = None
+    _cache_lock = threading.Lock()
 
     def __init__(
         self,
@@ -42,3 +47,34 @@ class CategoryRepository:
                 cursor.execute(query, (category_name,))
                 conn.commit()
                 return cursor.fetchone()[0]
+
+    def get_categories(self) -> dict[str, int]:
+        """
+        Get every category from the database
+
+        :return: Category IDs by category name
+        """
+        query = "SELECT id, name FROM categories"
+        with self.db_config.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                return {name: id for id, name in cursor.fetchall()}
+
+    def get_category_id(self, category_name: str) -> int:
+        """
+        Get the ID of a category from the in-process cache, the categories are
+        loaded once and only unknown categories hit the database
+
+        :param category_name: Category's name
+        :return: ID of the existing or newly created category
+        """
+        with __class__._cache_lock:
+            if __class__._category_ids is None:
+                __class__._category_ids = self.get_categories()
+
+            category_id = __class__._category_ids.get(category_name)
+            if category_id is None:
+                category_id = self.get_or_create_category(category_name)
+                __class__._category_ids[category_name] = category_id
+
+            return category_id
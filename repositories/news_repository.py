@@ -1,9 +1,11 @@
 import datetime
 
 from config.db import DatabaseConfig
+from models.enums.summary_status import SummaryStatus
 from models.news import NewsAdd
 from utils.checker import Checker
 from utils.logger import logger
+from utils.simhash import SimHash
 
 
 class NewsRepository:
@@ -21,15 +23,124 @@ class NewsRepository:
         """
         self.db_config = DatabaseConfig()
 
+    def get_urls(self) -> list[str]:
+        """
+        Retrieve the URLs of every stored news article
+
+        :return: List of article URLs
+        """
+        query = """
+            SELECT url FROM news
+        """
+        try:
+            with self.db_config.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query)
+                    return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Failed to retrieve news URLs: {str(e)}")
+            raise
+
+    def get_fingerprints(self) -> list[tuple[int, int]]:
+        """
+        Retrieve the body fingerprints of the articles that duplicate no other
+
+        :return: List of (news ID, unsigned SimHash) tuples
+        """
+        query = """
+            SELECT id, simhash FROM news
+            WHERE simhash IS NOT NULL AND canonicalId IS NULL
+        """
+        try:
+            with self.db_config.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query)
+                    return [
+                        (row[0], SimHash.from_signed(row[1]))
+                        for row in cursor.fetchall()
+                    ]
+        except Exception as e:
+            logger.error(f"Failed to retrieve news fingerprints: {str(e)}")
+            raise
+
+    def get_summary(self, id: int) -> tuple[str, int | None] | None:
+        """
+        Retrieve the summarized body and category of a news article
+
+        :param id: News ID
+        :return: (body, category ID), None if the article was deleted or isn't
+            summarized yet
+        """
+        query = """
+            SELECT body, categoryId FROM news
+            WHERE id = %s AND summaryStatus = 'done'
+        """
+        try:
+            with self.db_config.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, (id,))
+                    row = cursor.fetchone()
+                    return (row[0], row[1]) if row else None
+        except Exception as e:
+            logger.error(f"Failed to retrieve news summary: {str(e)}")
+            raise
+
+    def get_pending_summaries(self) -> list[tuple[int, str, str | None]]:
+        """
+        Retrieve the articles stored before their summary was generated
+
+        :return: List of (news ID, scraped body, image URL) tuples
+        """
+        query = """
+            SELECT id, body, imageUrl FROM news
+            WHERE summaryStatus = 'pending'
+            ORDER BY id
+        """
+        try:
+            with self.db_config.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query)
+                    return [(row[0], row[1], row[2]) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Failed to retrieve pending summaries: {str(e)}")
+            raise
+
+    def set_summary(
+        self,
+        id: int,
+        body: str | None,
+        status: SummaryStatus,
+    ) -> None:
+        """
+        Store the summary of an article, or mark its summary as failed
+
+        :param id: News ID
+        :param body: Summarized HTML body, None to keep the scraped body
+        :param status: New summary status
+        """
+        query = """
+            UPDATE news
+            SET body = COALESCE(%s, body), summaryStatus = %s
+            WHERE id = %s
+        """
+        try:
+            with self.db_config.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, (body, status.value, id))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to store the summary of news {id}: {str(e)}")
+            raise
+
     def add_news(
         self,
         data: NewsAdd,
-    ) -> None:
+    ) -> int:
         """
         Add a new news article to the database
 
-        :param source_id: ID of the source this news belongs to
-        :param data: NewsAddRequest containing news data
+        :param data: NewsAdd containing news data
+        :return: ID of the inserted or updated article
         """
         query = """
             INSERT INTO news (
@@ -41,14 +152,23 @@ class NewsRepository:
                 body,
                 postDate,
                 imageUrl,
+                simhash,
+                canonicalId,
+                summaryStatus,
                 createdAt
             ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP
-            ) ON CONFLICT (url) DO UPDATE SET body = EXCLUDED.body
+                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP
+            ) ON CONFLICT (url) DO UPDATE SET
+                body = EXCLUDED.body,
+                simhash = EXCLUDED.simhash,
+                summaryStatus = EXCLUDED.summaryStatus,
+                canonicalId = EXCLUDED.canonicalId,
+                categoryId = EXCLUDED.categoryId
+            RETURNING id
         """
 
         # Convert post_date from string to datetime if it exists
-        date = Checker.get_date(data.postDate or '')
+        date = Checker.get_date(data.postDate or '', source_key=data.sourceId)
         if date is None:
             logger.info(f"Could not parse date: {data.postDate}")
         params = (
@@ -60,6 +180,9 @@ class NewsRepository:
             data.body,
             date,
             data.imageUrl,
+            SimHash.to_signed(data.simhash) if data.simhash is not None else None,
+            data.canonicalId,
+            data.summaryStatus.value,
         )
 
         logger.info(f"Preparing to insert news article with params: {params}")
@@ -69,8 +192,10 @@ class NewsRepository:
                 try:
                     logger.info("Executing SQL query to insert news article")
                     cursor.execute(query, params)
+                    news_id: int = cursor.fetchone()[0]
                     conn.commit()
                     logger.info("Successfully inserted news article")
+                    return news_id
                 except Exception as e:
                     logger.error(f"Failed to insert news article: {str(e)}")
                     raise
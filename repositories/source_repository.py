@@ -4,6 +4,8 @@ from psycopg2.extras import Json
 
 from config.db import DatabaseConfig
 from dtypes.selector import Selector
+from dtypes.watermark_dict import WatermarkDict
+from models.enums.fetch_mode import FetchMode
 from models.enums.scrape_status import ScrapeStatus
 from models.source import Source, SourceUpdate
 from protos.source_pb2 import SourceRequest
@@ -61,7 +63,8 @@ class SourceRepository:
         :return: List of Source objects
         """
         select_query = """
-        SELECT id, url, selector, triggerAfrica, triggerAi, createdAt, updatedAt
+        SELECT id, url, selector, triggerAfrica, triggerAi, createdAt, updatedAt, fetchMode,
+            waitTimeoutS, watermark
         FROM sources
         """
         try:
@@ -81,6 +84,9 @@ class SourceRepository:
                         triggerAi=row[4],
                         createdAt=row[5].isoformat(),
                         updateAt=row[6].isoformat() if row[6] else None,
+                        fetchMode=FetchMode(row[7]) if row[7] else None,
+                        waitTimeoutS=row[8],
+                        watermark=row[9],
                     )
                     sources.append(source)
                 return sources
@@ -115,6 +121,87 @@ class SourceRepository:
             raise
                 
 
+    def set_fetch_mode(self, id: int, fetch_mode: FetchMode) -> None:
+        """
+        Remember how the article pages of a source should be fetched
+
+        :param id: Source ID to update
+        :param fetch_mode: FetchMode enum value to set
+        """
+        update_query = """
+        UPDATE sources
+        SET fetchMode = %s
+        WHERE id = %s
+        """
+        try:
+            with self.db_config.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        update_query,
+                        (fetch_mode.value, id),
+                    )
+                conn.commit()
+                logger.info(
+                    f"Fetch mode updated to {fetch_mode.value} for source ID: {id}"
+                )
+        except Exception as e:
+            logger.error(f"Error updating fetch mode: {e}")
+            raise
+
+    def set_wait_timeout(self, id: int, wait_timeout_s: float) -> None:
+        """
+        Remember how long the listing pages of a source take to load more content
+
+        :param id: Source ID to update
+        :param wait_timeout_s: Timeout learned for the page waits, in seconds
+        """
+        update_query = """
+        UPDATE sources
+        SET waitTimeoutS = %s
+        WHERE id = %s
+        """
+        try:
+            with self.db_config.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        update_query,
+                        (wait_timeout_s, id),
+                    )
+                conn.commit()
+                logger.info(
+                    f"Wait timeout updated to {wait_timeout_s:.1f}s for source ID: {id}"
+                )
+        except Exception as e:
+            logger.error(f"Error updating wait timeout: {e}")
+            raise
+
+    def set_watermark(self, id: int, watermark: WatermarkDict) -> None:
+        """
+        Remember the newest articles of a source, the next scrape stops on them
+
+        :param id: Source ID to update
+        :param watermark: Listing URLs and newest post date of the last scrape
+        """
+        update_query = """
+        UPDATE sources
+        SET watermark = %s
+        WHERE id = %s
+        """
+        try:
+            with self.db_config.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        update_query,
+                        (Json(watermark), id),
+                    )
+                conn.commit()
+                logger.info(
+                    f"Watermark updated with {len(watermark['urls'])} URLs for source ID: {id}"
+                )
+        except Exception as e:
+            logger.error(f"Error updating watermark: {e}")
+            raise
+
     def get_source(self, id: int) -> Source:
         """
         Retrieve a single source by ID from the database
@@ -123,7 +210,8 @@ class SourceRepository:
         :return: Source object
         """
         select_query = """
-        SELECT id, url, selector, triggerAfrica, triggerAi, createdAt, updatedAt
+        SELECT id, url, selector, triggerAfrica, triggerAi, createdAt, updatedAt, fetchMode,
+            waitTimeoutS, watermark
         FROM sources
         WHERE id = %s
         """
@@ -141,6 +229,9 @@ class SourceRepository:
                             triggerAi=row[4],
                             createdAt=row[5].isoformat(),
                             updateAt=row[6].isoformat() if row[6] else None,
+                            fetchMode=FetchMode(row[7]) if row[7] else None,
+                            waitTimeoutS=row[8],
+                            watermark=row[9],
                         )
                     raise ValueError(f"Source with ID {id} not found")
         except Exception as e:
@@ -201,7 +292,8 @@ class SourceRepository:
             triggerAfrica = EXCLUDED.triggerAfrica, 
             triggerAi = EXCLUDED.triggerAi,
             createdAt = CURRENT_TIMESTAMP,
-            status = EXCLUDED.status
+            status = EXCLUDED.status,
+            fetchMode = NULL
         RETURNING id
         """
         try:
@@ -0,0 +1,529 @@
+import asyncio
+import datetime
+from typing import Awaitable, Callable
+
+import aiohttp
+import pytz
+
+from ai.llm import Llm
+from ai.llm_cache import LlmCache
+from ai.rate_limiter import LlmRateLimiter
+from ai.prompt import Prompt, PromptType
+from config.async_db import AsyncDatabaseConfig
+from constants import SUMMARY_PROMPT_PATH
+from dtypes.listing_item import ListingItem
+from dtypes.page_content import PageContent
+from dtypes.selector import Selector
+from iterators.infinite_scrolling_iterator import InfiniteScrollIterator
+from iterators.pagination_iterator import PaginationIterator
+from models.author import Author
+from models.enums.fetch_mode import FetchMode
+from models.enums.scrape_status import ScrapeStatus
+from models.news import NewsAdd
+from models.source import Source
+from repositories.async_author_repository import AsyncAuthorRepository
+from repositories.async_news_repository import AsyncNewsRepository
+from repositories.news_repository import NewsRepository
+from repositories.source_repository import SourceRepository
+from services.news_service import NewsService
+from services.statistics_service import StatisticsService
+from services.summary_service import SummaryService
+from settings import (
+    ASYNC_FETCH_CONCURRENCY,
+    ASYNC_QUEUE_SIZE,
+    ASYNC_SOURCE_CONCURRENCY,
+    ASYNC_SUMMARY_CONCURRENCY,
+    ASYNC_WRITE_CONCURRENCY,
+    HTTP_TIMEOUT_S,
+    LAST_FETCH_DATE,
+    PER_HOST_CONCURRENCY,
+)
+from utils.checker import Checker
+from utils.custom_driver import CustomDriver
+from utils.custom_soup import CustomSoup
+from utils.driver_pool import DriverPool
+from utils.duplicate_index import DuplicateIndex
+from utils.fetch_engine import FetchEngine
+from utils.http_client import HttpClient
+from utils.listing_extractor import ListingExtractor
+from utils.logger import logger
+from utils.page_waiter import PageWaiter
+from utils.resource_blocker import ResourceStats
+from utils.seen_url_index import SeenUrlIndex
+from utils.source_watermark import SourceWatermark
+
+
+class SourceRun:
+    """
+    Progress of a single source through the pipeline stages
+    """
+
+    def __init__(self, source: Source) -> None:
+        self.source = source
+        self.selector: Selector = source.selector  # type: ignore
+        self.pending = 0  # Articles still moving through the stages
+        self.is_listing_done = False
+        self.is_stopped = False  # Reached articles older than the last scrape
+        self.is_failed = False
+        self.watermark = SourceWatermark(source.watermark)
+        self.queued_urls: set[str] = set()  # Kept across the retries of the listing
+
+
+class ArticleJob:
+    """
+    An article moving from the fetch stage to the write stage
+    """
+
+    def __init__(self, run: SourceRun, title: str, url: str) -> None:
+        self.run = run
+        self.title = title
+        self.url = url
+        self.news: NewsAdd | None = None
+        self.author: Author | None = None
+
+
+class AsyncScrapeService:
+    """
+    asyncio scrape engine: sources, article fetches, summaries and database
+    writes run as separate bounded stages so their I/O waits overlap
+    """
+
+    def __init__(
+        self,
+        article_filter: Callable[[str, bool, bool], bool],
+        refresh_source: Callable[[Source], object],
+    ) -> None:
+        """
+        :param article_filter: Tells if a title should be scraped, given the
+            source Africa and AI trigger flags
+        :param refresh_source: Regenerates the selectors of an outdated source
+        """
+        self.article_filter = article_filter
+        self.refresh_source = refresh_source
+        self.source_repository = SourceRepository()
+        self.fetch_engine = FetchEngine()
+        self.news_service = NewsService()
+        self.driver_pool = DriverPool()
+        self.llm = Llm()
+
+    def scrape(self) -> None:
+        asyncio.run(self._scrape())
+
+    async def _scrape(self) -> None:
+        self.driver_pool.open()
+        await asyncio.to_thread(StatisticsService().get_stats)
+        sources = await asyncio.to_thread(self.source_repository.get_sources)
+        await asyncio.to_thread(SeenUrlIndex.warm, NewsRepository().get_urls)
+        await asyncio.to_thread(DuplicateIndex.warm, NewsRepository().get_fingerprints)
+        # Articles left pending by an interrupted threading run
+        await asyncio.to_thread(SummaryService().resume)
+
+        source_queue: asyncio.Queue[Source] = asyncio.Queue()
+        fetch_queue: asyncio.Queue[ArticleJob] = asyncio.Queue(ASYNC_QUEUE_SIZE)
+        summary_queue: asyncio.Queue[ArticleJob] = asyncio.Queue(ASYNC_QUEUE_SIZE)
+        write_queue: asyncio.Queue[ArticleJob] = asyncio.Queue(ASYNC_QUEUE_SIZE)
+
+        for source in sources:
+            source_queue.put_nowait(source)
+
+        connector = aiohttp.TCPConnector(
+            limit=ASYNC_FETCH_CONCURRENCY,
+            limit_per_host=PER_HOST_CONCURRENCY,
+        )
+        async with AsyncDatabaseConfig() as db_config, aiohttp.ClientSession(
+            connector=connector,
+            headers=HttpClient.HEADERS,
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_S),
+        ) as session:
+            self.news_repository = AsyncNewsRepository(db_config)
+            self.author_repository = AsyncAuthorRepository(db_config)
+
+            stages = [
+                self._source_stage(source_queue, fetch_queue)
+                for _ in range(ASYNC_SOURCE_CONCURRENCY)
+            ]
+            stages += [
+                self._stage(
+                    fetch_queue,
+                    lambda job: self._fetch_article(session, job),
+                    summary_queue,
+                )
+                for _ in range(ASYNC_FETCH_CONCURRENCY)
+            ]
+            stages += [
+                self._stage(summary_queue, self._summarize_article, write_queue)
+                for _ in range(ASYNC_SUMMARY_CONCURRENCY)
+            ]
+            stages += [
+                self._stage(write_queue, self._write_article, None)
+                for _ in range(ASYNC_WRITE_CONCURRENCY)
+            ]
+            tasks = [asyncio.create_task(stage) for stage in stages]
+
+            # Each stage hands its items to the next one before marking them
+            # done, so joining the queues in order drains the whole pipeline
+            for stage_queue in (source_queue, fetch_queue, summary_queue, write_queue):
+                await stage_queue.join()
+
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Browsers are only reused within a run, don't keep them idle between runs
+        await asyncio.to_thread(self.driver_pool.close)
+        await asyncio.to_thread(SummaryService().close)
+        ResourceStats.report()
+        SeenUrlIndex.report()
+        DuplicateIndex.report()
+        LlmCache.report()
+        LlmRateLimiter.report()
+
+    async def _source_stage(
+        self,
+        source_queue: asyncio.Queue[Source],
+        fetch_queue: asyncio.Queue[ArticleJob],
+    ) -> None:
+        while True:
+            source = await source_queue.get()
+            try:
+                await self._handle_source(source, fetch_queue)
+            except Exception as e:
+                logger.error(
+                    f"Error scraping source {source.url}: {str(e)}", exc_info=True
+                )
+            finally:
+                source_queue.task_done()
+
+    async def _stage(
+        self,
+        in_queue: asyncio.Queue[ArticleJob],
+        handler: Callable[[ArticleJob], Awaitable[ArticleJob | None]],
+        out_queue: asyncio.Queue[ArticleJob] | None,
+    ) -> None:
+        while True:
+            item = await in_queue.get()
+            try:
+                result = await handler(item)
+                if out_queue is not None and result is not None:
+                    await out_queue.put(result)
+                else:
+                    await self._finish_article(item)
+            except Exception as e:
+                logger.error(f"Error handling {item.url}: {str(e)}", exc_info=True)
+                await self._finish_article(item)
+            finally:
+                in_queue.task_done()
+
+    async def _handle_source(
+        self,
+        source: Source,
+        fetch_queue: asyncio.Queue[ArticleJob],
+    ) -> None:
+        run = SourceRun(source)
+        await asyncio.to_thread(
+            self.source_repository.set_status, source.id, ScrapeStatus.FETCHING
+        )
+
+        MAX_RETRIES = 3
+        for i in range(MAX_RETRIES):
+            try:
+                if i > 0:
+                    # The selectors may have been refreshed by a failed article
+                    run.source = await asyncio.to_thread(
+                        self.source_repository.get_source, source.id
+                    )
+                    run.selector = run.source.selector  # type: ignore
+
+                await self._handle_listing(run, fetch_queue)
+                break
+            except Exception as e:
+                logger.error(
+                    f"Unexpected error scraping source {source.url} "
+                    f"(attempt {i + 1}/{MAX_RETRIES}): {str(e)}",
+                    exc_info=True,
+                )
+        else:
+            run.is_failed = True
+
+        run.is_listing_done = True
+        await self._finish_source(run)
+
+    async def _handle_listing(
+        self,
+        run: SourceRun,
+        fetch_queue: asyncio.Queue[ArticleJob],
+    ) -> None:
+        driver: CustomDriver | None = None
+        iterator: InfiniteScrollIterator | PaginationIterator | None = None
+        try:
+            driver = await asyncio.to_thread(self.driver_pool.acquire)
+            driver.use_source(run.source.url)
+            await asyncio.to_thread(driver.get, run.source.url)
+            iterator = await asyncio.to_thread(self._create_iterator, driver, run)
+
+            while not (run.is_stopped or run.is_failed):
+                listing_items = await asyncio.to_thread(next, iterator, None)
+                if listing_items is None:
+                    break
+
+                articles = self._select_articles(run, listing_items)
+                for title, news_url in articles:
+                    run.pending += 1
+                    # Queue full means the later stages are behind, wait for them
+                    await fetch_queue.put(ArticleJob(run, title, news_url))
+
+            wait_timeout_s = iterator.page_waiter.learned_timeout_s()
+            if wait_timeout_s is not None:
+                await asyncio.to_thread(
+                    self.source_repository.set_wait_timeout,
+                    run.source.id,
+                    wait_timeout_s,
+                )
+        finally:
+            if iterator is not None:
+                iterator.close()
+            if driver is not None:
+                await asyncio.to_thread(self.driver_pool.release, driver)
+
+    def _create_iterator(
+        self,
+        driver: CustomDriver,
+        run: SourceRun,
+    ) -> InfiniteScrollIterator | PaginationIterator:
+        timeout_s: float = 10
+        listing_extractor = ListingExtractor(run.selector["title"], run.selector["link"])
+        page_waiter = PageWaiter(
+            driver.driver, run.selector["link"], run.source.waitTimeoutS
+        )
+        next_button_selector = run.selector["next_button"]
+        if next_button_selector is None:
+            return InfiniteScrollIterator(
+                custom_driver=driver,
+                css_selector=str(run.selector["load_more_button"]),
+                timeout_s=timeout_s,
+                listing_extractor=listing_extractor,
+                limit=None,
+                page_waiter=page_waiter,
+                watermark=run.watermark,
+            )
+        return PaginationIterator(
+            driver=driver,
+            css_selector=str(next_button_selector),
+            timeout_s=timeout_s,
+            listing_extractor=listing_extractor,
+            limit=None,
+            page_waiter=page_waiter,
+            watermark=run.watermark,
+        )
+
+    def _select_articles(
+        self,
+        run: SourceRun,
+        listing_items: list[ListingItem],
+    ) -> list[tuple[str, str]]:
+        articles: list[tuple[str, str]] = []
+        for item in listing_items:
+            if self.article_filter(
+                item["title"], run.source.triggerAfrica, run.source.triggerAi
+            ):
+                news_url = CustomSoup.resolve_relative_url(run.source.url, item["href"])
+                if news_url in run.queued_urls:
+                    continue  # Listed again by a retry of the source
+                if SeenUrlIndex.contains(news_url):
+                    logger.info(f"Already stored, skipping: {news_url}")
+                    SeenUrlIndex.record_skipped()
+                    if run.watermark.is_empty:
+                        # Without a watermark the first stored article ends the
+                        # listing, as the last fetch date used to
+                        logger.info(
+                            f"Reached the articles already stored of {run.source.url}"
+                        )
+                        run.is_stopped = True
+                        break
+                    continue
+                articles.append((item["title"], news_url))
+                run.queued_urls.add(news_url)
+        return articles
+
+    async def _fetch_article(
+        self,
+        session: aiohttp.ClientSession,
+        job: ArticleJob,
+    ) -> ArticleJob | None:
+        run = job.run
+        if run.is_stopped or run.is_failed:
+            return None
+
+        soup: CustomSoup | None = None
+        if FetchEngine.should_try_http(run.source):
+            html = await self._get_html(session, job.url)
+            if html is not None:
+                soup = await asyncio.to_thread(CustomSoup, html)
+                if FetchEngine.selectors_match(soup, run.selector, job.url):
+                    await asyncio.to_thread(
+                        self.fetch_engine.remember, run.source, FetchMode.HTTP
+                    )
+                else:
+                    soup = None
+
+        if soup is None:
+            soup = await asyncio.to_thread(
+                self.fetch_engine.get_browser_soup, run.source, job.url, run.selector
+            )
+
+        return await asyncio.to_thread(self._extract_article, job, soup)
+
+    async def _get_html(self, session: aiohttp.ClientSession, url: str) -> str | None:
+        try:
+            async with session.get(url) as response:
+                content_type = response.headers.get("Content-Type", "").lower()
+                if response.status != 200 or "html" not in content_type:
+                    return None
+                return await response.text(errors="replace")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"HTTP fetch failed for {url}: {str(e)}")
+            return None
+
+    def _extract_article(self, job: ArticleJob, soup: CustomSoup) -> ArticleJob | None:
+        run = job.run
+        selector = run.selector
+        base_url = run.source.url
+
+        content = soup.extract(selector, base_url)
+        body = content["body"]
+        post_date = content["post_date"]
+        image_url = content["image_url"]
+
+        if not (body and post_date):
+            self._fail_outdated(run)
+            return None
+
+        date = Checker.get_date(post_date, source_key=run.source.id)
+        if date is None:
+            logger.info(f"Could not parse date: {post_date}")
+            return None
+
+        if run.source.updatedAt and datetime.datetime.fromisoformat(
+            run.source.updatedAt
+        ).replace(tzinfo=pytz.UTC) > date.replace(tzinfo=pytz.UTC):
+            logger.info(
+                f"Stopping {base_url}: article from {date} is older than last update"
+            )
+            run.is_stopped = True
+            return None
+
+        if LAST_FETCH_DATE > date.date():
+            run.is_stopped = True
+            return None
+        run.watermark.record_date(date)
+
+        try:
+            job.news = NewsAdd(
+                authorId=None,
+                title=job.title,
+                url=job.url,
+                sourceId=run.source.id,
+                body=body,
+                postDate=post_date,
+                imageUrl=image_url,
+                categoryId=None,
+            )
+        except ValueError:
+            self._fail_outdated(run)
+            return None
+
+        job.author = self._extract_author(run, content)
+        return job
+
+    def _extract_author(self, run: SourceRun, content: PageContent) -> Author:
+        if run.selector["author"] is None:
+            return Author(name=None, url=None, image_url=None)
+
+        author_name = content["author_name"]
+        author_url = content["author_link"]
+        image_url = content["author_image_url"]
+
+        if (
+            Checker.is_date(author_name)
+            or (author_name and not author_name.strip())
+            or not Checker.is_valid_url(author_url)
+            or not Checker.is_valid_url(image_url)
+        ):
+            logger.warning(f"Invalid author on {run.source.url}, using Unknown")
+            return Author(name=None, url=None, image_url=None)
+
+        return Author(name=author_name, url=author_url, image_url=image_url)
+
+    def _fail_outdated(self, run: SourceRun) -> None:
+        if run.is_failed:
+            return
+        run.is_failed = True
+        logger.error(f"The detail selectors of {run.source.url} are outdated")
+        self.refresh_source(run.source)
+
+    async def _summarize_article(self, job: ArticleJob) -> ArticleJob:
+        news: NewsAdd = job.news  # type: ignore
+        news.simhash = await asyncio.to_thread(DuplicateIndex.fingerprint, news.body)
+        if news.simhash is not None:
+            canonical_id = DuplicateIndex.find(news.simhash)
+            summary = (
+                await self.news_repository.get_summary(canonical_id)
+                if canonical_id is not None
+                else None
+            )
+            if summary is not None:
+                logger.info(f"Near-duplicate of news {canonical_id}, reusing its summary")
+                news.body, news.categoryId = summary
+                news.canonicalId = canonical_id
+                DuplicateIndex.record_reused()
+                return job
+
+        news.categoryId = await asyncio.to_thread(
+            self.news_service.detect_category, news.body
+        )
+
+        response = await self.llm.aprompt(
+            Prompt(
+                content=news.body,
+                template_path=SUMMARY_PROMPT_PATH,
+                type=PromptType.TEXT,
+            )
+        )
+        news.body = NewsService.format_summary(str(response.code), news.imageUrl)
+        return job
+
+    async def _write_article(self, job: ArticleJob) -> None:
+        news: NewsAdd = job.news  # type: ignore
+        news.authorId = await self.author_repository.get_or_create_author(
+            job.author  # type: ignore
+        )
+        news_id = await self.news_repository.add_news(news)
+        SeenUrlIndex.add(news.url)
+        if news.simhash is not None and news.canonicalId is None:
+            DuplicateIndex.add(news.simhash, news_id)
+        logger.info(f"Adding result: {news.title}")
+
+    async def _finish_article(self, job: ArticleJob) -> None:
+        job.run.pending -= 1
+        await self._finish_source(job.run)
+
+    async def _finish_source(self, run: SourceRun) -> None:
+        if not run.is_listing_done or run.pending > 0:
+            return
+
+        source_id = run.source.id
+        if run.is_failed:
+            await asyncio.to_thread(
+                self.source_repository.set_status, source_id, ScrapeStatus.UNAVAILABLE
+            )
+            return
+
+        await asyncio.to_thread(
+            self.source_repository.update_at, source_id, datetime.datetime.now()
+        )
+        await asyncio.to_thread(
+            self.source_repository.set_watermark, source_id, run.watermark.to_dict()
+        )
+        await asyncio.to_thread(
+            self.source_repository.set_status, source_id, ScrapeStatus.AVAILABLE
+        )
@@ -1,9 +1,11 @@
-from constants import TRIGGER_WORDS_CATEGORIES
+from models.enums.summary_status import SummaryStatus
 from models.news import NewsAdd
 from repositories.category_repository import CategoryRepository
 from repositories.news_repository import NewsRepository
+from utils.category_classifier import CategoryClassifier
+from utils.duplicate_index import DuplicateIndex
 from utils.logger import logger
-from utils.summurizer_utils import MultilingualSummarizer
+from utils.seen_url_index import SeenUrlIndex
 
 
 class NewsService:
@@ -14,26 +16,72 @@ class NewsService:
         self.news_repository = NewsRepository()
         self.category_repository = CategoryRepository()
 
-    def add_news(self, news: NewsAdd) -> None:
-        logger.info("Starting category detection for news article")
-        for key, values in TRIGGER_WORDS_CATEGORIES.items():
-            logger.debug(f"Checking category: {key}")
-            for value in values:
-                if value in news.body:
-                    logger.info(f"Found trigger word '{value}' for category '{key}'")
-                    news.categoryId = self.category_repository.get_or_create_category(
-                        key
-                    )
-                    logger.info(f"Assigned category ID: {news.categoryId}")
-                    break
-            if news.categoryId:
-                break
-        if news.categoryId is None:
-            news.categoryId = self.category_repository.get_or_create_category(
-                "Uncategorized"
-            )
-        logger.info("Starting summarization of news article")
-        summary_result = MultilingualSummarizer().summarize(news.body)
+    def add_news(self, news: NewsAdd) -> int:
+        """
+        Store a scraped article, its summary is left pending unless it
+        duplicates an article already summarized
+
+        :param news: The article, with its scraped body
+        :return: ID of the stored article
+        """
+        news.simhash = DuplicateIndex.fingerprint(news.body)
+        if not self.reuse_duplicate_summary(news):
+            news.categoryId = self.detect_category(news.body)
+            news.summaryStatus = SummaryStatus.PENDING
+
+        logger.info("Adding news article to repository")
+        news_id = self.news_repository.add_news(news)
+        SeenUrlIndex.add(news.url)
+        if news.simhash is not None and news.canonicalId is None:
+            DuplicateIndex.add(news.simhash, news_id)
+        logger.info("Successfully added news article")
+        return news_id
+
+    def reuse_duplicate_summary(self, news: NewsAdd) -> bool:
+        """
+        Give a near-duplicate of a stored article the summary and category of
+        that article, instead of summarizing the same story again
+
+        :param news: Article with its scraped body and fingerprint
+        :return: True if the article was linked to a canonical one
+        """
+        if news.simhash is None:
+            return False
+        canonical_id = DuplicateIndex.find(news.simhash)
+        if canonical_id is None:
+            return False
+
+        summary = self.news_repository.get_summary(canonical_id)
+        if summary is None:
+            return False
+
+        logger.info(f"Near-duplicate of news {canonical_id}, reusing its summary")
+        news.body, news.categoryId = summary
+        news.canonicalId = canonical_id
+        DuplicateIndex.record_reused()
+        return True
+
+    def detect_category(self, body: str) -> int:
+        """
+        Get the ID of the category best matching the body
+
+        :param body: Body of the news article
+        :return: ID of the best category, or of "Uncategorized"
+        """
+        category = CategoryClassifier.classify(body)
+        category_id = self.category_repository.get_category_id(category)
+        logger.info(f"Assigned category '{category}' (ID: {category_id})")
+        return category_id
+
+    @staticmethod
+    def format_summary(summary_result: str, image_url: str | None) -> str:
+        """
+        Turn the LLM summary into the HTML body stored for the article
+
+        :param summary_result: Raw summary returned by the LLM
+        :param image_url: Article image, replaces the first [IMAGE HERE] tag
+        :return: The HTML body
+        """
         if "<body>" in summary_result:
             body_start = summary_result.find("<body>") + len("<body>")
             body_end = summary_result.find("</body>")
@@ -42,19 +90,14 @@ class NewsService:
             body_content = summary_result
 
         # Handle [IMAGE HERE] tags
-        if news.imageUrl:
+        if image_url:
             # Replace first [IMAGE HERE] with actual image tag
             body_content = body_content.replace(
                 "[IMAGE HERE]",
-                f'<img class="image-placeholder" src="{news.imageUrl}" />',
+                f'<img class="image-placeholder" src="{image_url}" />',
                 1,
             )
         # Remove any remaining [IMAGE HERE] tags
         body_content = body_content.replace("[IMAGE HERE]", "")
         body_content = body_content.replace('<div class="image-placeholder"></div>', "")
-        news.body = body_content
-        logger.info(f"Summary generated: {news.body[:100]}...")
-
-        logger.info("Adding news article to repository")
-        self.news_repository.add_news(news)
-        logger.info("Successfully added news article")
+        return body_content
@@ -1,7 +1,7 @@
 import pytz
 from models.statistics import Statistics
 from repositories.statistics_repository import StatisticsRepository
-from utils.custom_driver import CustomDriver
+from utils.driver_pool import DriverPool
 from utils.custom_soup import CustomSoup
 from datetime import datetime, timedelta
 
@@ -25,8 +25,6 @@ class StatisticsService:
             stats={},
             updateAt=None,
         )
-        driver: CustomDriver = CustomDriver()
-
         updated_date: str | None = self.statistics_repository.get_updated_date(
             stats.name
         )
@@ -45,29 +43,30 @@ class StatisticsService:
                 return
 
         logger.info("Fetching data from IMF website")
-        driver.get(stats.url)
+        with DriverPool().lease() as driver:
+            driver.get(stats.url)
 
-        html: str = driver.get_html()
-        logger.debug("Successfully retrieved HTML content")
+            html: str = driver.get_html()
+            logger.debug("Successfully retrieved HTML content")
 
-        soup: CustomSoup = CustomSoup(html=html)
+            soup: CustomSoup = CustomSoup(html=html)
 
-        download_link: str | None = soup.select_url(
-            base_url="https://www.imf.org/",
-            css_selector='button.dm-share-button[data-type="excel"]',
-        )
-        if download_link:
-            logger.info("Found Excel download link, downloading file")
-            excel_file = driver.download_file(download_link)
+            download_link: str | None = soup.select_url(
+                base_url="https://www.imf.org/",
+                css_selector='button.dm-share-button[data-type="excel"]',
+            )
+            if download_link:
+                logger.info("Found Excel download link, downloading file")
+                excel_file = driver.download_file(download_link)
 
-            # Read the Excel file into a DataFrame
-            df = pd.read_excel(StringIO(excel_file))
-            logger.debug("Successfully read Excel file into DataFrame")
+                # Read the Excel file into a DataFrame
+                df = pd.read_excel(StringIO(excel_file))
+                logger.debug("Successfully read Excel file into DataFrame")
 
-            # Convert DataFrame to dictionary
-            stats_dict = df.to_dict(orient="records")
-            logger.debug("Converted DataFrame to dictionary")
+                # Convert DataFrame to dictionary
+                stats_dict = df.to_dict(orient="records")
+                logger.debug("Converted DataFrame to dictionary")
 
-            # Update the stats with the dictionary data
-            stats.stats = {"data": stats_dict}
-            logger.info("Successfully updated statistics data")
+                # Update the stats with the dictionary data
+                stats.stats = {"data": stats_dict}
+                logger.info("Successfully updated statistics data")
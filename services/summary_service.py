@@ -0,0 +1,229 @@
+import json
+import queue
+import threading
+import time
+
+from ai.llm import Llm
+from ai.prompt import Prompt, PromptType
+from ai.token_estimator import TokenEstimator
+from constants import SUMMARY_BATCH_PROMPT_PATH
+from models.enums.summary_status import SummaryStatus
+from repositories.news_repository import NewsRepository
+from services.news_service import NewsService
+from settings import (
+    MAX_OUTPUT_TOKENS,
+    SUMMARY_BATCH_MAX_ARTICLES,
+    SUMMARY_BATCH_MAX_TOKENS,
+    SUMMARY_BATCH_WAIT_S,
+    SUMMARY_OUTPUT_MARGIN,
+    SUMMARY_OUTPUT_TOKENS,
+    SUMMARY_WORKERS,
+)
+from utils.logger import logger
+from utils.summurizer_utils import MultilingualSummarizer
+
+
+class SummaryJob:
+    """
+    A stored article waiting for its summary
+    """
+
+    def __init__(self, news_id: int, body: str, image_url: str | None) -> None:
+        self.news_id = news_id
+        self.body = body
+        self.image_url = image_url
+        self.tokens = TokenEstimator.estimate(body)
+
+
+class SummaryService:
+    """
+    Summarization stage shared by the scrape workers: articles are stored with
+    a pending summary and queued here, SUMMARY_WORKERS threads pack them in
+    batches sized by their estimated tokens and summarize each batch with a
+    single LLM request
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._instance_lock:
+            if not cls._instance:
+                cls._instance = super(SummaryService, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self) -> None:
+        if self._initialized:
+            return
+
+        self.news_repository = NewsRepository()
+        self._queue: queue.Queue[SummaryJob | None] = queue.Queue()
+        self._workers: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        # A batch answer cut off by the output limit loses its last articles
+        self.max_articles = max(
+            1,
+            min(
+                SUMMARY_BATCH_MAX_ARTICLES,
+                int(MAX_OUTPUT_TOKENS / (SUMMARY_OUTPUT_TOKENS * SUMMARY_OUTPUT_MARGIN)),
+            ),
+        )
+
+        self._initialized = True
+
+    def submit(self, news_id: int, body: str, image_url: str | None) -> None:
+        """
+        Queue a stored article for summarization
+
+        :param news_id: ID of the article, stored with a pending summary
+        :param body: Scraped body to summarize
+        :param image_url: Article image, replaces the first [IMAGE HERE] tag
+        """
+        self._start()
+        self._queue.put(SummaryJob(news_id, body, image_url))
+
+    def resume(self) -> None:
+        """
+        Queue the articles left pending by an interrupted run
+        """
+        pending = self.news_repository.get_pending_summaries()
+        if pending:
+            logger.info(f"Resuming {len(pending)} pending summaries")
+        for news_id, body, image_url in pending:
+            self.submit(news_id, body, image_url)
+
+    def close(self) -> None:
+        """
+        Wait for every queued article to be summarized and stop the workers
+        """
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._queue.put(None)
+        for worker in workers:
+            worker.join()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            for _ in range(SUMMARY_WORKERS):
+                worker = threading.Thread(target=self._work, daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _work(self) -> None:
+        carried: SummaryJob | None = None  # Didn't fit in the last batch
+        is_closing = False
+        while carried is not None or not is_closing:
+            job = carried or self._queue.get()
+            carried = None
+            if job is None:
+                return
+
+            batch = [job]
+            tokens = job.tokens
+            deadline = time.monotonic() + SUMMARY_BATCH_WAIT_S
+            while not is_closing and len(batch) < self.max_articles:
+                try:
+                    next_job = self._queue.get(
+                        timeout=max(0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+                if next_job is None:
+                    is_closing = True
+                elif tokens + next_job.tokens > SUMMARY_BATCH_MAX_TOKENS:
+                    carried = next_job
+                    break
+                else:
+                    batch.append(next_job)
+                    tokens += next_job.tokens
+
+            try:
+                self._summarize(batch)
+            except Exception as e:
+                logger.error(f"Summary worker error: {str(e)}", exc_info=True)
+
+    def _summarize(self, batch: list[SummaryJob]) -> None:
+        summaries: dict[int, str] = {}
+        if len(batch) > 1:
+            try:
+                summaries = self._summarize_batch(batch)
+            except Exception as e:
+                logger.error(f"Batch summary of {len(batch)} articles failed: {str(e)}")
+
+        # Articles left out of the batch answer get a request of their own
+        for index, job in enumerate(batch):
+            summary = summaries.get(index)
+            try:
+                if summary is None:
+                    summary = MultilingualSummarizer().summarize(job.body)
+                self._store(job, summary)
+            except Exception as e:
+                logger.error(f"Failed to summarize news {job.news_id}: {str(e)}")
+                self.news_repository.set_summary(job.news_id, None, SummaryStatus.FAILED)
+
+    def _summarize_batch(self, batch: list[SummaryJob]) -> dict[int, str]:
+        """
+        Summarize several articles with a single LLM request
+
+        :param batch: The articles, identified by their index in the prompt
+        :return: HTML summary of each index the model answered for
+        """
+        articles = [{"id": index, "text": job.body} for index, job in enumerate(batch)]
+        prompt = Prompt(
+            content=json.dumps(articles, ensure_ascii=False),
+            template_path=SUMMARY_BATCH_PROMPT_PATH,
+            type=PromptType.TEXT,
+        )
+        response = Llm().prompt(prompt)
+        items = response.code
+        if not isinstance(items, list):
+            # Never cache a cut off answer, the articles it has are still used
+            Llm().evict(prompt)
+            items = __class__._complete_items(response.text)
+            logger.warning(
+                f"The batch summary is not a whole JSON list, "
+                f"{len(items)} complete articles recovered"
+            )
+
+        summaries: dict[int, str] = {}
+        for item in items:
+            if not (isinstance(item, dict) and isinstance(item.get("html"), str)):
+                continue
+            try:
+                summaries[int(item["id"])] = item["html"]
+            except (KeyError, TypeError, ValueError):
+                continue  # Can't be matched to an article, it gets its own request
+        logger.info(f"Summarized {len(summaries)}/{len(batch)} articles in one request")
+        return summaries
+
+    @staticmethod
+    def _complete_items(text: str) -> list[object]:
+        """
+        Read the items of a JSON list cut off by the output limit
+
+        :param text: The response text
+        :return: The items before the one that was cut off
+        """
+        start = text.find("[", text.find("```") + 1)
+        if start == -1:
+            return []
+
+        decoder = json.JSONDecoder()
+        items: list[object] = []
+        index = start + 1
+        while True:
+            while index < len(text) and text[index] in " \t\r\n,":
+                index += 1
+            try:
+                item, index = decoder.raw_decode(text, index)
+            except ValueError:
+                return items
+            items.append(item)
+
+    def _store(self, job: SummaryJob, summary: str) -> None:
+        body = NewsService.format_summary(summary, job.image_url)
+        self.news_repository.set_summary(job.news_id, body, SummaryStatus.DONE)
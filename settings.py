@@ -3,18 +3,141 @@ from datetime import date
 DEBUG_MODE = False
 
 
-# Rate limiting settings
+# Rate limiting settings of the LLM calls: the quota of the API key, the
+# backoff after a quota error without retry delay (a random delay between
+# MIN_DELAY_S and MAX_DELAY_S, doubled on each retry) and the most calls in flight
 MIN_DELAY_S: float = 1
 MAX_DELAY_S: float = 3
-MAX_WORKERS = 5  # For thread pool
+MAX_WORKERS = 5
+LLM_REQUESTS_PER_MINUTE = 15
+LLM_TOKENS_PER_MINUTE = 1_000_000
+LLM_MAX_RETRIES = 5
+LLM_MAX_BACKOFF_S: float = 60
+LLM_BURST_FRACTION: float = 0.1  # Of the quota that can be spent at once
 
 # Llm settings
 GEMINI_MODEL = "gemini-2.0-flash"
 MAX_OUTPUT_TOKENS = 8192
 
+# Summaries are generated after the articles are stored, by SUMMARY_WORKERS
+# threads packing up to SUMMARY_BATCH_MAX_ARTICLES bodies and
+# SUMMARY_BATCH_MAX_TOKENS prompt tokens in a request. The output of a batch
+# must fit in MAX_OUTPUT_TOKENS at SUMMARY_OUTPUT_TOKENS per article, times
+# SUMMARY_OUTPUT_MARGIN for the JSON escaping and the longer summaries
+SUMMARY_WORKERS = 2
+SUMMARY_BATCH_MAX_ARTICLES = 8
+SUMMARY_BATCH_MAX_TOKENS = 24_000
+SUMMARY_OUTPUT_TOKENS = 1_000
+SUMMARY_OUTPUT_MARGIN: float = 1.5
+SUMMARY_BATCH_WAIT_S: float = 2  # For more articles before sending a partial batch
+
+# Starting ratio of the offline token estimate, calibrated on the real counts
+TOKEN_ESTIMATE_CHARS_PER_TOKEN: float = 4
+
+# Responses of identical prompts are reused from a local SQLite file, set
+# LLM_CACHE_ENABLED to False to always call the model
+LLM_CACHE_ENABLED = True
+LLM_CACHE_PATH = "./cache/llm_responses.sqlite3"
+LLM_CACHE_TTL_S = 7 * 24 * 3600
+LLM_CACHE_MAX_ENTRIES = 20_000
+
 
 WORKERS_COUNT = 6
 
+# Article pages fetched concurrently for a single source
+DETAIL_FETCH_WORKERS = 4
+PER_HOST_CONCURRENCY = 2
+
+# Scrape engine: "threading" runs WORKERS_COUNT blocking workers, "asyncio"
+# runs sources, article fetches, summaries and DB writes as async stages
+SCRAPE_ENGINE = "threading"
+ASYNC_SOURCE_CONCURRENCY = WORKERS_COUNT  # Each source holds a browser
+ASYNC_FETCH_CONCURRENCY = 50
+ASYNC_SUMMARY_CONCURRENCY = 10
+ASYNC_WRITE_CONCURRENCY = 5
+ASYNC_QUEUE_SIZE = 200
+ASYNC_DB_POOL_SIZE = 5
+
+# Each scrape worker and summary thread holds a DB connection while it writes,
+# DB_POOL_HEADROOM more serve the other RPCs. Past DB_POOL_SIZE, a thread waits
+# for a connection to be released
+DB_POOL_HEADROOM = 4
+DB_POOL_SIZE = WORKERS_COUNT + SUMMARY_WORKERS + DB_POOL_HEADROOM
+
+# Driver pool settings
+# Each worker keeps its listing page open in one of DRIVER_POOL_SIZE browsers,
+# article pages the HTTP fetch can't read and selector generation borrow one of
+# DRIVER_NESTED_POOL_SIZE more. Each browser may grow to DRIVER_MAX_RSS_MB, so
+# the browsers can use up to (DRIVER_POOL_SIZE + DRIVER_NESTED_POOL_SIZE) times that
+DRIVER_POOL_SIZE = WORKERS_COUNT
+DRIVER_NESTED_POOL_SIZE = 2
+DRIVER_MAX_PAGES = 200  # Recycle a browser after this many page loads
+DRIVER_MAX_RSS_MB = 1500  # Recycle a browser once its process tree exceeds this
+DRIVER_LEASE_TIMEOUT_S: float = 60
+
+# HTTP fetch settings
+HTTP_TIMEOUT_S: float = 15
+HTTP_POOL_SIZE = 20  # Keep-alive connections kept per host
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0"
+)
+
+# A source moves to the browser after this many article pages in a row needed
+# it, and one of its articles is tried over HTTP again every FETCH_MODE_REPROBE_S
+FETCH_MODE_HTTP_MISSES = 3
+FETCH_MODE_REPROBE_S: float = 24 * 3600
+
+# Resources the browser doesn't download, see RESOURCE_BLOCKING_PROFILES, with
+# a profile per source URL for sites that break without them
+# (e.g. {"https://example.com/news": "none"})
+RESOURCE_BLOCKING_PROFILE = "standard"
+RESOURCE_BLOCKING_OVERRIDES: dict[str, str] = {}
+# Log the network events of the browsers to report what the blocking saves
+RESOURCE_STATS_ENABLED = True
+
+# Listing pages loaded ahead over HTTP when the next button links to a page URL
+PAGINATION_PREFETCH_PAGES = 4
+
+# Listing URLs remembered per source, a listing page made only of these ends the
+# scrape of the source without opening any article
+WATERMARK_SIZE = 200
+
+# Near-duplicate articles: bodies whose SimHash over SIMHASH_SHINGLE_WORDS word
+# shingles differ in at most SIMHASH_MAX_DISTANCE bits reuse the summary of the
+# first one, SIMHASH_BANDS must stay above the distance for the index to find them
+SIMHASH_SHINGLE_WORDS = 3
+SIMHASH_MAX_DISTANCE = 6
+SIMHASH_BANDS = 8
+SIMHASH_MIN_WORDS = 50  # Shorter bodies are never treated as duplicates
+
+# Waits for a listing page to change after a scroll or a click, the timeout of a
+# source is learned from its slowest change times PAGE_WAIT_MARGIN
+PAGE_WAIT_TIMEOUT_S: float = 10  # Until a timeout was learned
+PAGE_WAIT_MIN_S: float = 2
+PAGE_WAIT_MAX_S: float = 30
+PAGE_WAIT_MARGIN: float = 3
+PAGE_WAIT_POLL_S: float = 0.1
+PAGE_QUIET_MS = 300  # Without DOM changes before the page is considered loaded
+# Wait for a change before the listing is considered over, until the first
+# changes of a run were measured
+PAGE_CHANGE_TIMEOUT_S: float = 3
+
+# Seconds between two checks of the trigger files for changes
+TRIGGER_RELOAD_INTERVAL_S: float = 5
+
+# BeautifulSoup backend used to parse pages: the pure Python "html.parser" or the
+# faster "lxml", which nests HTML5 elements like <source> differently, run
+# benchmarks/parser_parity.py against the stored selectors before switching
+HTML_PARSER = "html.parser"
+
+# How listing pages are read: "browser" runs the title and link selectors in the
+# page, "html" transfers and parses the whole page source
+LISTING_EXTRACTION = "browser"
+
+# Number of parsed date strings kept in memory
+DATE_CACHE_SIZE = 4096
+
 PORT = "3015"
 
 LAST_FETCH_DATE = date(
@@ -0,0 +1,81 @@
+from typing import Iterator
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton finding every occurrence of a set of patterns in a
+    single pass over a text. Matching is exact, callers lowercase the patterns
+    and the text themselves when they want case insensitive matching.
+    """
+
+    def __init__(self, patterns: list[str]) -> None:
+        self.patterns = patterns
+
+        # State 0 is the root
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+
+        for index, pattern in enumerate(patterns):
+            if pattern:
+                self._add_pattern(pattern, index)
+        self._build_fail_links()
+
+    def _add_pattern(self, pattern: str, index: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(index)
+
+    def _build_fail_links(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:  # Breadth first, the queue grows while iterating
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def next_state(self, state: int, char: str) -> int:
+        """Advance the automaton by one character.
+
+        Args:
+            state: The current state, 0 to start
+            char: The next character of the text
+
+        Returns:
+            int: The new state, pass it to `matches` to get the patterns ending here
+        """
+        goto, fail = self._goto, self._fail
+        while state and char not in goto[state]:
+            state = fail[state]
+        return goto[state].get(char, 0)
+
+    def matches(self, state: int) -> list[int]:
+        """Get the indexes of the patterns ending at a state."""
+        return self._output[state]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """Find every pattern occurrence in a text.
+
+        Args:
+            text: The text to search
+
+        Yields:
+            tuple[int, int]: Start position in the text and pattern index
+        """
+        state = 0
+        for position, char in enumerate(text):
+            state = self.next_state(state, char)
+            for index in self._output[state]:
+                yield position - len(self.patterns[index]) + 1, index
@@ -0,0 +1,65 @@
+from constants import TRIGGER_WORDS_CATEGORIES
+from utils.aho_corasick import AhoCorasick
+
+UNCATEGORIZED = "Uncategorized"
+
+
+def _group_categories_by_keyword() -> dict[str, list[str]]:
+    categories_by_keyword: dict[str, list[str]] = {}
+    for category, keywords in TRIGGER_WORDS_CATEGORIES.items():
+        for keyword in keywords:
+            keyword_categories = categories_by_keyword.setdefault(keyword, [])
+            if category not in keyword_categories:
+                keyword_categories.append(category)
+    return categories_by_keyword
+
+
+class CategoryClassifier:
+    """
+    Score every category of TRIGGER_WORDS_CATEGORIES in a single scan of the
+    article body. Keywords are matched case sensitively, like before, and only
+    when they start a word so "law" doesn't count inside "flaw".
+    """
+
+    _categories_by_keyword = _group_categories_by_keyword()
+    _keyword_categories = list(_categories_by_keyword.values())
+    _automaton = AhoCorasick(list(_categories_by_keyword))
+    _category_order = {
+        category: order for order, category in enumerate(TRIGGER_WORDS_CATEGORIES)
+    }
+
+    @staticmethod
+    def score(body: str) -> dict[str, int]:
+        """Count the keyword occurrences of each category in a body.
+
+        Args:
+            body: Body of the news article
+
+        Returns:
+            dict[str, int]: Number of keyword occurrences per matching category
+        """
+        scores: dict[str, int] = {}
+        for start, index in __class__._automaton.iter_matches(body):
+            if start > 0 and body[start - 1].isalnum():
+                continue
+            for category in __class__._keyword_categories[index]:
+                scores[category] = scores.get(category, 0) + 1
+        return scores
+
+    @staticmethod
+    def classify(body: str) -> str:
+        """Get the best category of a news article.
+
+        Args:
+            body: Body of the news article
+
+        Returns:
+            str: The category with the most keyword occurrences, ties go to the
+                category listed first, "Uncategorized" if nothing matched
+        """
+        scores = __class__.score(body)
+        if not scores:
+            return UNCATEGORIZED
+
+        order = __class__._category_order
+        return max(scores, key=lambda category: (scores[category], -order[category]))
@@ -0,0 +1,137 @@
+import re
+import threading
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+
+from dtypes.selector import Selector
+
+# Last compound of a selector made of a tag name, classes, IDs and simple
+# pseudo classes, e.g. "div.content > p.date:first-child"
+_LAST_COMPOUND = re.compile(
+    r"(?:^|[\s>+~])(?P<tag>[a-zA-Z][\w-]*)?(?P<rest>(?:[.#][\w-]+|:[\w-]+)*)$"
+)
+_NAMES = re.compile(r"([.#])([\w-]+)")
+
+
+class CompiledSelector:
+    """
+    The detail page selectors of a source, compiled once and evaluated in a
+    single traversal of the document.
+
+    The traversal indexes the elements by tag name, ID and class, so each
+    selector is only matched against the elements that can satisfy its last
+    compound instead of the whole tree.
+    """
+
+    _cache: dict[tuple[str | None, ...], "CompiledSelector"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, fields: dict[str, str | None]) -> None:
+        """
+        :param fields: CSS selector of each field, None when the source has none
+        """
+        self.fields = fields
+        self._patterns = {
+            css: soupsieve.compile(css) for css in set(fields.values()) if css
+        }
+        self._keys = {css: __class__.index_key(css) for css in self._patterns}
+
+    @staticmethod
+    def get(selector: Selector) -> "CompiledSelector":
+        """Get the compiled selectors of a source, compiling them on first use.
+
+        Args:
+            selector: The source selectors
+
+        Returns:
+            CompiledSelector: Shared by every page of the source
+        """
+        author = selector.get("author") or {}
+        fields = {
+            "body": selector.get("body"),
+            "post_date": selector.get("post_date"),
+            "event_date": selector.get("event_date"),
+            "image_url": selector.get("image_url"),
+            "author_name": author.get("name"),
+            "author_link": author.get("link"),
+            "author_image_url": author.get("image_url"),
+        }
+        key = tuple(fields.values())
+
+        compiled = __class__._cache.get(key)
+        if compiled is None:
+            with __class__._lock:
+                compiled = __class__._cache.setdefault(key, CompiledSelector(fields))
+        return compiled
+
+    @staticmethod
+    def index_key(css: str) -> str | None:
+        """Get the most selective name an element must have to match a selector.
+
+        Args:
+            css: The CSS selector
+
+        Returns:
+            str | None: "#id", ".class" or the tag name, lowercase, None if the
+                selector is too complex to tell (attributes, lists, :not()...)
+        """
+        css = css.strip()
+        if any(char in css for char in "[](),\\*|"):
+            return None
+
+        match = _LAST_COMPOUND.search(css)
+        if match is None:
+            return None
+
+        names = _NAMES.findall(match.group("rest"))
+        for prefix in "#.":
+            for name_prefix, name in names:
+                if name_prefix == prefix:
+                    return prefix + name.lower()
+        tag = match.group("tag")
+        return tag.lower() if tag else None
+
+    def select(self, soup: BeautifulSoup) -> dict[str, Tag | None]:
+        """Find the first element matching each field, like select_one would.
+
+        Args:
+            soup: The parsed page
+
+        Returns:
+            dict[str, Tag | None]: The element of each field, None if not found
+        """
+        index: dict[str, list[Tag]] | None = None
+        elements: dict[str, Tag | None] = {}
+        for css, pattern in self._patterns.items():
+            key = self._keys[css]
+            if key is None:
+                elements[css] = pattern.select_one(soup)
+                continue
+
+            if index is None:
+                index = __class__._index(soup)
+            # Candidates are in document order, the first match is select_one's
+            elements[css] = next(
+                (element for element in index.get(key, ()) if pattern.match(element)),
+                None,
+            )
+
+        return {
+            field: elements.get(css) if css else None
+            for field, css in self.fields.items()
+        }
+
+    @staticmethod
+    def _index(soup: BeautifulSoup) -> dict[str, list[Tag]]:
+        index: dict[str, list[Tag]] = {}
+        for element in soup.descendants:
+            if type(element) is not Tag:
+                continue
+            index.setdefault(element.name.lower(), []).append(element)
+            element_id = element.get("id")
+            if element_id:
+                index.setdefault("#" + str(element_id).lower(), []).append(element)
+            for class_name in element.get("class") or ():
+                index.setdefault("." + class_name.lower(), []).append(element)
+        return index
@@ -2,7 +2,6 @@ import os
 import sys
 import tempfile
 from lib2to3.pgen2 import driver
-from time import sleep
 
 import requests
 from selenium import webdriver
@@ -19,10 +18,14 @@ from selenium.webdriver.edge.service import Service
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from dtypes.listing_item import ListingItem
 from iterators.infinite_scrolling_iterator import InfiniteScrollIterator
 from iterators.pagination_iterator import PaginationIterator
-from settings import DEBUG_MODE
+from settings import DEBUG_MODE, RESOURCE_STATS_ENABLED
+from utils.listing_extractor import ListingExtractor
 from utils.logger import logger
+from utils.page_waiter import PageWaiter
+from utils.resource_blocker import ResourceBlocker
 
 
 class CustomDriver:
@@ -43,6 +46,10 @@ class CustomDriver:
         self.options.add_argument("--disable-dev-shm-usage")
         self.options.add_argument("--disable-gpu")
 
+        if RESOURCE_STATS_ENABLED:
+            # Network events, to estimate what the resource blocking saves
+            self.options.set_capability("ms:loggingPrefs", {"performance": "ALL"})
+
         # Set page load timeout and script timeout
         self.driver = webdriver.Edge(service=self.service, options=self.options)
         self.driver.set_page_load_timeout(self.DRIVER_TIMEOUT_S)
@@ -67,54 +74,116 @@ class CustomDriver:
         # Initialize ActionChains for complex mouse and keyboard interactions
         self.actions = ActionChains(self.driver)
 
+        # Number of pages loaded, used by the driver pool to recycle browsers
+        self.pages_loaded = 0
+
+        self.resource_blocker = ResourceBlocker(self.driver)
+
     def get(self, url: str) -> None:
+        self.resource_blocker.collect_stats()
         self.driver.get(url)
+        self.pages_loaded += 1
+
+    def use_source(self, source_url: str | None) -> None:
+        """Block the resources of the profile of a source for the next pages.
+
+        Args:
+            source_url: URL of the source, None for pages of no source
+        """
+        self.resource_blocker.use_source(source_url)
+
+    def collect_resource_stats(self) -> None:
+        """
+        Empty the performance log, for listings loading more without navigating
+        """
+        self.resource_blocker.collect_stats()
+
+    def is_alive(self) -> bool:
+        """Check that the browser session still responds to commands.
+
+        Returns:
+            bool: True if the browser answered a trivial script, False otherwise
+        """
+        try:
+            return self.driver.execute_script("return 1;") == 1
+        except Exception as e:
+            logger.warning(f"Driver health check failed: {str(e)}")
+            return False
+
+    def memory_usage_mb(self) -> float | None:
+        """Get the resident memory of the driver process and all the browser
+        processes it spawned.
+
+        Returns:
+            float | None: RSS in megabytes, None if it can't be read (non Linux)
+        """
+        process = getattr(self.service, "process", None)
+        if process is None:
+            return None
+
+        if not os.path.exists(f"/proc/{process.pid}"):
+            return None
+
+        total_kb = 0
+        pids = [process.pid]
+        while pids:
+            pid = pids.pop()
+            try:
+                with open(f"/proc/{pid}/status", "r") as f:
+                    for line in f:
+                        if line.startswith("VmRSS:"):
+                            total_kb += int(line.split()[1])
+                            break
+                with open(f"/proc/{pid}/task/{pid}/children", "r") as f:
+                    pids.extend(int(child) for child in f.read().split())
+            except (OSError, ValueError):
+                continue  # The process exited while we were walking the tree
+
+        return total_kb / 1024
 
     def handle_infinite_scroll(
         self,
         css_selector: str | None,
+        listing_extractor: ListingExtractor,
         timeout_s: float = DEFAULT_TIMEOUT_S,
         max_loads: int = 20,
-    ) -> str:
+    ) -> list[ListingItem]:
         logger.debug("Handling infinite scrolling...")
-        html = ""
-        for page in InfiniteScrollIterator(self, css_selector, timeout_s, max_loads):
-            html += page
-        return html
+        items: list[ListingItem] = []
+        for new_items in InfiniteScrollIterator(
+            self, css_selector, timeout_s, listing_extractor, max_loads
+        ):
+            items += new_items
+        return items
 
     def handle_pagination(
         self,
         css_selector: str,
+        listing_extractor: ListingExtractor,
         timeout_s: float = DEFAULT_TIMEOUT_S,
         max_pages: int = 20,
-    ) -> str:
+    ) -> list[ListingItem]:
         logger.debug("Handling pagination...")
-        html: str = ""
-        for page in PaginationIterator(self, css_selector, timeout_s, limit=max_pages):
-            html += page
-        return html
+        items: list[ListingItem] = []
+        for new_items in PaginationIterator(
+            self, css_selector, timeout_s, listing_extractor, limit=max_pages
+        ):
+            items += new_items
+        return items
 
     def nextPage(
         self,
         css_selector: str,
         timeout_s: float = DEFAULT_TIMEOUT_S,
+        page_waiter: PageWaiter | None = None,
     ) -> None:
         wait = self.wait
         if timeout_s != self.DEFAULT_TIMEOUT_S:
             wait = WebDriverWait(self.driver, timeout=timeout_s)
+        page_waiter = page_waiter or PageWaiter(self.driver)
 
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        while True:
-            self.driver.execute_script(
-                "window.scrollTo(0, document.body.scrollHeight);"
-            )
-            sleep(0.5)
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
-
-        sleep(1)
+        # The next button is often at the bottom of the page or lazy loaded there
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
 
         try:
             next_button = wait.until(
@@ -123,15 +192,13 @@ class CustomDriver:
             self.driver.execute_script(
                 "arguments[0].scrollIntoView(true);", next_button
             )
-            sleep(0.5)
+            before = page_waiter.get_state()
 
             try:
                 self.driver.execute_script("arguments[0].click();", next_button)
             except Exception:
                 self.actions.move_to_element(next_button).click().perform()
 
-            sleep(2)
-
         except Exception as e:
             logger.error(f"Error type: {type(e).__name__}")
             if isinstance(e, TimeoutException):
@@ -149,20 +216,34 @@ class CustomDriver:
             # This will be caught by the PaginationIterator
             raise StopIteration
 
+        # Wait for the next page to load, or to replace the articles in place
+        if not page_waiter.wait_for_change(before):
+            logger.error("Next page didn't load after clicking the next button")
+            raise StopIteration
+
     def get_html(self) -> str:
-        try:
-            logger.info("Waiting for the Page fully loaded, retrieving HTML source")
+        logger.info("Waiting for the Page fully loaded, retrieving HTML source")
+        if self.wait_until_loaded():
+            logger.info("Page fully loaded, retrieving HTML source")
+        else:
+            logger.warning("Returning current page source despite error")
+        return self.driver.page_source
+
+    def wait_until_loaded(self) -> bool:
+        """Wait for the current page to finish loading.
 
+        Returns:
+            bool: False if the page didn't load in time
+        """
+        try:
             self.wait.until(
                 lambda driver: driver.execute_script("return document.readyState")
                 == "complete",
             )
-            logger.info("Page fully loaded, retrieving HTML source")
-            return self.driver.page_source
+            return True
         except Exception as e:
-            logger.error(f"Error while getting page HTML: {str(e)}")
-            logger.warning("Returning current page source despite error")
-            return self.driver.page_source
+            logger.error(f"Error while waiting for the page to load: {str(e)}")
+            return False
 
     def download_file(self, link: str) -> str:
 
@@ -191,5 +272,6 @@ class CustomDriver:
             print(f"Error during driver cleanup: {str(e)}", file=sys.stderr)
 
     def quit(self):
+        self.resource_blocker.collect_stats()
         self.driver.quit()
         # Also clean up the user data directory when explicitly quitting
@@ -1,7 +1,11 @@
 from datetime import datetime
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
+from dtypes.page_content import PageContent
+from dtypes.selector import Selector
 from utils.checker import Checker
+from utils.compiled_selector import CompiledSelector
+from utils.html_parser import HtmlParser
 
 
 class CustomSoup:
@@ -10,7 +14,42 @@ class CustomSoup:
         self,
         html: str,
     ) -> None:
-        self.soup = BeautifulSoup(html, "html.parser")
+        self.soup = HtmlParser.parse(html)
+        self._elements: dict[CompiledSelector, dict[str, Tag | None]] = {}
+
+    def extract(self, selector: Selector, base_url: str) -> PageContent:
+        """
+        Extract every detail field of the page in a single traversal
+
+        Args:
+            selector: The source selectors
+            base_url: URL relative links are resolved against
+
+        Returns:
+            The text of each field, and the resolved URL of the link fields
+        """
+        compiled = CompiledSelector.get(selector)
+        elements = self._elements.get(compiled)
+        if elements is None:
+            elements = compiled.select(self.soup)
+            self._elements[compiled] = elements
+
+        def text(field: str) -> str | None:
+            element = elements[field]
+            return element.get_text().strip() if element else None
+
+        def url(field: str) -> str | None:
+            return __class__.element_url(elements[field], base_url)
+
+        return {
+            "body": text("body"),
+            "post_date": text("post_date"),
+            "event_date": text("event_date"),
+            "image_url": url("image_url"),
+            "author_name": text("author_name"),
+            "author_link": url("author_link"),
+            "author_image_url": url("author_image_url"),
+        }
 
     def select_text(self, css_selector: str | None) -> str | None:
         """
@@ -78,6 +117,10 @@ class CustomSoup:
         if css_selector is None:
             return None
         element = self.soup.select_one(css_selector)
+        return __class__.element_url(element, base_url)
+
+    @staticmethod
+    def element_url(element: Tag | None, base_url: str) -> str | None:
         if element and element.name == "a":
             attr = (
                 "href"
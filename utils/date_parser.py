@@ -0,0 +1,257 @@
+import datetime
+import threading
+from functools import lru_cache
+
+from settings import DATE_CACHE_SIZE
+
+# Formats tried by DateParser, in order of preference
+DATE_FORMATS = [
+    # Basic formats
+    "%Y-%m-%d",  # ISO 8601
+    "%m/%d/%Y",  # US
+    "%d/%m/%Y",  # European
+    "%Y.%m.%d",  # Dot notation
+    "%Y%m%d",  # Compact ISO
+    "%d-%m-%Y",  # Day-month-year
+    "%m-%d-%Y",  # US with hyphens
+    "%d.%m.%Y",  # European with dots
+    "%Y/%m/%d",  # Year/month/day
+    "%d %b %Y",  # Day Month(abbr) Year
+    "%d %B %Y",  # Day Month(full) Year
+    "%b %d, %Y",  # Month(abbr) Day, Year
+    "%B %d, %Y",  # Month(full) Day, Year
+    "%A, %B %d, %Y",  # Weekday, Month(full) Day, Year
+    "%Y年%m月%d日",  # Chinese
+    "%Y년 %m월 %d일",  # Korean
+    "%d/%m/%y",  # European with 2-digit year
+    "%m/%d/%y",  # US with 2-digit year
+    "%y-%m-%d",  # ISO with 2-digit year
+    "%d-%b-%y",  # Day-Month(abbr)-2-digit year
+    "%d-%B-%y",  # Day-Month(full)-2-digit year
+    "%b %d %y",  # Month(abbr) Day 2-digit year
+    "%B %d %y",  # Month(full) Day 2-digit year
+    "%Y-%b-%d",  # Year-Month(abbr)-Day
+    "%Y-%B-%d",  # Year-Month(full)-Day
+    # Year-only formats
+    "%Y",  # Year only
+    "%y",  # 2-digit year
+    # Month-Year formats
+    "%b %Y",  # Month(abbr) Year
+    "%B %Y",  # Month(full) Year
+    "%m/%Y",  # Month/Year
+    "%Y-%m",  # Year-Month
+    "%Y年%m月",  # Chinese Year-Month
+    "%Y년 %m월",  # Korean Year-Month
+    # Time formats
+    "%H:%M",  # 24-hour time
+    "%I:%M %p",  # 12-hour time
+    "%H:%M:%S",  # 24-hour with seconds
+    "%I:%M:%S %p",  # 12-hour with seconds
+    "%H:%M:%S.%f",  # With microseconds
+    "%H:%M:%S %Z",  # With timezone
+    "%H:%M:%S %z",  # With UTC offset
+    # Combined date-time formats
+    "%Y-%m-%d %H:%M",  # ISO with time
+    "%Y-%m-%d %H:%M:%S",  # ISO with seconds
+    "%Y-%m-%d %H:%M:%S.%f",  # ISO with microseconds
+    "%Y-%m-%dT%H:%M:%S",  # ISO 8601
+    "%Y-%m-%dT%H:%M:%SZ",  # ISO 8601 with Zulu
+    "%Y-%m-%dT%H:%M:%S.%fZ",  # ISO 8601 with microseconds and Zulu
+    "%Y-%m-%dT%H:%M:%S%z",  # ISO 8601 with UTC offset
+    "%Y-%m-%dT%H:%M:%S.%f%z",  # ISO 8601 with microseconds and UTC offset
+    "%m/%d/%Y %I:%M %p",  # US with 12-hour time
+    "%d/%m/%Y %H:%M",  # European with time
+    "%d/%m/%Y %H:%M:%S",  # European with seconds
+    "%Y%m%d%H%M%S",  # Compact ISO with time
+    "%Y%m%d%H%M%S%z",  # Compact ISO with UTC offset
+    "%Y%m%d%H%M%S.%f",  # Compact ISO with microseconds
+    "%Y%m%d%H%M%S.%f%z",  # Compact ISO with microseconds and UTC offset
+    # Special formats
+    "%a, %d %b %Y %H:%M:%S %Z",  # RFC 822
+    "%A, %d %B %Y %H:%M:%S",  # Full weekday with time
+    "%a %b %d %H:%M:%S %Y",  # Unix date
+    "%a %b %d %H:%M:%S %Z %Y",  # Unix date with timezone
+    "%Y年%m月%d日 %H:%M:%S",  # Chinese with time
+    "%Y년 %m월 %d일 %H:%M:%S",  # Korean with time
+    "%d %B %Y %H:%M:%S",  # French with full month
+    "%d %b %Y %H:%M:%S",  # French with abbreviated month
+    # Custom formats
+    "%a, %m/%d/%Y - %H:%M",  # Thu, 06/26/2025 - 14:22
+    "%a, %d/%m/%Y - %H:%M",  # Thu, 26/06/2025 - 14:22
+    "%a, %Y/%m/%d - %H:%M",  # Thu, 2025/06/26 - 14:22
+    "%a, %m-%d-%Y - %H:%M",  # Thu, 06-26-2025 - 14:22
+    "%a, %d-%m-%Y - %H:%M",  # Thu, 26-06-2025 - 14:22
+    "%a, %Y-%m-%d - %H:%M",  # Thu, 2025-06-26 - 14:22
+    "%a %b %d %Y at %I:%M %p",  # Thu Jun 26 2025 at 02:22 PM
+    "%A, %B %d, %Y at %I:%M %p",  # Thursday, June 26, 2025 at 02:22 PM
+    "Le %d %B %Y à %H:%M",  # French format
+    "El %d de %B de %Y a las %H:%M",  # Spanish format
+    "Am %d.%m.%Y um %H:%M Uhr",  # German format
+    "%Y年%m月%d日 %H時%M分%S秒",  # Japanese format
+    "%Y년 %m월 %d일 %H시 %M분 %S초",  # Korean format with time
+    "%d/%m/%Y %H:%M:%S %Z",  # European with timezone
+    "%m/%d/%Y %I:%M:%S %p %Z",  # US with 12-hour time and timezone
+    "%Y-%m-%d %H:%M:%S %Z",  # ISO with timezone
+    "%Y-%m-%d %H:%M:%S %z",  # ISO with UTC offset
+    "%Y-%m-%d %H:%M:%S.%f %Z",  # ISO with microseconds and timezone
+    "%Y-%m-%d %H:%M:%S.%f %z",  # ISO with microseconds and UTC offset
+    "%Y/%m/%d %H:%M:%S",  # Year/month/day with time
+    "%d-%m-%Y %H:%M:%S",  # Day-month-year with time
+    "%d-%b-%Y",  # Day-Month(abbr)-Year
+    "%d-%B-%Y",  # Day-Month(full)-Year
+    "%Y %b %d",  # Year Month(abbr) Day
+    "%Y %B %d",  # Year Month(full) Day
+    "%b %d %Y",  # Month(abbr) Day Year
+    "%B %d %Y",  # Month(full) Day Year
+    "%Y/%b/%d",  # Year/Month(abbr)/Day
+    "%Y/%B/%d",  # Year/Month(full)/Day
+    "%d %m %Y",  # Day Month Year (numeric)
+    "%Y %m %d",  # Year Month Day (numeric)
+    "%m %d %Y",  # Month Day Year (numeric)
+    "%Y/%m/%d %H:%M",  # Year/month/day with time
+    "%d-%m-%Y %H:%M",  # Day-month-year with time
+    "%Y%m%d%H%M",  # Compact ISO format with time
+    "%a, %m/%d/%Y - %H:%M:%S",  # Thu, 06/26/2025 - 14:22:30 format
+    "%a, %d/%m/%Y - %H:%M:%S",  # Thu, 26/06/2025 - 14:22:30 format
+    "%a, %Y/%m/%d - %H:%M:%S",  # Thu, 2025/06/26 - 14:22:30 format
+    "%a, %m-%d-%Y - %H:%M:%S",  # Thu, 06-26-2025 - 14:22:30 format
+    "%a, %d-%m-%Y - %H:%M:%S",  # Thu, 26-06-2025 - 14:22:30 format
+    "%a, %Y-%m-%d - %H:%M:%S",  # Thu, 2025-06-26 - 14:22:30 format
+]
+
+# Longest string that can still be a date: the longest rendered format is about
+# 40 characters, the rest is left for labels like "Published on" and spacing
+MAX_DATE_LENGTH = 100
+
+# strptime accepts several spellings of a UTC offset, each has its own shape
+_UTC_OFFSET_SAMPLES = ["+0000", "-0000", "+00:00", "-00:00", "Z"]
+
+_SAMPLE_DATE = datetime.datetime(
+    2024, 10, 28, 13, 45, 30, 123456, tzinfo=datetime.timezone.utc
+)
+
+
+class DateParser:
+    """
+    Parse dates against DATE_FORMATS without trying every format.
+
+    A date string is first reduced to its shape (runs of digits, runs of
+    letters, separators and CJK characters) and only the formats producing
+    that shape are tried. Results are kept in an LRU cache, and the last
+    format that worked for a source is tried first on its next dates.
+    """
+
+    _formats_by_shape: dict[str, list[str]] = {}
+    _source_formats: dict[object, str] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def could_be_date(value: str) -> bool:
+        """Cheaply tell apart strings that can't be a date, without parsing.
+
+        Args:
+            value: The string to check, before any cleaning
+
+        Returns:
+            bool: False if the string is too long or has no digit, every date
+                format contains at least one number
+        """
+        if len(value) > MAX_DATE_LENGTH:
+            return False
+        return any(char.isdigit() for char in value)
+
+    @staticmethod
+    def shape(value: str) -> str:
+        """Reduce a string to the shape of a date.
+
+        Args:
+            value: The string to classify
+
+        Returns:
+            str: "9" for a run of digits, "a" for a run of letters, " " for a run
+                of whitespace, CJK characters and other symbols are kept as is
+        """
+        shape: list[str] = []
+        previous = ""
+        for char in value:
+            if char.isdigit():
+                kind = "9"
+            elif "\u3040" <= char <= "\u9fff" or "\uac00" <= char <= "\ud7af":
+                kind = char  # Chinese, Japanese and Korean date markers (年, 월...)
+            elif char.isalpha():
+                kind = "a"
+            elif char.isspace():
+                kind = " "
+            else:
+                kind = char
+
+            if kind != previous or kind not in "9a ":
+                shape.append(kind)
+            previous = kind
+        return "".join(shape)
+
+    @staticmethod
+    def get_formats(shape: str) -> list[str]:
+        """Get the formats, in order of preference, matching a date shape."""
+        if not __class__._formats_by_shape:
+            with __class__._lock:
+                if not __class__._formats_by_shape:
+                    __class__._formats_by_shape = __class__._index_formats()
+        return __class__._formats_by_shape.get(shape, [])
+
+    @staticmethod
+    def _index_formats() -> dict[str, list[str]]:
+        formats_by_shape: dict[str, list[str]] = {}
+        for fmt in DATE_FORMATS:
+            samples = [fmt]
+            if "%z" in fmt:
+                samples = [fmt.replace("%z", offset) for offset in _UTC_OFFSET_SAMPLES]
+
+            for sample in samples:
+                shape = __class__.shape(_SAMPLE_DATE.strftime(sample))
+                formats = formats_by_shape.setdefault(shape, [])
+                if fmt not in formats:
+                    formats.append(fmt)
+        return formats_by_shape
+
+    @staticmethod
+    def parse(
+        date_string: str,
+        source_key: object | None = None,
+    ) -> datetime.datetime | None:
+        """Parse a cleaned date string.
+
+        Args:
+            date_string: The date, without any label like "Posted on"
+            source_key: Identifies where the date comes from (e.g. a source ID),
+                the format that last worked for it is tried first
+
+        Returns:
+            The parsed datetime, None if no format matched
+        """
+        date_string = date_string.strip()
+
+        if source_key is not None:
+            fmt = __class__._source_formats.get(source_key)
+            if fmt is not None:
+                try:
+                    return datetime.datetime.strptime(date_string, fmt)
+                except ValueError:
+                    pass
+
+        date, fmt = __class__._parse_cached(date_string)
+        if source_key is not None and fmt is not None:
+            __class__._source_formats[source_key] = fmt
+        return date
+
+    @staticmethod
+    @lru_cache(maxsize=DATE_CACHE_SIZE)
+    def _parse_cached(
+        date_string: str,
+    ) -> tuple[datetime.datetime | None, str | None]:
+        for fmt in __class__.get_formats(__class__.shape(date_string)):
+            try:
+                return datetime.datetime.strptime(date_string, fmt), fmt
+            except ValueError:
+                continue
+        return None, None
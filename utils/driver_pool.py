@@ -0,0 +1,218 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from settings import (
+    DRIVER_LEASE_TIMEOUT_S,
+    DRIVER_MAX_PAGES,
+    DRIVER_MAX_RSS_MB,
+    DRIVER_NESTED_POOL_SIZE,
+    DRIVER_POOL_SIZE,
+)
+from utils.custom_driver import CustomDriver
+from utils.logger import logger
+
+
+class DriverPool:
+    """
+    Bounded pool of reusable browser instances shared by every scraping thread.
+
+    Nested leases, taken while the caller already holds a listing browser, have
+    browsers of their own so they never wait for the listing leases to end.
+    Browsers are only kept between leases while the pool is open, during a scrape.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._instance_lock:
+            if not cls._instance:
+                cls._instance = super(DriverPool, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        max_nested: int | None = None,
+        max_pages: int | None = None,
+        max_rss_mb: float | None = None,
+    ) -> None:
+        """
+        Initialize the driver pool
+
+        :param max_size: Maximum number of listing browsers leased at the same time
+        :param max_nested: Maximum number of nested leases at the same time
+        :param max_pages: Page loads after which a browser is recycled
+        :param max_rss_mb: Memory (MB) after which a browser is recycled
+        """
+        if self._initialized:
+            return
+
+        self.max_size = max_size or DRIVER_POOL_SIZE
+        self.max_nested = max_nested or DRIVER_NESTED_POOL_SIZE
+        self.max_pages = max_pages or DRIVER_MAX_PAGES
+        self.max_rss_mb = max_rss_mb or DRIVER_MAX_RSS_MB
+
+        self._idle: list[CustomDriver] = []
+        self._created = 0
+        self._leased = 0
+        self._nested_leased = 0
+        self._is_open = False
+        self._condition = threading.Condition()
+
+        self._initialized = True
+
+    @contextmanager
+    def lease(
+        self,
+        timeout_s: float = DRIVER_LEASE_TIMEOUT_S,
+        nested: bool = False,
+    ) -> Iterator[CustomDriver]:
+        """
+        Lease a healthy driver from the pool and give it back once done
+
+        :param timeout_s: How long to wait for a free driver
+        :param nested: Whether the caller already holds a driver of the pool
+        :raises TimeoutError: If no driver became available in time
+        """
+        driver = self.acquire(timeout_s, nested)
+        try:
+            yield driver
+        finally:
+            self.release(driver, nested)
+
+    def acquire(
+        self,
+        timeout_s: float = DRIVER_LEASE_TIMEOUT_S,
+        nested: bool = False,
+    ) -> CustomDriver:
+        deadline = time.monotonic() + timeout_s
+        with self._condition:
+            while self._is_full(nested):
+                self._wait(deadline, timeout_s)
+            self._count_lease(nested, 1)
+
+        try:
+            return self._acquire_driver(deadline, timeout_s)
+        except Exception:
+            with self._condition:
+                self._count_lease(nested, -1)
+                self._condition.notify_all()
+            raise
+
+    def release(self, driver: CustomDriver, nested: bool = False) -> None:
+        with self._condition:
+            self._count_lease(nested, -1)
+            is_open = self._is_open
+            self._condition.notify_all()
+
+        if not is_open or self._should_recycle(driver):
+            self._discard(driver)
+            return
+
+        try:
+            # Drop the current page so an idle browser doesn't keep running its scripts
+            driver.driver.get("about:blank")
+            driver.use_source(None)
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled driver: {str(e)}")
+            self._discard(driver)
+            return
+
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify_all()
+
+    def open(self) -> None:
+        """
+        Keep the released drivers for the next leases, until the pool is closed
+        """
+        with self._condition:
+            self._is_open = True
+
+    def close(self) -> None:
+        """
+        Quit every idle driver, leased drivers are closed when they are released
+        """
+        with self._condition:
+            self._is_open = False
+            idle, self._idle = self._idle, []
+
+        for driver in idle:
+            self._discard(driver)
+
+    def _acquire_driver(self, deadline: float, timeout_s: float) -> CustomDriver:
+        while True:
+            driver: CustomDriver | None = None
+            with self._condition:
+                # The leases are bounded, this only waits for a discarded browser
+                while not self._idle and self._created >= self.max_size + self.max_nested:
+                    self._wait(deadline, timeout_s)
+
+                if self._idle:
+                    driver = self._idle.pop()
+                else:
+                    # Reserve the slot before launching the browser outside the lock
+                    self._created += 1
+
+            if driver is None:
+                return self._create()
+
+            if driver.is_alive():
+                logger.debug(f"Leased pooled driver ({driver.pages_loaded} pages)")
+                return driver
+
+            logger.warning("Discarding unhealthy pooled driver")
+            self._discard(driver)
+
+    def _wait(self, deadline: float, timeout_s: float) -> None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"No driver available after {timeout_s:.0f} seconds")
+        self._condition.wait(remaining)
+
+    def _is_full(self, nested: bool) -> bool:
+        if nested:
+            return self._nested_leased >= self.max_nested
+        return self._leased >= self.max_size
+
+    def _count_lease(self, nested: bool, count: int) -> None:
+        if nested:
+            self._nested_leased += count
+        else:
+            self._leased += count
+
+    def _create(self) -> CustomDriver:
+        logger.info("Launching a new pooled driver")
+        try:
+            return CustomDriver()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify_all()
+            raise
+
+    def _discard(self, driver: CustomDriver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error while quitting pooled driver: {str(e)}")
+        finally:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify_all()
+
+    def _should_recycle(self, driver: CustomDriver) -> bool:
+        if driver.pages_loaded >= self.max_pages:
+            logger.info(f"Recycling driver after {driver.pages_loaded} pages")
+            return True
+
+        rss_mb = driver.memory_usage_mb()
+        if rss_mb is not None and rss_mb >= self.max_rss_mb:
+            logger.info(f"Recycling driver using {rss_mb:.0f} MB")
+            return True
+
+        return False
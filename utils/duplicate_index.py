@@ -0,0 +1,97 @@
+import threading
+from typing import Callable
+
+from settings import SIMHASH_MAX_DISTANCE, SIMHASH_MIN_WORDS
+from utils.logger import logger
+from utils.simhash import SimHash
+
+
+class DuplicateIndex:
+    """
+    Process-wide index of the SimHash fingerprints of the canonical news
+    articles, banded so a near-duplicate (the same wire story republished by
+    another source) is found without comparing it to every article
+    """
+
+    _bands: dict[tuple[int, int], list[tuple[int, int]]] = {}  # -> [(fingerprint, news ID)]
+    _is_warm = False
+    _reused = 0  # Summaries copied from a canonical article since the last report
+    _lock = threading.Lock()
+
+    @staticmethod
+    def warm(load_fingerprints: Callable[[], list[tuple[int, int]]]) -> None:
+        """Load the stored fingerprints, on the first call only.
+
+        Args:
+            load_fingerprints: Returns the (news ID, fingerprint) of the
+                canonical articles of the news table
+        """
+        with __class__._lock:
+            if __class__._is_warm:
+                return
+            fingerprints = load_fingerprints()
+            for news_id, fingerprint in fingerprints:
+                __class__._add(fingerprint, news_id)
+            __class__._is_warm = True
+        logger.info(f"Duplicate index loaded with {len(fingerprints)} articles")
+
+    @staticmethod
+    def fingerprint(body: str) -> int | None:
+        """Fingerprint of an article body.
+
+        Returns:
+            int | None: None if the body is too short to be told apart reliably
+        """
+        if len(body.split()) < SIMHASH_MIN_WORDS:
+            return None
+        return SimHash.fingerprint(body)
+
+    @staticmethod
+    def find(fingerprint: int) -> int | None:
+        """Find the canonical article of a fingerprint.
+
+        Args:
+            fingerprint: Fingerprint of the new article
+
+        Returns:
+            int | None: ID of the closest article within SIMHASH_MAX_DISTANCE
+                bits, None if there is none
+        """
+        best: tuple[int, int] | None = None
+        with __class__._lock:
+            for key in SimHash.bands(fingerprint):
+                for candidate, news_id in __class__._bands.get(key, ()):
+                    distance = SimHash.distance(fingerprint, candidate)
+                    if distance <= SIMHASH_MAX_DISTANCE and (
+                        best is None or distance < best[0]
+                    ):
+                        best = (distance, news_id)
+        return best[1] if best else None
+
+    @staticmethod
+    def add(fingerprint: int, news_id: int) -> None:
+        with __class__._lock:
+            __class__._add(fingerprint, news_id)
+
+    @staticmethod
+    def record_reused() -> None:
+        """Count a near-duplicate given the summary of its canonical article."""
+        with __class__._lock:
+            __class__._reused += 1
+
+    @staticmethod
+    def report() -> None:
+        """Log the summaries reused since the last report, and start counting again."""
+        with __class__._lock:
+            reused = __class__._reused
+            __class__._reused = 0
+        if reused:
+            logger.info(
+                f"Reused the summary of {reused} near-duplicate articles, "
+                f"{reused} LLM calls avoided"
+            )
+
+    @staticmethod
+    def _add(fingerprint: int, news_id: int) -> None:
+        for key in SimHash.bands(fingerprint):
+            __class__._bands.setdefault(key, []).append((fingerprint, news_id))
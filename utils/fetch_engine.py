@@ -0,0 +1,151 @@
+import threading
+import time
+
+from dtypes.selector import Selector
+from models.enums.fetch_mode import FetchMode
+from models.source import Source
+from repositories.source_repository import SourceRepository
+from settings import FETCH_MODE_HTTP_MISSES, FETCH_MODE_REPROBE_S
+from utils.custom_soup import CustomSoup
+from utils.driver_pool import DriverPool
+from utils.host_limiter import HostLimiter
+from utils.http_client import HttpClient
+from utils.logger import logger
+
+
+class FetchEngine:
+    """
+    Fetch article pages over plain HTTP when the source allows it and fall back
+    to the browser otherwise, remembering per source which mode worked.
+
+    A source only moves to the browser after FETCH_MODE_HTTP_MISSES HTTP misses
+    in a row, and HTTP is tried again every FETCH_MODE_REPROBE_S afterwards.
+    """
+
+    # Shared by every engine of the process, by source ID
+    _http_misses: dict[int, int] = {}
+    _probed_at: dict[int, float] = {}
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.source_repository = SourceRepository()
+
+    def get_soup(
+        self,
+        source: Source,
+        url: str,
+        selector: Selector,
+    ) -> CustomSoup:
+        """Fetch and parse an article page, safe to call from several threads.
+
+        Args:
+            source: The source the article belongs to
+            url: The article URL
+            selector: The source selectors, used to validate the HTTP response
+
+        Returns:
+            CustomSoup of the article page
+        """
+        with HostLimiter.acquire(url):
+            return self._get_soup(source, url, selector)
+
+    def _get_soup(
+        self,
+        source: Source,
+        url: str,
+        selector: Selector,
+    ) -> CustomSoup:
+        if self.should_try_http(source):
+            html = HttpClient.get_html(url)
+            if html is not None:
+                soup = CustomSoup(html)
+                if __class__.selectors_match(soup, selector, url):
+                    logger.info(f"Fetched {url} over HTTP")
+                    self.remember(source, FetchMode.HTTP)
+                    return soup
+
+            logger.info(f"HTTP response of {url} is incomplete, using the browser")
+
+        return self.get_browser_soup(source, url, selector)
+
+    def get_browser_soup(
+        self,
+        source: Source,
+        url: str,
+        selector: Selector,
+    ) -> CustomSoup:
+        """Load an article page in a pooled browser.
+
+        Args:
+            source: The source the article belongs to
+            url: The article URL
+            selector: The source selectors, used to learn the fetch mode
+
+        Returns:
+            CustomSoup of the rendered article page
+        """
+        # Borrow a browser of its own so the caller's listing page is never left
+        with DriverPool().lease(nested=True) as driver:
+            driver.use_source(source.url)
+            driver.get(url)
+            soup = CustomSoup(driver.get_html())
+        if __class__.selectors_match(soup, selector, url):
+            self.remember(source, FetchMode.BROWSER)
+        return soup
+
+    @staticmethod
+    def should_try_http(source: Source) -> bool:
+        """Tell if an article page should be fetched over HTTP first.
+
+        Args:
+            source: The source the article belongs to
+
+        Returns:
+            bool: True unless the source uses the browser, except for one
+                article every FETCH_MODE_REPROBE_S
+        """
+        if source.fetchMode != FetchMode.BROWSER:
+            return True
+
+        now = time.monotonic()
+        with __class__._lock:
+            probed_at = __class__._probed_at.get(source.id)
+            if probed_at is not None and now - probed_at < FETCH_MODE_REPROBE_S:
+                return False
+            __class__._probed_at[source.id] = now
+
+        logger.info(f"Probing HTTP again for {source.url}")
+        return True
+
+    @staticmethod
+    def selectors_match(soup: CustomSoup, selector: Selector, url: str) -> bool:
+        content = soup.extract(selector, url)
+        return bool(content["body"] and content["post_date"])
+
+    def remember(self, source: Source, fetch_mode: FetchMode) -> None:
+        """Record the mode an article page of a source was read with.
+
+        Args:
+            source: The source the article belongs to
+            fetch_mode: HTTP if the HTTP response matched the selectors,
+                BROWSER if only the rendered page did
+        """
+        with __class__._lock:
+            if fetch_mode == FetchMode.HTTP:
+                __class__._http_misses.pop(source.id, None)
+            elif source.fetchMode != FetchMode.BROWSER:
+                misses = __class__._http_misses.get(source.id, 0) + 1
+                __class__._http_misses[source.id] = misses
+                if misses < FETCH_MODE_HTTP_MISSES:
+                    return
+                __class__._http_misses.pop(source.id, None)
+                __class__._probed_at[source.id] = time.monotonic()
+
+        if source.fetchMode == fetch_mode:
+            return
+
+        source.fetchMode = fetch_mode
+        try:
+            self.source_repository.set_fetch_mode(source.id, fetch_mode)
+        except Exception as e:
+            logger.warning(f"Could not store fetch mode for {source.url}: {str(e)}")
@@ -0,0 +1,34 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+from urllib.parse import urlparse
+
+from settings import PER_HOST_CONCURRENCY
+
+
+class HostLimiter:
+    """
+    Cap the number of concurrent requests sent to the same host, shared by
+    every scraping thread of the process
+    """
+
+    _semaphores: dict[str, threading.BoundedSemaphore] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    @contextmanager
+    def acquire(url: str) -> Iterator[None]:
+        """Hold one of the fetch slots of the URL host.
+
+        Args:
+            url: The URL about to be fetched
+        """
+        host = urlparse(url).netloc.lower()
+        with __class__._lock:
+            semaphore = __class__._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(PER_HOST_CONCURRENCY)
+                __class__._semaphores[host] = semaphore
+
+        with semaphore:
+            yield
@@ -0,0 +1,43 @@
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+from settings import HTML_PARSER
+from utils.logger import logger
+
+
+class HtmlParser:
+    """
+    Parse HTML with the backend chosen by the HTML_PARSER setting. Every
+    backend builds the same BeautifulSoup tree, so select, select_one and
+    get_text and the stored selectors work unchanged
+    """
+
+    DEFAULT_BACKEND = "html.parser"
+
+    _backend: str | None = None
+
+    @staticmethod
+    def get_backend() -> str:
+        """Get the parser in use, html.parser if the configured one isn't installed."""
+        if __class__._backend is None:
+            backend = HTML_PARSER
+            if builder_registry.lookup(backend) is None:
+                logger.warning(
+                    f"HTML parser {backend} is not available, using {__class__.DEFAULT_BACKEND}"
+                )
+                backend = __class__.DEFAULT_BACKEND
+            __class__._backend = backend
+        return __class__._backend
+
+    @staticmethod
+    def parse(html: str, backend: str | None = None) -> BeautifulSoup:
+        """Parse an HTML document.
+
+        Args:
+            html: The document
+            backend: Parser to use instead of the configured one
+
+        Returns:
+            BeautifulSoup: The parsed document
+        """
+        return BeautifulSoup(html, backend or __class__.get_backend())
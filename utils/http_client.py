@@ -0,0 +1,67 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from settings import HTTP_POOL_SIZE, HTTP_TIMEOUT_S, HTTP_USER_AGENT
+from utils.logger import logger
+
+
+class HttpClient:
+    """
+    Process-wide keep-alive HTTP client used to fetch pages without a browser
+    """
+
+    HEADERS = {
+        "User-Agent": HTTP_USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9,fr;q=0.8,ar;q=0.7",
+    }
+
+    _session: requests.Session | None = None
+    _session_lock = threading.Lock()
+
+    @staticmethod
+    def get_session() -> requests.Session:
+        with __class__._session_lock:
+            if __class__._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(__class__.HEADERS)
+                __class__._session = session
+            return __class__._session
+
+    @staticmethod
+    def get_html(url: str, timeout_s: float = HTTP_TIMEOUT_S) -> str | None:
+        """Fetch a page over HTTP.
+
+        Args:
+            url: The URL to fetch
+            timeout_s: Connect and read timeout in seconds
+
+        Returns:
+            The decoded HTML, None if the request failed or didn't return HTML
+        """
+        try:
+            response = __class__.get_session().get(url, timeout=timeout_s)
+        except requests.RequestException as e:
+            logger.warning(f"HTTP fetch failed for {url}: {str(e)}")
+            return None
+
+        content_type = response.headers.get("Content-Type", "").lower()
+        if response.status_code != 200 or "html" not in content_type:
+            logger.info(
+                f"HTTP fetch of {url} returned {response.status_code} ({content_type})"
+            )
+            return None
+
+        if "charset" not in content_type:
+            # requests falls back to ISO-8859-1 for text/* without a charset
+            response.encoding = response.apparent_encoding
+
+        return response.text
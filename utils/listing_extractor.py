@@ -0,0 +1,122 @@
+from selenium.common.exceptions import JavascriptException
+
+from dtypes.listing_item import ListingItem
+from protocols.custom_driver_protocol import CustomDriverProtocol
+from settings import LISTING_EXTRACTION
+from utils.html_parser import HtmlParser
+from utils.logger import logger
+
+# Runs both selectors in the page and returns the {title, href} pairs, links
+# returned by an earlier call on the same page are skipped so only the new
+# articles cross the WebDriver connection
+EXTRACT_LISTING_SCRIPT = """
+const [titleSelector, linkSelector] = arguments;
+const key = titleSelector + "\\n" + linkSelector;
+window.__listingSeen = window.__listingSeen || new Map();
+if (!window.__listingSeen.has(key)) {
+    window.__listingSeen.set(key, new WeakSet());
+}
+const seen = window.__listingSeen.get(key);
+
+const titles = document.querySelectorAll(titleSelector);
+const links = document.querySelectorAll(linkSelector);
+const items = [];
+for (let i = 0; i < Math.min(titles.length, links.length); i++) {
+    const link = links[i];
+    if (seen.has(link)) {
+        continue;
+    }
+    seen.add(link);
+    const href = link.getAttribute("href");
+    if (href !== null) {
+        items.push({title: titles[i].textContent.trim(), href: href});
+    }
+}
+return items;
+"""
+
+
+class ListingExtractor:
+    """
+    Extract the articles of a listing page and remember the ones already
+    returned, so each load of a listing only yields the articles it added
+    """
+
+    def __init__(self, title_selector: str, link_selector: str) -> None:
+        """
+        :param title_selector: CSS selector of the article titles
+        :param link_selector: CSS selector of the article links, in the same order
+        """
+        self.title_selector = title_selector
+        self.link_selector = link_selector
+        self.seen_hrefs: set[str] = set()
+        self.in_browser = LISTING_EXTRACTION == "browser"
+
+    def new_items_from(self, custom_driver: CustomDriverProtocol) -> list[ListingItem]:
+        """Extract the articles of the page loaded in a browser not returned before.
+
+        The selectors run inside the page when the browser accepts them,
+        otherwise the page source is parsed (e.g. soupsieve only pseudo classes).
+
+        Args:
+            custom_driver: The driver showing the listing page
+
+        Returns:
+            list[ListingItem]: The articles whose href wasn't seen yet
+        """
+        if self.in_browser:
+            custom_driver.wait_until_loaded()
+            try:
+                items: list[ListingItem] = custom_driver.driver.execute_script(
+                    EXTRACT_LISTING_SCRIPT, self.title_selector, self.link_selector
+                )
+                return self.remember(items)
+            except JavascriptException as e:
+                logger.warning(
+                    f"Listing selectors can't run in the browser, parsing the page: {e.msg}"
+                )
+                self.in_browser = False
+
+        return self.new_items(custom_driver.get_html())
+
+    def extract(self, html: str) -> list[ListingItem]:
+        """Extract every article of a listing page.
+
+        Args:
+            html: The listing page
+
+        Returns:
+            list[ListingItem]: The articles in page order, pairing the n-th
+                title with the n-th link, links without href are skipped
+        """
+        soup = HtmlParser.parse(html)
+        titles = soup.select(self.title_selector)
+        links = soup.select(self.link_selector)
+
+        items: list[ListingItem] = []
+        for title, link in zip(titles, links):
+            href = link.get("href")
+            if href is None:
+                continue
+            items.append({"title": title.get_text().strip(), "href": str(href)})
+        return items
+
+    def new_items(self, html: str) -> list[ListingItem]:
+        """Extract the articles of a listing page not returned before.
+
+        Args:
+            html: The listing page, usually the same page after loading more
+
+        Returns:
+            list[ListingItem]: The articles whose href wasn't seen yet
+        """
+        return self.remember(self.extract(html))
+
+    def remember(self, items: list[ListingItem]) -> list[ListingItem]:
+        """Keep the items not returned before and mark them as seen."""
+        new_items: list[ListingItem] = []
+        for item in items:
+            if item["href"] not in self.seen_hrefs:
+                self.seen_hrefs.add(item["href"])
+                new_items.append(item)
+        return new_items
@@ -0,0 +1,58 @@
+import re
+from urllib.parse import urljoin
+
+# Page number of a listing URL: a page query parameter (?page=2, &paged=2...)
+# or a page path segment (/page/2/, /p/2)
+_PAGE_NUMBER_PATTERNS = [
+    re.compile(
+        r"[?&](?:page|paged|pg|p|pagina|seite|page_no|pageNumber)=(\d+)(?=&|#|$)"
+    ),
+    re.compile(r"/(?:page|pages|p|pagina|seite)/(\d+)(?=/|\?|#|$)"),
+]
+
+
+class PageUrlPattern:
+    """
+    URL of the pages of a paginated listing, with the page number at a known
+    position so any page can be loaded without clicking through the others
+    """
+
+    def __init__(self, prefix: str, suffix: str) -> None:
+        """
+        :param prefix: URL before the page number
+        :param suffix: URL after the page number
+        """
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def url_for(self, page: int) -> str:
+        return f"{self.prefix}{page}{self.suffix}"
+
+    @staticmethod
+    def detect(
+        current_url: str,
+        next_href: str | None,
+        next_page: int = 2,
+    ) -> "PageUrlPattern | None":
+        """Find the page number in the link of the next button.
+
+        Args:
+            current_url: URL of the page showing the next button
+            next_href: href of the next button, relative or absolute
+            next_page: Number of the page the button leads to
+
+        Returns:
+            PageUrlPattern | None: The pattern, None if the link doesn't contain
+                next_page as a page parameter or path segment
+        """
+        if not next_href or next_href.startswith(("#", "javascript:")):
+            return None
+
+        next_url = urljoin(current_url, next_href)
+        for pattern in _PAGE_NUMBER_PATTERNS:
+            for match in pattern.finditer(next_url):
+                if int(match.group(1)) == next_page:
+                    return PageUrlPattern(
+                        next_url[: match.start(1)], next_url[match.end(1) :]
+                    )
+        return None
@@ -0,0 +1,161 @@
+import time
+from typing import TypedDict
+
+from selenium.webdriver.edge.webdriver import WebDriver
+
+from settings import (
+    PAGE_CHANGE_TIMEOUT_S,
+    PAGE_QUIET_MS,
+    PAGE_WAIT_MARGIN,
+    PAGE_WAIT_MAX_S,
+    PAGE_WAIT_MIN_S,
+    PAGE_WAIT_POLL_S,
+    PAGE_WAIT_TIMEOUT_S,
+)
+from utils.logger import logger
+
+# Describes the page, and records the time of the last DOM change with a
+# MutationObserver installed on first use (again after each navigation)
+PAGE_STATE_SCRIPT = """
+const countSelector = arguments[0];
+if (!window.__pageWaiter) {
+    window.__pageWaiter = {lastMutation: performance.now()};
+    new MutationObserver(() => {
+        window.__pageWaiter.lastMutation = performance.now();
+    }).observe(document, {childList: true, subtree: true});
+}
+
+let count = 0;
+try {
+    count = countSelector ? document.querySelectorAll(countSelector).length : 0;
+} catch (e) {}
+
+return {
+    url: location.href,
+    ready: document.readyState === "complete",
+    height: document.body ? document.body.scrollHeight : 0,
+    count: count,
+    quietMs: performance.now() - window.__pageWaiter.lastMutation,
+};
+"""
+
+
+class PageState(TypedDict):
+    url: str
+    ready: bool
+    height: int
+    count: int
+    quietMs: float
+
+
+class PageWaiter:
+    """
+    Wait for a listing page to change after a scroll or a click, instead of
+    sleeping a fixed time: the wait ends as soon as the page navigated, grew or
+    got more articles, and stopped changing for PAGE_QUIET_MS. Pages kept
+    changing by carousels or ads count as loaded once the timeout is reached.
+
+    The timeout is learned per source from how long its pages took to change.
+    The end of a listing, where nothing changes, is found after a shorter wait
+    learned from how long the changes of this run took to start.
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        count_selector: str | None = None,
+        timeout_s: float | None = None,
+    ) -> None:
+        """
+        :param driver: The browser showing the listing
+        :param count_selector: CSS selector of the articles, a new article counts as a change
+        :param timeout_s: Timeout learned on an earlier run, PAGE_WAIT_TIMEOUT_S if None
+        """
+        self.driver = driver
+        self.count_selector = count_selector
+        self.timeout_s = timeout_s or PAGE_WAIT_TIMEOUT_S
+        self.durations_s: list[float] = []
+        self.change_durations_s: list[float] = []  # Until the first change
+
+    def get_state(self) -> PageState:
+        return self.driver.execute_script(PAGE_STATE_SCRIPT, self.count_selector)
+
+    def wait_for_change(
+        self,
+        before: PageState,
+        timeout_s: float | None = None,
+    ) -> bool:
+        """Wait until the page changed since a state and is done changing.
+
+        Args:
+            before: State of the page before the scroll or click
+            timeout_s: Maximum wait, the learned timeout if None
+
+        Returns:
+            bool: False if the page didn't change in time, True once it changed
+                even if it never stopped changing
+        """
+        timeout_s = timeout_s or self.timeout_s
+        start = time.monotonic()
+        change_deadline = start + self._change_timeout_s(timeout_s)
+        deadline = start + timeout_s
+        changed_at: float | None = None
+
+        while True:
+            state = self.get_state()
+            now = time.monotonic()
+            if changed_at is None and __class__._has_changed(before, state):
+                changed_at = now
+                self.change_durations_s.append(changed_at - start)
+
+            if changed_at is None:
+                if now >= change_deadline:
+                    return False
+            elif state["ready"] and state["quietMs"] >= PAGE_QUIET_MS:
+                break
+            elif now >= deadline:
+                logger.debug("Page changed but kept changing until the timeout")
+                # Only the change is measured, the timeout would grow every run
+                self.durations_s.append(changed_at - start)
+                return True
+
+            time.sleep(PAGE_WAIT_POLL_S)
+
+        duration_s = time.monotonic() - start
+        self.durations_s.append(duration_s)
+        logger.debug(f"Page changed after {duration_s:.2f}s")
+        return True
+
+    def learned_timeout_s(self) -> float | None:
+        """Timeout to use on the next run of the source.
+
+        Returns:
+            float | None: The slowest change seen times PAGE_WAIT_MARGIN, within
+                PAGE_WAIT_MIN_S and PAGE_WAIT_MAX_S, None if nothing was measured
+        """
+        if not self.durations_s:
+            return None
+        timeout_s = max(self.durations_s) * PAGE_WAIT_MARGIN
+        return min(max(timeout_s, PAGE_WAIT_MIN_S), PAGE_WAIT_MAX_S)
+
+    def _change_timeout_s(self, timeout_s: float) -> float:
+        """Wait for the first change, what ending a listing costs.
+
+        Returns:
+            float: The slowest first change of this run times PAGE_WAIT_MARGIN,
+                PAGE_CHANGE_TIMEOUT_S until one was measured, at least
+                PAGE_WAIT_MIN_S and at most the whole timeout
+        """
+        if self.change_durations_s:
+            change_timeout_s = max(self.change_durations_s) * PAGE_WAIT_MARGIN
+        else:
+            change_timeout_s = PAGE_CHANGE_TIMEOUT_S
+        return min(max(change_timeout_s, PAGE_WAIT_MIN_S), timeout_s)
+
+    @staticmethod
+    def _has_changed(before: PageState, state: PageState) -> bool:
+        return (
+            state["url"] != before["url"]
+            or state["height"] != before["height"]
+            or state["count"] != before["count"]
+        )
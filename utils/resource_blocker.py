@@ -0,0 +1,177 @@
+import json
+import threading
+
+from selenium.webdriver.edge.webdriver import WebDriver
+
+from constants import RESOURCE_BLOCKING_PROFILES
+from settings import (
+    RESOURCE_BLOCKING_OVERRIDES,
+    RESOURCE_BLOCKING_PROFILE,
+    RESOURCE_STATS_ENABLED,
+)
+from utils.logger import logger
+
+
+class ResourceStats:
+    """
+    Process-wide count of the resources blocked by the browsers, and an
+    estimate of the bytes they would have downloaded
+    """
+
+    # Typical transfer size of a resource type, used until one was downloaded
+    TYPICAL_BYTES = {
+        "Image": 40_000,
+        "Font": 30_000,
+        "Media": 500_000,
+        "Script": 25_000,
+        "Stylesheet": 10_000,
+        "XHR": 5_000,
+        "Fetch": 5_000,
+    }
+    DEFAULT_BYTES = 10_000
+
+    _blocked: dict[str, int] = {}
+    _downloaded_bytes: dict[str, int] = {}
+    _downloaded_count: dict[str, int] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def record_blocked(resource_type: str) -> None:
+        with __class__._lock:
+            __class__._blocked[resource_type] = (
+                __class__._blocked.get(resource_type, 0) + 1
+            )
+
+    @staticmethod
+    def record_downloaded(resource_type: str, size: int) -> None:
+        with __class__._lock:
+            __class__._downloaded_bytes[resource_type] = (
+                __class__._downloaded_bytes.get(resource_type, 0) + size
+            )
+            __class__._downloaded_count[resource_type] = (
+                __class__._downloaded_count.get(resource_type, 0) + 1
+            )
+
+    @staticmethod
+    def estimate_bytes_saved() -> int:
+        """Estimate the bytes the blocked resources would have cost.
+
+        Returns:
+            int: Blocked resources of each type times the average size of the
+                resources of that type that were downloaded, or a typical size
+        """
+        with __class__._lock:
+            saved = 0
+            for resource_type, count in __class__._blocked.items():
+                downloaded = __class__._downloaded_count.get(resource_type)
+                if downloaded:
+                    average = __class__._downloaded_bytes[resource_type] / downloaded
+                else:
+                    average = __class__.TYPICAL_BYTES.get(
+                        resource_type, __class__.DEFAULT_BYTES
+                    )
+                saved += int(count * average)
+            return saved
+
+    @staticmethod
+    def report() -> None:
+        with __class__._lock:
+            blocked = dict(__class__._blocked)
+            downloaded = sum(__class__._downloaded_bytes.values())
+        if not blocked:
+            return
+
+        saved = __class__.estimate_bytes_saved()
+        details = ", ".join(f"{count} {kind}" for kind, count in sorted(blocked.items()))
+        logger.info(
+            f"Blocked {sum(blocked.values())} resources ({details}), "
+            f"~{saved / 1e6:.1f} MB saved, {downloaded / 1e6:.1f} MB downloaded"
+        )
+
+
+class ResourceBlocker:
+    """
+    Block the resource URLs of the blocking profile of the source the browser
+    is loading pages for, and feed ResourceStats from the performance log
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        self.driver = driver
+        self.profile: str | None = None
+        self._resource_types: dict[str, str] = {}  # Request ID -> resource type
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.use_source(None)
+
+    @staticmethod
+    def get_profile(source_url: str | None) -> str:
+        """Get the blocking profile of a source.
+
+        Args:
+            source_url: URL of the source, None for pages of no source
+
+        Returns:
+            str: The profile of the source in RESOURCE_BLOCKING_OVERRIDES,
+                RESOURCE_BLOCKING_PROFILE otherwise
+        """
+        if source_url:
+            source_url = source_url.rstrip("/")
+            for url, profile in RESOURCE_BLOCKING_OVERRIDES.items():
+                if url.rstrip("/") == source_url:
+                    return profile
+        return RESOURCE_BLOCKING_PROFILE
+
+    def use_source(self, source_url: str | None) -> None:
+        """Block the resources of the profile of a source, for the next loads.
+
+        Args:
+            source_url: URL of the source, None for pages of no source
+        """
+        profile = __class__.get_profile(source_url)
+        if profile == self.profile:
+            return
+
+        if profile not in RESOURCE_BLOCKING_PROFILES:
+            logger.warning(f"Unknown resource blocking profile {profile}, using none")
+            profile = "none"
+
+        self.driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": RESOURCE_BLOCKING_PROFILES[profile]}
+        )
+        self.profile = profile
+
+    def collect_stats(self) -> None:
+        """
+        Read the network events logged since the last call into ResourceStats
+        """
+        if not RESOURCE_STATS_ENABLED:
+            return
+
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"Performance log unavailable: {str(e)}")
+            return
+
+        for entry in entries:
+            message = entry["message"]
+            # Most events are irrelevant, skip them before decoding the JSON
+            if (
+                "Network.loading" not in message
+                and "Network.responseReceived" not in message
+            ):
+                continue
+
+            event = json.loads(message)["message"]
+            method = event.get("method")
+            params = event.get("params", {})
+            if method == "Network.responseReceived":
+                self._resource_types[params["requestId"]] = params.get("type", "Other")
+            elif method == "Network.loadingFinished":
+                resource_type = self._resource_types.pop(params["requestId"], "Other")
+                ResourceStats.record_downloaded(
+                    resource_type, int(params.get("encodedDataLength", 0))
+                )
+            elif method == "Network.loadingFailed":
+                self._resource_types.pop(params["requestId"], None)
+                if params.get("blockedReason") == "inspector":
+                    ResourceStats.record_blocked(params.get("type", "Other"))
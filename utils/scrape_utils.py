@@ -14,6 +14,8 @@ from utils.selector_generator import SelectorGenerator
 class ScrapeUtils:
     @staticmethod
     def scrape_news(url: str):
+        html_content: str | None = None
+        are_selectors_valid = False
         try:
             # Benchmark get_selector
             start_get_selector = time.time()
@@ -44,6 +46,8 @@ class ScrapeUtils:
             )
 
             if page_url and title:
+                are_selectors_valid = True
+
                 # Benchmark URL resolution
                 start_resolve = time.time()
                 page_url = CustomSoup.resolve_relative_url(url, page_url)
@@ -72,8 +76,13 @@ class ScrapeUtils:
                 )
 
                 return result
+
+            logger.warning("The generated selectors find no article link or title")
+            SelectorGenerator.forget_selectors(html_content, NEWS_PROMPTS_PATH)
         except Exception as e:
             logger.error(f"Failed to scrape news: {str(e)}")
+            if html_content is not None and not are_selectors_valid:
+                SelectorGenerator.forget_selectors(html_content, NEWS_PROMPTS_PATH)
 
     @staticmethod
     def scrape_news_detail(
@@ -86,6 +95,7 @@ class ScrapeUtils:
         html_content, page_selector = SelectorGenerator.get_scraping_selectors(
             page_url,
             NEWS_DETAIL_PROMPTS_PATH,
+            source_url=base_url,
         )
 
         soup = CustomSoup(html_content)
@@ -147,6 +157,9 @@ class ScrapeUtils:
 
                 if "cookies" in body:
                     logger.warning("Found 'cookies' in body text, skipping article")
+                    SelectorGenerator.forget_selectors(
+                        html_content, NEWS_DETAIL_PROMPTS_PATH
+                    )
                     return None
 
                 if image_url is not None:
@@ -185,6 +198,9 @@ class ScrapeUtils:
                     )
                 except ValueError as e:
                     logger.error(f"Validation error: {e}")
+                    SelectorGenerator.forget_selectors(
+                        html_content, NEWS_DETAIL_PROMPTS_PATH
+                    )
                     return None
 
                 # Logging selector validation
@@ -234,3 +250,4 @@ class ScrapeUtils:
                 raise Exception(f"Body or postdate does not exists {body} {post_date}")
         except Exception as e:
             logger.error(f"Failed to scrape news details: {str(e)}")
+            SelectorGenerator.forget_selectors(html_content, NEWS_DETAIL_PROMPTS_PATH)
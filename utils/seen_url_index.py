@@ -0,0 +1,58 @@
+import threading
+from typing import Callable
+
+from utils.logger import logger
+
+
+class SeenUrlIndex:
+    """
+    Process-wide set of the article URLs already in the news table, loaded
+    once and kept up to date as articles are inserted, so known articles are
+    not fetched again
+    """
+
+    _urls: set[str] = set()
+    _is_warm = False
+    _skipped = 0  # Known articles skipped since the last report
+    _lock = threading.Lock()
+
+    @staticmethod
+    def warm(load_urls: Callable[[], list[str]]) -> None:
+        """Load the stored article URLs, on the first call only.
+
+        Args:
+            load_urls: Returns the URLs of the news table
+        """
+        with __class__._lock:
+            if __class__._is_warm:
+                return
+            __class__._urls.update(load_urls())
+            __class__._is_warm = True
+            logger.info(f"Seen URL index loaded with {len(__class__._urls)} articles")
+
+    @staticmethod
+    def contains(url: str) -> bool:
+        return url in __class__._urls
+
+    @staticmethod
+    def add(url: str) -> None:
+        with __class__._lock:
+            __class__._urls.add(url)
+
+    @staticmethod
+    def record_skipped() -> None:
+        with __class__._lock:
+            __class__._skipped += 1
+
+    @staticmethod
+    def report() -> None:
+        """Log the work saved since the last report, and start counting again."""
+        with __class__._lock:
+            skipped = __class__._skipped
+            __class__._skipped = 0
+        if not skipped:
+            return
+
+        # No LLM calls are counted: fetched again, a known article would match
+        # its own fingerprint in DuplicateIndex and reuse its stored summary
+        logger.info(f"Skipped {skipped} known articles: {skipped} page fetches avoided")
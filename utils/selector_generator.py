@@ -1,6 +1,6 @@
 from ai.llm import Llm
 from ai.prompt import Prompt
-from utils.custom_driver import CustomDriver
+from utils.driver_pool import DriverPool
 from utils.logger import logger
 
 
@@ -9,24 +9,27 @@ class SelectorGenerator:
     def get_scraping_selectors(
         url: str,
         selector_prompt_template_path: str,
+        source_url: str | None = None,
     ) -> tuple[str, dict[str, object | dict]]:
         """Fetch HTML content and generate CSS selectors for web scraping using AI.
 
         Args:
             url: The URL to scrape
             selector_prompt_template_path: Path to the prompt template that instructs AI to generate selectors
+            source_url: URL of the source the page belongs to, the page URL if None
 
         Returns:
             tuple containing:
                 - HTML content of the page
                 - Dictionary of CSS selectors for scraping different elements
         """
-        driver = CustomDriver()
         llm = Llm()
 
-        driver.get(url)
-        html_content = driver.get_html()
-        driver.quit()
+        # Also called while a scrape worker holds its listing browser
+        with DriverPool().lease(nested=True) as driver:
+            driver.use_source(source_url or url)
+            driver.get(url)
+            html_content = driver.get_html()
 
         prompt = Prompt(
             template_path=selector_prompt_template_path,
@@ -39,3 +42,19 @@ class SelectorGenerator:
         selectors: dict[str, object | dict] = result.code # type: ignore
 
         return html_content, selectors
+
+    @staticmethod
+    def forget_selectors(html_content: str, selector_prompt_template_path: str) -> None:
+        """Drop the cached selectors of a page once they failed validation, so a
+        retry generates new ones instead of getting the same answer again.
+
+        Args:
+            html_content: HTML content the selectors were generated from
+            selector_prompt_template_path: Path to the prompt template used
+        """
+        Llm().evict(
+            Prompt(
+                template_path=selector_prompt_template_path,
+                content=html_content,
+            )
+        )
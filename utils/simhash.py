@@ -0,0 +1,75 @@
+import hashlib
+import re
+
+from settings import SIMHASH_BANDS, SIMHASH_SHINGLE_WORDS
+
+_WORD_PATTERN = re.compile(r"\w+")
+_BITS = 64
+
+
+class SimHash:
+    """
+    64 bit SimHash of a text over its word shingles: texts sharing most of
+    their shingles get fingerprints differing in a few bits only
+    """
+
+    @staticmethod
+    def shingles(text: str) -> list[str]:
+        words = _WORD_PATTERN.findall(text.lower())
+        size = SIMHASH_SHINGLE_WORDS
+        if len(words) < size:
+            return [" ".join(words)] if words else []
+        return [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+
+    @staticmethod
+    def fingerprint(text: str) -> int | None:
+        """Compute the fingerprint of a text.
+
+        Args:
+            text: The text, markup included or not
+
+        Returns:
+            int | None: Unsigned 64 bit fingerprint, None if the text has no word
+        """
+        shingles = __class__.shingles(text)
+        if not shingles:
+            return None
+
+        weights = [0] * _BITS
+        for shingle in shingles:
+            digest = hashlib.blake2b(shingle.encode(), digest_size=8).digest()
+            bits = int.from_bytes(digest, "big")
+            for i, bit in enumerate(f"{bits:064b}"):
+                weights[i] += 1 if bit == "1" else -1
+
+        fingerprint = 0
+        for weight in weights:
+            fingerprint = (fingerprint << 1) | (weight > 0)
+        return fingerprint
+
+    @staticmethod
+    def distance(a: int, b: int) -> int:
+        return (a ^ b).bit_count()
+
+    @staticmethod
+    def bands(fingerprint: int) -> list[tuple[int, int]]:
+        """Split a fingerprint into SIMHASH_BANDS (position, bits) keys.
+
+        Two fingerprints differing in fewer bits than there are bands share at
+        least one band, so only the fingerprints sharing a band get compared.
+        """
+        width = _BITS // SIMHASH_BANDS
+        mask = (1 << width) - 1
+        return [
+            (band, (fingerprint >> (band * width)) & mask)
+            for band in range(SIMHASH_BANDS)
+        ]
+
+    @staticmethod
+    def to_signed(fingerprint: int) -> int:
+        """Fit an unsigned fingerprint in a BIGINT column."""
+        return fingerprint - (1 << _BITS) if fingerprint >= 1 << (_BITS - 1) else fingerprint
+
+    @staticmethod
+    def from_signed(value: int) -> int:
+        return value + (1 << _BITS) if value < 0 else value
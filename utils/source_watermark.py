@@ -0,0 +1,81 @@
+import datetime
+
+from dtypes.listing_item import ListingItem
+from dtypes.watermark_dict import WatermarkDict
+from settings import WATERMARK_SIZE
+
+
+class SourceWatermark:
+    """
+    High-water mark of a source: the listing URLs of its newest articles and
+    their newest post date at the last scrape. Listing pages are checked
+    against it so an incremental scrape stops at the first page it already
+    read, instead of opening old articles to find out from their date.
+    """
+
+    def __init__(
+        self,
+        watermark: WatermarkDict | None = None,
+        size: int = WATERMARK_SIZE,
+    ) -> None:
+        """
+        :param watermark: Watermark stored by the last scrape, None if there was none
+        :param size: Number of listing URLs to remember
+        """
+        self.size = size
+        self.previous_urls = watermark["urls"] if watermark else []
+        self.known_urls = set(self.previous_urls)
+        self.newest_date = (
+            datetime.datetime.fromisoformat(watermark["newestDate"])
+            if watermark and watermark["newestDate"]
+            else None
+        )
+        self.run_urls: list[str] = []  # Listing URLs of this scrape, in order
+
+    def unknown_items(self, items: list[ListingItem]) -> list[ListingItem] | None:
+        """Record the articles of a listing load and drop the known ones.
+
+        Args:
+            items: The articles added by the load, in page order
+
+        Returns:
+            list[ListingItem] | None: The articles not read by the last scrape,
+                None if there were articles and all of them were read
+        """
+        for item in items:
+            if len(self.run_urls) < self.size:
+                self.run_urls.append(item["href"])
+
+        unknown = [item for item in items if item["href"] not in self.known_urls]
+        if items and not unknown:
+            return None
+        return unknown
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the last scrape stored no watermark, e.g. before the migration."""
+        return not self.previous_urls
+
+    def record_date(self, date: datetime.datetime) -> None:
+        if self.newest_date is None or __class__._is_newer(date, self.newest_date):
+            self.newest_date = date
+
+    def to_dict(self) -> WatermarkDict:
+        """Watermark to store once the scrape is done.
+
+        Returns:
+            WatermarkDict: The first listing URLs of this scrape, completed with
+                the previous ones up to the watermark size
+        """
+        urls = list(dict.fromkeys(self.run_urls + self.previous_urls))
+        return {
+            "urls": urls[: self.size],
+            "newestDate": self.newest_date.isoformat() if self.newest_date else None,
+        }
+
+    @staticmethod
+    def _is_newer(date: datetime.datetime, other: datetime.datetime) -> bool:
+        # Post dates are naive or aware depending on the site
+        if (date.tzinfo is None) != (other.tzinfo is None):
+            return date.replace(tzinfo=None) > other.replace(tzinfo=None)
+        return date > other
@@ -0,0 +1,75 @@
+from utils.aho_corasick import AhoCorasick
+
+
+class TriggerMatcher:
+    """
+    Compiled trigger lists: trigger words are matched against whole
+    whitespace separated tokens and trigger phrases anywhere in the text, both
+    case insensitive, in a single pass over the text.
+
+    Phrases are compiled into an Aho-Corasick automaton, so the cost of a
+    match doesn't grow with the number of triggers.
+    """
+
+    def __init__(
+        self,
+        trigger_words: list[str],
+        trigger_phrases: list[str],
+    ) -> None:
+        self.words: dict[str, str] = {
+            word.lower(): word for word in trigger_words if word
+        }
+        self.phrases: list[str] = [phrase for phrase in trigger_phrases if phrase]
+        self._automaton = AhoCorasick([phrase.lower() for phrase in self.phrases])
+
+    def find(self, text: str, first_only: bool = False) -> set[str]:
+        """Find the triggers contained in a text.
+
+        Args:
+            text: The text to search, usually an article title
+            first_only: Stop as soon as one trigger is found
+
+        Returns:
+            set[str]: The matched trigger words and phrases, as written in the lists
+        """
+        matches: set[str] = set()
+        automaton = self._automaton
+        words = self.words
+
+        lowered = text.lower()
+        state = 0
+        token_start = 0
+        for position, char in enumerate(lowered):
+            if char.isspace():
+                if token_start < position:
+                    word = words.get(lowered[token_start:position])
+                    if word is not None:
+                        matches.add(word)
+                        if first_only:
+                            return matches
+                token_start = position + 1
+
+            state = automaton.next_state(state, char)
+            phrase_indexes = automaton.matches(state)
+            if phrase_indexes:
+                matches.update(self.phrases[index] for index in phrase_indexes)
+                if first_only:
+                    return matches
+
+        if token_start < len(lowered):
+            word = words.get(lowered[token_start:])
+            if word is not None:
+                matches.add(word)
+
+        return matches
+
+    def contains(self, text: str) -> bool:
+        """Check if a text contains at least one trigger.
+
+        Args:
+            text: The text to search
+
+        Returns:
+            bool: True if a trigger word or phrase was found
+        """
+        return bool(self.find(text, first_only=True))
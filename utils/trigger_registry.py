@@ -0,0 +1,132 @@
+import glob
+import os
+import threading
+
+from constants import TRIGGER_FILES_PATTERN
+from settings import TRIGGER_RELOAD_INTERVAL_S
+from utils.logger import logger
+from utils.trigger_matcher import TriggerMatcher
+from utils.trigger_utils import TriggerFile
+
+
+class TriggerSet:
+    """
+    Immutable snapshot of the compiled trigger lists, one matcher per topic
+    (the directory name of the trigger files, e.g. "ai" or "africa")
+    """
+
+    def __init__(self, matchers: dict[str, TriggerMatcher]) -> None:
+        self._matchers = matchers
+
+    def get(self, topic: str) -> TriggerMatcher:
+        matcher = self._matchers.get(topic)
+        if matcher is None:
+            return TriggerMatcher([], [])
+        return matcher
+
+
+class TriggerRegistry:
+    """
+    Keep the compiled trigger lists in sync with the trigger files.
+
+    A background thread polls the files modification times and compiles a
+    new TriggerSet when one of them changes. The new set replaces the old
+    one with a single reference assignment, so readers always get either the
+    previous or the new set, never a half built one.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._instance_lock:
+            if not cls._instance:
+                cls._instance = super(TriggerRegistry, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(
+        self,
+        pattern: str = TRIGGER_FILES_PATTERN,
+        interval_s: float = TRIGGER_RELOAD_INTERVAL_S,
+    ) -> None:
+        if self._initialized:
+            return
+
+        self.pattern = pattern
+        self.interval_s = interval_s
+        self._signature: dict[str, tuple[int, int]] = {}
+        self._current = TriggerSet({})
+        self._reload_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._initialized = True
+
+    def current(self) -> TriggerSet:
+        """Get the latest compiled trigger lists.
+
+        Returns:
+            TriggerSet: Keep using the same set for a whole batch of titles
+        """
+        return self._current
+
+    def start(self) -> None:
+        """Start watching the trigger files in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._watch,
+            name="trigger-registry",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def _watch(self) -> None:
+        while not self._stop_event.wait(self.interval_s):
+            try:
+                self.reload()
+            except Exception as e:
+                logger.error(f"Error reloading trigger files: {str(e)}")
+
+    def reload(self) -> bool:
+        """Compile the trigger files again if any of them changed.
+
+        Returns:
+            bool: True if a new TriggerSet was swapped in
+        """
+        with self._reload_lock:
+            signature = self._get_signature()
+            if signature == self._signature:
+                return False
+
+            topics: dict[str, dict[str, list[str]]] = {}
+            for file_path in signature:
+                topic = os.path.basename(os.path.dirname(file_path))
+                kind = os.path.basename(file_path)[len("trigger_") : -len(".txt")]
+                items = TriggerFile(file_path).get()
+                topics.setdefault(topic, {})[kind] = items
+                logger.info(f"Loaded {len(items)} {topic} trigger {kind}")
+
+            matchers = {
+                topic: TriggerMatcher(
+                    lists.get("words", []),
+                    lists.get("phrases", []),
+                )
+                for topic, lists in topics.items()
+            }
+
+            self._current = TriggerSet(matchers)
+            self._signature = signature
+            logger.info(f"Compiled trigger lists for: {', '.join(sorted(matchers))}")
+            return True
+
+    def _get_signature(self) -> dict[str, tuple[int, int]]:
+        signature: dict[str, tuple[int, int]] = {}
+        for file_path in sorted(glob.glob(self.pattern)):
+            stat = os.stat(file_path)
+            signature[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return signature
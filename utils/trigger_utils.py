@@ -1,6 +1,9 @@
 import os
+import shutil
+import tempfile
 
 from utils.logger import logger
+from utils.trigger_matcher import TriggerMatcher
 
 
 class TriggerFile:
@@ -20,11 +23,12 @@ class TriggerFile:
         Args:
             item: The trigger item to add
         """
-        with open(self.file_path, "r+", encoding="utf-8") as f:
-            existing_items = {line.strip() for line in f}
-            striped_item = item.strip()
-            if striped_item not in existing_items:
-                f.write(f"{striped_item}\n")
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
+
+        striped_item = item.strip()
+        if striped_item not in lines:
+            self._write_lines(lines + [striped_item])
 
     def remove(self, item: str) -> None:
         """Remove a trigger item from the file.
@@ -35,8 +39,7 @@ class TriggerFile:
         with open(self.file_path, "r", encoding="utf-8") as f:
             lines = [line.strip() for line in f if line.strip() != item.strip()]
 
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines) + "\n")
+        self._write_lines(lines)
 
     def update(self, old_item: str, new_item: str) -> None:
         """Update a trigger item in the file.
@@ -52,8 +55,26 @@ class TriggerFile:
                 if line.strip()  # will continue if the line is empty
             ]
 
-        with open(self.file_path, "w", encoding="utf-8") as f:
+        self._write_lines(lines)
+
+    def _write_lines(self, lines: list[str]) -> None:
+        """Replace the file content atomically, so the trigger registry never
+        reads a half written file.
+
+        Args:
+            lines: The trigger items to write
+        """
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=directory,
+            delete=False,
+        ) as f:
             f.write("\n".join(lines) + "\n")
+            tmp_file_path = f.name
+        shutil.copymode(self.file_path, tmp_file_path)
+        os.replace(tmp_file_path, self.file_path)
 
     def get(self) -> list[str]:
         """Get all trigger items from the file.
@@ -85,13 +106,9 @@ class TriggerUtils:
         trigger_words: list[str],
         trigger_phrases: list[str],
     ) -> bool:
-        # Check for trigger words
-        words = text.split()
-        for word in trigger_words:
-            if word.lower() in [w.lower() for w in words]:
-                return True
-        # Check for trigger phrases
-        for phrase in trigger_phrases:
-            if phrase.lower() in text.lower():
-                return True
-        return False
+        """Check a text against trigger lists compiled on the fly.
+
+        Prefer keeping a TriggerMatcher around when checking many texts
+        against the same lists.
+        """
+        return TriggerMatcher(trigger_words, trigger_phrases).contains(text)